@@ -0,0 +1,92 @@
+"""
+Нагрузочный тест AsyncProcessor: имитация асинхронного сервиса.
+
+Один большой PDF и поток мелких запросов нормализации приходят
+одновременно; замеряются задержки мелких запросов и максимальная
+задержка event loop (насколько он был заблокирован).
+
+Запуск:
+    python -m benchmarks.bench_async --pages 300 --requests 200 --workers 2
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import make_ocr_text, write_sample_pdf
+from service import AsyncProcessor, ServiceOverloaded
+
+
+async def run(args, pdf_path: Path) -> None:
+    texts = [make_ocr_text(args.text_size, seed) for seed in range(args.requests)]
+    latencies = []
+    lag = 0.0
+
+    async def ticker():
+        nonlocal lag
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lag = max(lag, time.perf_counter() - start - 0.005)
+
+    async with AsyncProcessor(
+        workers=args.workers,
+        max_pending=args.max_pending,
+        pages_per_task=args.pages_per_task,
+    ) as processor:
+
+        async def small(text: str) -> None:
+            start = time.perf_counter()
+            try:
+                await processor.normalize_async(text)
+            except ServiceOverloaded:
+                return
+            latencies.append(time.perf_counter() - start)
+
+        tick = asyncio.create_task(ticker())
+        start = time.perf_counter()
+        big = asyncio.create_task(processor.extract_async(pdf_path))
+        for text in texts:
+            asyncio.create_task(small(text))
+            await asyncio.sleep(args.interval)
+        pdf_text = await big
+        big_time = time.perf_counter() - start
+        while processor.pending or processor.running:
+            await asyncio.sleep(0.01)
+        tick.cancel()
+        info = processor.info()
+
+    latencies.sort()
+    print(f"big PDF: {args.pages} pages, {len(pdf_text)} chars in {big_time:.2f}s")
+    if latencies:
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        print(
+            f"small requests: {len(latencies)} done, "
+            f"median={statistics.median(latencies) * 1000:.1f}ms "
+            f"p95={p95 * 1000:.1f}ms max={latencies[-1] * 1000:.1f}ms"
+        )
+    print(f"max event loop lag: {lag * 1000:.1f}ms")
+    print(f"processor: {info}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--text-size", type=int, default=4_000)
+    parser.add_argument("--interval", type=float, default=0.005)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--pages-per-task", type=int, default=8)
+    parser.add_argument("--max-pending", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = write_sample_pdf(Path(tmp) / "big.pdf", args.pages)
+        asyncio.run(run(args, pdf_path))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Бенчмарк памяти дерева Document/Section/Content: текущие классы
+(__slots__) против прежних (атрибуты в __dict__ экземпляра).
+
+Замеряется прирост памяти (tracemalloc) при построении дерева из уже
+готовых строк, то есть накладные расходы структуры сверх самого текста.
+
+Запуск:
+    python -m benchmarks.bench_document_memory --lines 1000000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Callable, List
+
+from benchmarks.corpus import make_ocr_text
+from pdf.classes.Content import Content
+from pdf.classes.Document import Document
+from pdf.classes.Section import Section
+
+
+class LegacyContent:
+    def __init__(self, raw_text: str):
+        self.__text = raw_text
+
+
+class LegacySection:
+    def __init__(self, title: str, level: int = 1):
+        self.__level = level
+        self.__title = title
+        self.__contents: list = []
+
+    def add_content(self, new_block: LegacyContent):
+        self.__contents.append(new_block)
+
+
+def make_lines(count: int) -> List[str]:
+    lines: List[str] = []
+    seed = 0
+    while len(lines) < count:
+        lines.extend(
+            line for line in make_ocr_text(1_000_000, seed).split("\n") if line
+        )
+        seed += 1
+    return lines[:count]
+
+
+def build(lines: List[str], section_cls, content_cls, lines_per_section: int):
+    document = Document()
+    section = None
+    for i, line in enumerate(lines):
+        if i % lines_per_section == 0:
+            section = section_cls(title=line, level=1)
+            document.add_section(section)
+        else:
+            section.add_content(content_cls(line))
+    return document
+
+
+def measure(func: Callable[[], object]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--lines-per-section", type=int, default=40)
+    args = parser.parse_args()
+
+    lines = make_lines(args.lines)
+    text_size = sum(len(line.encode()) for line in lines)
+    print(f"lines={len(lines)}  text={text_size / 1_000_000:.1f} MB (utf-8)")
+
+    for name, section_cls, content_cls in (
+        ("legacy", LegacySection, LegacyContent),
+        ("slots", Section, Content),
+    ):
+        size = measure(
+            lambda: build(lines, section_cls, content_cls, args.lines_per_section)
+        )
+        print(
+            f"{name:<8} tree={size / 1_000_000:8.1f} MB  "
+            f"{size / len(lines):6.1f} B/line  x{size / text_size:.2f} of text"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Бенчмарк извлечения текста из PDF: страниц/сек в зависимости от числа процессов.
+
+Запуск:
+    python -m benchmarks.bench_extract --pages 200 --workers 1 2 4 8
+
+С --cache дополнительно замеряются холодный и прогретый прогоны
+через ExtractionCache.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import write_sample_pdf
+from pdf.cache import ExtractionCache
+from pdf.extract_text import extract_only_text_by_pages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--lines", type=int, default=40)
+    parser.add_argument("--pdf", type=Path, help="готовый PDF вместо синтетического")
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1]
+    )
+    parser.add_argument(
+        "--cache", action="store_true", help="замерить прогоны через ExtractionCache"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = args.pdf or write_sample_pdf(
+            Path(tmp) / "sample.pdf", args.pages, args.lines
+        )
+
+        baseline = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            pages = extract_only_text_by_pages(pdf_path, workers=workers)
+            elapsed = time.perf_counter() - start
+
+            if baseline is None:
+                baseline = pages
+            assert pages == baseline, "результат отличается от последовательного"
+
+            print(
+                f"workers={workers:<3} pages={len(pages):<6} "
+                f"time={elapsed:8.3f}s  {len(pages) / elapsed:10.1f} pages/s"
+            )
+
+        if args.cache:
+            with ExtractionCache(Path(tmp) / "cache.db") as cache:
+                for run in ("cold", "warm"):
+                    start = time.perf_counter()
+                    pages = extract_only_text_by_pages(pdf_path, cache=cache)
+                    elapsed = time.perf_counter() - start
+                    assert pages == baseline, "результат из кэша отличается"
+                    print(
+                        f"cache={run:<5} pages={len(pages):<6} "
+                        f"time={elapsed:8.3f}s  {len(pages) / elapsed:10.1f} pages/s"
+                    )
+                print(f"cache: {cache.info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Бенчмарк повторной нормализации документа с орфографией, в котором
+изменена часть абзацев: полный RawTextNormalizer.normalize против
+IncrementalNormalizer с хранилищем абзацев (SQLite) от первой загрузки.
+
+Оба прогона - в новом нормализаторе (пустой кэш исправлений), как при
+повторной загрузке документа другим процессом.
+
+Запуск:
+    python -m benchmarks.bench_incremental --paragraphs 300 --edited 0.05
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from benchmarks.corpus import make_paragraphs, misspell
+from text_processing.incremental import (
+    IncrementalNormalizer,
+    IncrementalStats,
+    SqliteParagraphStore,
+)
+from text_processing.normalizer import RawTextNormalizer
+
+
+def edit(paragraphs: List[str], share: float, seed: int = 0) -> List[str]:
+    """Новая опечатка в случайном слове share абзацев"""
+    rng = random.Random(seed)
+    edited = list(paragraphs)
+    for i in rng.sample(range(len(edited)), round(len(edited) * share)):
+        words = edited[i].split(" ")
+        j = rng.randrange(1, len(words))
+        words[j] = misspell(words[j], rng)
+        edited[i] = " ".join(words)
+    return edited
+
+
+def spellcheck_normalizer() -> RawTextNormalizer:
+    normalizer = RawTextNormalizer(enable_spellcheck=True)
+    normalizer.normalize("загрузка словарей load")
+    return normalizer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paragraphs", type=int, default=300)
+    parser.add_argument("--words", type=int, default=60, help="слов в абзаце")
+    parser.add_argument("--edited", type=float, default=0.05, help="доля абзацев")
+    args = parser.parse_args()
+
+    paragraphs = make_paragraphs(args.paragraphs, args.words)
+    original = "\n\n".join(paragraphs)
+    edited = "\n\n".join(edit(paragraphs, args.edited))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "paragraphs.db"
+        with SqliteParagraphStore(path) as store:
+            IncrementalNormalizer(spellcheck_normalizer(), store).normalize(original)
+
+        normalizer = spellcheck_normalizer()
+        start = time.perf_counter()
+        expected = normalizer.normalize(edited)
+        full = time.perf_counter() - start
+
+        stats = IncrementalStats()
+        with SqliteParagraphStore(path) as store:
+            incremental = IncrementalNormalizer(spellcheck_normalizer(), store)
+            start = time.perf_counter()
+            result = incremental.normalize(edited, stats)
+            elapsed = time.perf_counter() - start
+        assert result == expected, "результат отличается от полной нормализации"
+
+    print(
+        f"document: {len(edited) / 1000:.0f} KB, "
+        f"{args.paragraphs} sections, {args.edited:.0%} edited"
+    )
+    print(f"full normalize   {full:8.3f}s")
+    print(f"incremental      {elapsed:8.3f}s  (x{full / elapsed:.1f})  {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Бенчмарк определения языка токенов в SpellCheckerService: прежний
+вариант (re.search с некомпилированными шаблонами) против
+ScriptClassifier, и доля маршрутизации во времени correct() на тексте
+из словарных слов (без дорогого поиска исправлений).
+
+Запуск:
+    python -m benchmarks.bench_language --words 200000
+"""
+
+import argparse
+import re
+import time
+
+from benchmarks.corpus import LANGUAGES
+from text_processing.constants import ENGLISH_LETTERS, RUSSIAN_LETTERS
+from text_processing.spelling import ScriptClassifier, SpellCheckerService
+
+
+def legacy_detect_language(word: str) -> str:
+    if re.search(RUSSIAN_LETTERS, word):
+        return "ru"
+    if re.search(ENGLISH_LETTERS, word):
+        return "en"
+    return "unknown"
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=200_000)
+    args = parser.parse_args()
+
+    vocabulary = LANGUAGES["mixed"][0] + ["2024", "10"]
+    tokens = [vocabulary[i % len(vocabulary)] for i in range(args.words)]
+
+    legacy = timed(lambda: [legacy_detect_language(token) for token in tokens])
+    uncached = timed(lambda: [ScriptClassifier.detect(token) for token in tokens])
+    classifier = ScriptClassifier()
+    cached = timed(lambda: classifier.classify_all(tokens))
+    assert classifier.classify_all(tokens) == [
+        legacy_detect_language(token) for token in tokens
+    ]
+
+    print(f"tokens={len(tokens)}")
+    for name, elapsed in (
+        ("legacy re.search", legacy),
+        ("char table", uncached),
+        ("char table + cache", cached),
+    ):
+        print(
+            f"{name:<20} {elapsed:8.4f}s  {len(tokens) / elapsed / 1e6:6.2f} M tokens/s"
+        )
+
+    service = SpellCheckerService()
+    text = " ".join(tokens)
+    service.correct(text)  # прогрев кэша исправлений
+    total = timed(lambda: service.correct(text))
+    # разметка слов текста, как в correct(): классификатор с теми же токенами
+    routing_classifier = ScriptClassifier()
+    routing_classifier.classify_all(tokens)
+    routing = timed(lambda: routing_classifier.classify_all(tokens))
+    print(
+        f"correct() {total:.4f}s, routing {routing:.4f}s "
+        f"({routing / total * 100:.1f}% of correct)"
+    )
+
+
+if __name__ == "__main__":
+    main()
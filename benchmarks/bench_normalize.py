@@ -0,0 +1,47 @@
+"""
+Бенчмарк RawTextNormalizer: обычный и совмещенный (fused) режимы, MB/s.
+
+Запуск:
+    python -m benchmarks.bench_normalize --size 4000000 --repeat 3
+"""
+
+import argparse
+import time
+
+from benchmarks.corpus import make_ocr_text
+from text_processing.normalizer import RawTextNormalizer
+
+
+def measure(normalizer: RawTextNormalizer, text: str, repeat: int) -> tuple[float, str]:
+    best = float("inf")
+    result = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = normalizer.normalize(text)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=4_000_000, help="байт текста")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    text = make_ocr_text(args.size, args.seed)
+    megabytes = len(text.encode("utf-8")) / 1_000_000
+
+    results = {}
+    for name, normalizer in (
+        ("sequential", RawTextNormalizer()),
+        ("fused", RawTextNormalizer(fused=True)),
+    ):
+        elapsed, results[name] = measure(normalizer, text, args.repeat)
+        print(f"{name:<11} {elapsed:8.3f}s  {megabytes / elapsed:8.2f} MB/s")
+
+    assert results["fused"] == results["sequential"], "fused отличается от обычного"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Бенчмарк RawTextNormalizer.normalize_many: docs/sec в зависимости от числа процессов.
+
+Запуск:
+    python -m benchmarks.bench_normalize_many --docs 2000 --workers 1 2 4
+"""
+
+import argparse
+import os
+
+from benchmarks.corpus import make_ocr_text
+from text_processing.normalizer import BatchStats, RawTextNormalizer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--doc-size", type=int, default=4000, help="байт на документ")
+    parser.add_argument("--chunksize", type=int, default=16)
+    parser.add_argument("--spellcheck", action="store_true")
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1]
+    )
+    args = parser.parse_args()
+
+    docs = [make_ocr_text(args.doc_size, seed) for seed in range(args.docs)]
+    normalizer = RawTextNormalizer(enable_spellcheck=args.spellcheck)
+
+    baseline = None
+    for workers in args.workers:
+        stats = BatchStats()
+        results = list(
+            normalizer.normalize_many(
+                docs, workers=workers, chunksize=args.chunksize, stats=stats
+            )
+        )
+        if baseline is None:
+            baseline = results
+        assert results == baseline, "результат отличается от последовательного"
+        print(f"workers={workers:<3} {stats}")
+
+
+if __name__ == "__main__":
+    main()
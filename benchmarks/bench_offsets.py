@@ -0,0 +1,62 @@
+"""
+Бенчмарк карты смещений: RawTextNormalizer.normalize против
+normalize_with_offsets (обычный и слитый пайплайн) и, для сравнения,
+восстановление соответствия позиций через difflib на одной странице.
+
+Запуск:
+    python -m benchmarks.bench_offsets --size 1000000 --page-size 20000
+"""
+
+import argparse
+import difflib
+import time
+from functools import partial
+from typing import Callable
+
+from benchmarks.corpus import make_ocr_text
+from text_processing.normalizer import RawTextNormalizer
+
+
+def best_of(func: Callable[[], object], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    text = make_ocr_text(args.size)
+    print(f"document: {len(text) / 1000:.0f} KB")
+    for fused in (False, True):
+        normalizer = RawTextNormalizer(fused=fused)
+        plain = best_of(partial(normalizer.normalize, text), args.repeat)
+        mapped = best_of(partial(normalizer.normalize_with_offsets, text), args.repeat)
+        _, offsets = normalizer.normalize_with_offsets(text)
+        print(
+            f"fused={fused!s:<5} normalize {plain:7.3f}s  "
+            f"with offsets {mapped:7.3f}s  (x{mapped / plain:.1f}, "
+            f"map {offsets.positions.itemsize * len(offsets.positions) / 2**20:.1f} MB)"
+        )
+
+    page = make_ocr_text(args.page_size)
+    normalizer = RawTextNormalizer()
+    result = normalizer.normalize(page)
+    matcher = difflib.SequenceMatcher(None, page, result, autojunk=False)
+    diff = best_of(matcher.get_matching_blocks, 1)
+    mapped = best_of(lambda: normalizer.normalize_with_offsets(page), args.repeat)
+    print(
+        f"page {len(page) / 1000:.0f} KB: difflib {diff:7.3f}s  "
+        f"offsets {mapped:7.3f}s  (x{diff / mapped:.0f})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Бенчмарк быстрых проверок этапов на чистом тексте (born-digital PDF):
+сколько вызовов возвращают исходный объект без копирования
+и сколько времени это экономит по сравнению с прежними реализациями.
+
+Чистый корпус - уже нормализованный синтетический текст,
+нарезанный на "страницы".
+
+Запуск:
+    python -m benchmarks.bench_prechecks --size 4000000 --page-size 2000
+"""
+
+import argparse
+import time
+from typing import Callable, List
+
+from benchmarks.corpus import make_ocr_text
+from benchmarks.legacy import (
+    legacy_remove_extra_spaces,
+    legacy_separate_numbers,
+    legacy_separate_roman,
+)
+from text_processing.normalizer import RawTextNormalizer
+from text_processing.numbers import NumberWordSeparator
+from text_processing.roman import RomanNumeralSeparator
+from text_processing.spacing import SpacingNormalizer
+
+
+STAGES = (
+    ("NumberWordSeparator", legacy_separate_numbers, NumberWordSeparator.separate),
+    (
+        "SpacingNormalizer",
+        legacy_remove_extra_spaces,
+        SpacingNormalizer.remove_extra_spaces,
+    ),
+    ("RomanNumeralSeparator", legacy_separate_roman, RomanNumeralSeparator.separate),
+)
+
+
+def make_clean_pages(size: int, page_size: int) -> List[str]:
+    text = RawTextNormalizer().normalize(make_ocr_text(size))
+    return [text[i : i + page_size].strip() for i in range(0, len(text), page_size)]
+
+
+def run(stage: Callable[[str], str], pages: List[str]):
+    copies = 0
+    start = time.perf_counter()
+    for page in pages:
+        if stage(page) is not page:
+            copies += 1
+    return copies, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=4_000_000)
+    parser.add_argument("--page-size", type=int, default=2_000)
+    args = parser.parse_args()
+
+    pages = make_clean_pages(args.size, args.page_size)
+    print(f"pages={len(pages)}  chars={sum(map(len, pages))}")
+    for name, legacy, current in STAGES:
+        legacy_copies, legacy_time = run(legacy, pages)
+        copies, elapsed = run(current, pages)
+        print(
+            f"{name:<22} copies {legacy_copies:>6} -> {copies:<6} "
+            f"saved={legacy_copies - copies:<6} "
+            f"time {legacy_time:7.3f}s -> {elapsed:7.3f}s "
+            f"(x{legacy_time / elapsed:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Бенчмарк RomanNumeralSeparator на патологическом входе: длинные серии
+заглавных букв (OCR-заголовки). Время на мегабайт должно оставаться
+постоянным (линейная сложность); прежняя реализация с ленивым
+префиксом ({LETTERS}+?) квадратична и замеряется только на малых размерах.
+
+Запуск:
+    python -m benchmarks.bench_roman --sizes 125000 250000 500000 1000000
+"""
+
+import argparse
+import time
+
+from benchmarks.legacy import legacy_separate_roman
+from text_processing.roman import RomanNumeralSeparator
+
+
+CASES = {
+    # без римских цифр: прежний шаблон перебирает префиксы каждой позиции
+    "uppercase": "ABEFGHJKNOPQRSTUWYZ",
+    # сплошные римские цифры (некорректное число на всю серию)
+    "roman-run": "MCMXCIV",
+    # много кандидатов в одной серии букв
+    "candidates": "QXIVQMMXQIIIIQ",
+}
+
+
+def make_input(pattern: str, size: int) -> str:
+    return (pattern * (size // len(pattern) + 1))[:size]
+
+
+def timed(func, text: str) -> float:
+    start = time.perf_counter()
+    func(text)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[125_000, 250_000, 500_000, 1_000_000]
+    )
+    parser.add_argument(
+        "--legacy-max", type=int, default=8_000, help="предел размера для прежней"
+    )
+    args = parser.parse_args()
+
+    for name, pattern in CASES.items():
+        for size in args.sizes:
+            text = make_input(pattern, size)
+            elapsed = timed(RomanNumeralSeparator.separate, text)
+            print(
+                f"{name:<11} size={size:<8} time={elapsed:8.4f}s  "
+                f"{elapsed / size * 1e6:6.3f} s/MB"
+            )
+        size = args.legacy_max
+        legacy = timed(legacy_separate_roman, make_input(pattern, size))
+        small = timed(legacy_separate_roman, make_input(pattern, size // 2))
+        print(
+            f"{name:<11} legacy size={size // 2}: {small:.4f}s, "
+            f"size={size}: {legacy:.4f}s (x{legacy / small if small else 0:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
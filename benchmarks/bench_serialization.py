@@ -0,0 +1,82 @@
+"""
+Бенчмарк сохранения разобранного документа: повторный разбор PDF
+против загрузки из бинарного формата (целиком и через mmap) и JSON.
+
+Запуск:
+    python -m benchmarks.bench_serialization --pages 200
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.corpus import write_sample_pdf
+from pdf.classes.LazyDocument import LazyDocument
+from pdf.serialization import (
+    MappedDocument,
+    export_json,
+    read_document,
+    write_document,
+)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--lines", type=int, default=40)
+    parser.add_argument("--pdf", type=Path, help="готовый PDF вместо синтетического")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        pdf_path = args.pdf or write_sample_pdf(
+            tmp / "sample.pdf", args.pages, args.lines
+        )
+
+        def parse():
+            document = LazyDocument(pdf_path)
+            document.get_sections()
+            return document
+
+        document, parse_time = timed(parse)
+        _, write_time = timed(lambda: write_document(document, tmp / "doc.bin"))
+        _, json_write_time = timed(lambda: export_json(document, tmp / "doc.json"))
+
+        loaded, load_time = timed(lambda: read_document(tmp / "doc.bin"))
+        assert repr(loaded) == repr(document)
+        _, json_load_time = timed(
+            lambda: json.loads((tmp / "doc.json").read_text(encoding="utf-8"))
+        )
+
+        def mapped_one_section():
+            with MappedDocument(tmp / "doc.bin") as mapped:
+                return mapped.get_section(len(mapped) // 2)
+
+        _, mmap_time = timed(mapped_one_section)
+
+        print(f"parse PDF          {parse_time:8.4f}s")
+        print(f"write binary       {write_time:8.4f}s")
+        print(f"write JSON         {json_write_time:8.4f}s")
+        print(
+            f"load binary        {load_time:8.4f}s  x{parse_time / load_time:.1f} "
+            "faster than parsing"
+        )
+        print(f"load JSON (dicts)  {json_load_time:8.4f}s")
+        print(f"mmap 1 section     {mmap_time:8.4f}s")
+        print(
+            f"sizes: pdf={pdf_path.stat().st_size} "
+            f"bin={(tmp / 'doc.bin').stat().st_size} "
+            f"json={(tmp / 'doc.json').stat().st_size} bytes"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Бенчмарк памяти словарей орфографии в пуле процессов.
+
+Каждый из --workers процессов (spawn, без общих страниц от fork)
+загружает словари RU и EN, проверяет и исправляет один и тот же список
+слов с опечатками, а затем, пока все воркеры живы, снимает память
+из /proc/self: RSS, PSS (общие страницы делятся между процессами) и
+приватную часть RssAnon. Режимы:
+
+    pyspellchecker  - SpellChecker(language=...), dict слов в каждом процессе
+    index copy      - SymSpellIndex.load(mapped=False), массивы в памяти процесса
+    index mmap      - SymSpellIndex.load(), общий файл через page cache
+
+Только Linux (/proc). Запуск:
+    python -m benchmarks.bench_shared_dictionary --workers 4
+"""
+
+import argparse
+import multiprocessing
+import tempfile
+from typing import Dict, List
+
+from spellchecker import SpellChecker
+
+from benchmarks.corpus import reference_words
+from text_processing.symspell import SymSpellIndex
+
+LANGUAGES = ("ru", "en")
+MODES = ("pyspellchecker", "index copy", "index mmap")
+
+
+def memory_kb() -> Dict[str, int]:
+    values = {}
+    for name in ("/proc/self/status", "/proc/self/smaps_rollup"):
+        with open(name) as source:
+            for line in source:
+                key, _, rest = line.partition(":")
+                if key in ("VmRSS", "RssAnon", "Pss"):
+                    values[key] = int(rest.split()[0])
+    return values
+
+
+def load(mode: str, language: str, directory: str):
+    if mode == "pyspellchecker":
+        return SpellChecker(language=language)
+    path = SymSpellIndex.index_path(language, directory)
+    return SymSpellIndex.load(path, mapped=mode == "index mmap")
+
+
+def worker(mode, directory, words, barrier, results) -> None:
+    before = memory_kb()
+    checkers = [load(mode, language, directory) for language in LANGUAGES]
+    for checker, language in zip(checkers, LANGUAGES):
+        for word in words[language]:
+            if word not in checker:
+                checker.correction(word)
+
+    barrier.wait()  # все воркеры загрузили словари
+    after = memory_kb()
+    results.put(
+        {
+            "rss": after["VmRSS"],
+            "pss": after["Pss"],
+            "private": after["RssAnon"],
+            "dictionaries": after["Pss"] - before["Pss"],
+        }
+    )
+    barrier.wait()  # память сняли все, можно выходить
+
+
+def run(mode: str, workers: int, directory: str, words) -> List[Dict[str, int]]:
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker, args=(mode, directory, words, barrier, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    stats = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--words", type=int, default=20, help="исправлений на язык")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        words = {}
+        for language in LANGUAGES:
+            SymSpellIndex.load_or_build(language, directory).close()
+            checker = SpellChecker(language=language)
+            words[language] = reference_words(checker, args.words)
+
+        print(f"workers={args.workers}, per worker (MB, median of workers)")
+        for mode in MODES:
+            stats = run(mode, args.workers, directory, words)
+            row = {
+                key: sorted(s[key] for s in stats)[len(stats) // 2] / 1024
+                for key in stats[0]
+            }
+            print(
+                f"{mode:<15} RSS={row['rss']:6.1f} PSS={row['pss']:6.1f} "
+                f"private={row['private']:6.1f}  "
+                f"dictionaries (PSS)={row['dictionaries']:6.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
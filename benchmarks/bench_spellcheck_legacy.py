@@ -0,0 +1,44 @@
+"""
+Бенчмарк RawTextHandler.spell_check_text на растущем объеме текста.
+
+Время на слово должно оставаться примерно постоянным (линейный рост),
+а не расти вместе с размером текста.
+
+Запуск:
+    python -m benchmarks.bench_spellcheck_legacy --words 2000 4000 8000 16000
+"""
+
+import argparse
+import time
+
+from benchmarks.corpus import make_misspelled_text
+from pdf.text_transformation import RawTextHandler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--words", type=int, nargs="+", default=[2000, 4000, 8000, 16000]
+    )
+    parser.add_argument("--typo-rate", type=float, default=0.02)
+    args = parser.parse_args()
+
+    # Загрузка словарей - разовая стоимость, в замеры не входит
+    start = time.perf_counter()
+    RawTextHandler.get_checker("en")
+    RawTextHandler.get_checker("ru")
+    print(f"dictionaries loaded in {time.perf_counter() - start:.3f}s")
+
+    for words_count in args.words:
+        text = make_misspelled_text(words_count, typo_rate=args.typo_rate)
+        start = time.perf_counter()
+        RawTextHandler.spell_check_text(text)
+        elapsed = time.perf_counter() - start
+        print(
+            f"words={words_count:<7} time={elapsed:8.3f}s  "
+            f"{elapsed / words_count * 1e6:8.1f} us/word"
+        )
+
+
+if __name__ == "__main__":
+    main()
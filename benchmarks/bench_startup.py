@@ -0,0 +1,90 @@
+"""
+Бенчмарк холодного старта, как у CLI и serverless-вызова: новый процесс
+интерпретатора, импорт text_processing.normalizer, создание
+RawTextNormalizer и первый normalize. Индексы SymSpellIndex строятся
+заранее (во временном каталоге) - в замер входит только их загрузка.
+
+Время - медиана по --repeat запускам; если какой-то сценарий не уложился
+в бюджет, код возврата 1.
+
+Запуск:
+    python -m benchmarks.bench_startup --repeat 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from text_processing.symspell import SymSpellIndex
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+from text_processing.normalizer import RawTextNormalizer
+imported = time.perf_counter()
+RawTextNormalizer(enable_spellcheck={spellcheck}).normalize({text!r})
+print(imported - start, time.perf_counter() - imported)
+"""
+
+# сценарий -> (проверка орфографии, текст, бюджет по умолчанию в секундах)
+SCENARIOS: Dict[str, Tuple[bool, str, float]] = {
+    "plain": (False, "Глава1 Общие положения ,договор II", 0.12),
+    "spellcheck ru": (True, "Догвор вступаит в силу", 0.2),
+    "spellcheck mixed": (True, "Догвор вступаит в силу. The contrct", 0.4),
+}
+
+
+def run_once(spellcheck: bool, text: str, env: Dict[str, str]) -> List[float]:
+    """Время процесса целиком, импорта и первого normalize"""
+    script = SCRIPT.format(spellcheck=spellcheck, text=text)
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = time.perf_counter() - start
+    imported, normalized = map(float, result.stdout.split())
+    return [total, imported, normalized]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--budget-scale", type=float, default=1.0, help="множитель бюджетов"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for language in ("ru", "en"):
+            SymSpellIndex.load_or_build(language, directory)
+        env = dict(os.environ, SWISS_KNIFE_CACHE=directory)
+
+        over_budget = False
+        for name, (spellcheck, text, budget) in SCENARIOS.items():
+            runs = [run_once(spellcheck, text, env) for _ in range(args.repeat)]
+            total, imported, normalized = (statistics.median(x) for x in zip(*runs))
+            budget *= args.budget_scale
+            status = "ok" if total <= budget else "OVER BUDGET"
+            over_budget |= total > budget
+            print(
+                f"{name:<17} total={total:.3f}s import={imported:.3f}s "
+                f"first normalize={normalized:.3f}s  budget={budget:.2f}s {status}"
+            )
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
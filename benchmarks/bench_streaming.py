@@ -0,0 +1,57 @@
+"""
+Бенчмарк StreamingNormalizer: пиковая память (tracemalloc) и MB/s
+на файлах разного размера. Пик памяти не должен расти с размером файла.
+
+Запуск:
+    python -m benchmarks.bench_streaming --sizes 1000000 4000000 16000000
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.corpus import make_ocr_text
+from text_processing.streaming import StreamingNormalizer
+
+
+def write_corpus(path: Path, size: int, block: int = 1_000_000) -> None:
+    """Пишет корпус блоками, не держа его в памяти целиком"""
+    with open(path, "w", encoding="utf-8") as f:
+        for seed in range(0, max(1, size // block)):
+            f.write(make_ocr_text(min(size, block), seed))
+            f.write("\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000_000, 4_000_000, 16_000_000]
+    )
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    normalizer = StreamingNormalizer(chunk_size=args.chunk_size)
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            src = Path(tmp) / "in.txt"
+            dst = Path(tmp) / "out.txt"
+            write_corpus(src, size)
+            megabytes = src.stat().st_size / 1_000_000
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            normalizer.normalize_file(src, dst)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(
+                f"size={megabytes:8.1f} MB  time={elapsed:7.2f}s  "
+                f"{megabytes / elapsed:6.2f} MB/s  peak={peak / 1_000_000:6.2f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Бенчмарк исправления опечаток: SpellChecker.correction (перебор правок
+на расстоянии 1 и 2) против SymSpellIndex. Печатает время построения
+и загрузки индекса, исправления в секунду и совпадение результатов
+на одном и том же списке слов с опечатками.
+
+Запуск:
+    python -m benchmarks.bench_symspell --words 2000 --legacy-words 100
+"""
+
+import argparse
+import tempfile
+import time
+from typing import Callable, List, Optional
+
+from spellchecker import SpellChecker
+
+from benchmarks.corpus import reference_words
+from text_processing.symspell import SymSpellIndex
+
+
+def rate(correction: Callable[[str], Optional[str]], words: List[str]):
+    start = time.perf_counter()
+    results = [correction(word) for word in words]
+    return results, len(words) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=2000)
+    parser.add_argument(
+        "--legacy-words", type=int, default=100, help="слов для SpellChecker"
+    )
+    parser.add_argument("--languages", nargs="+", default=["ru", "en"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for language in args.languages:
+            checker = SpellChecker(language=language)
+            words = reference_words(checker, max(args.words, args.legacy_words))
+
+            start = time.perf_counter()
+            SymSpellIndex.load_or_build(language, directory)
+            built = time.perf_counter() - start
+            start = time.perf_counter()
+            index = SymSpellIndex.load_or_build(language, directory)
+            loaded = time.perf_counter() - start
+            size = SymSpellIndex.index_path(language, directory).stat().st_size
+
+            legacy, legacy_rate = rate(checker.correction, words[: args.legacy_words])
+            indexed, index_rate = rate(index.correction, words[: args.words])
+            same = sum(
+                a == b or (a and b and checker[a] == checker[b])
+                for a, b in zip(legacy, indexed)
+            )
+
+            print(
+                f"{language}: words={len(index)} index={size / 1e6:.1f}MB "
+                f"build={built:.2f}s load={loaded:.3f}s"
+            )
+            print(f"  SpellChecker  {legacy_rate:10.1f} corrections/s")
+            print(
+                f"  SymSpellIndex {index_rate:10.1f} corrections/s "
+                f"(x{index_rate / legacy_rate:.0f})"
+            )
+            print(f"  same correction (up to frequency ties): {same}/{len(legacy)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Сравнение двух JSON-отчетов benchmarks.suite.
+
+Печатает изменение времени по каждой паре (корпус, этап) и завершается
+с кодом 1, если какой-либо этап замедлился больше порога.
+
+Запуск:
+    python -m benchmarks.compare base.json new.json --threshold 0.10
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+def load(path: Path) -> Dict[Tuple[str, str], dict]:
+    report = json.loads(path.read_text(encoding="utf-8"))
+    return {(row["corpus"], row["stage"]): row for row in report["results"]}
+
+
+def compare(
+    base: Dict[Tuple[str, str], dict],
+    new: Dict[Tuple[str, str], dict],
+    threshold: float,
+) -> List[Tuple[str, str, float, float, float, bool]]:
+    """Строки (корпус, этап, было, стало, изменение, регрессия) для общих ключей"""
+    rows = []
+    for key in sorted(base.keys() & new.keys()):
+        before = base[key]["seconds_min"]
+        after = new[key]["seconds_min"]
+        change = (after - before) / before if before else 0.0
+        rows.append((*key, before, after, change, change > threshold))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("base", type=Path)
+    parser.add_argument("new", type=Path)
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="допустимое замедление (доля)"
+    )
+    args = parser.parse_args()
+
+    base, new = load(args.base), load(args.new)
+    rows = compare(base, new, args.threshold)
+    for corpus, stage, before, after, change, regression in rows:
+        mark = "REGRESSION" if regression else ""
+        print(
+            f"{corpus:<12} {stage:<28} {before:10.4f}s -> {after:10.4f}s "
+            f"{change:+8.1%} {mark}"
+        )
+    for key in sorted(base.keys() ^ new.keys()):
+        print(f"{key[0]:<12} {key[1]:<28} only in {'base' if key in base else 'new'}")
+
+    if any(row[-1] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
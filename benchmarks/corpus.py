@@ -0,0 +1,213 @@
+"""
+Детерминированные синтетические данные для бенчмарков и тестов.
+"""
+
+import random
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, List, Sequence, Union
+
+from PyPDF2 import PdfWriter, PageObject
+from PyPDF2.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+if TYPE_CHECKING:
+    from spellchecker import SpellChecker
+
+
+EN_WORDS = (
+    "the contract shall be signed by both parties and remain valid until "
+    "termination of agreement under section clause payment delivery goods "
+    "services supplier customer obligations liability notice period force "
+    "majeure confidential information amendment annex schedule invoice"
+).split()
+
+RU_WORDS = (
+    "договор вступает в силу с момента подписания сторонами и действует до "
+    "полного исполнения обязательств поставщик покупатель оплата поставка "
+    "товара услуги раздел пункт приложение уведомление срок ответственность "
+    "конфиденциальная информация изменение счет акт"
+).split()
+
+# Словари корпусов: слова строк, слова заголовков, окончания заголовков
+LANGUAGES = {
+    "ru": (RU_WORDS, ("Раздел", "Глава", "ГЛАВА"), ("Общие", "положения")),
+    "en": (EN_WORDS, ("Chapter", "Section", "PART"), ("Intro", "Terms")),
+}
+LANGUAGES["mixed"] = tuple(a + b for a, b in zip(LANGUAGES["en"], LANGUAGES["ru"]))
+
+ROMAN_SAMPLES = ("II", "IV", "VII", "IX", "XII", "XIV", "XL", "MMXIV", "IIII", "VV")
+
+
+def ocr_lines(
+    rng: random.Random, words: Sequence[str], min_words: int = 6
+) -> Iterator[str]:
+    """Бесконечный поток строк в стиле OCR: слипшиеся цифры, пробелы перед
+    знаками препинания, переносы слов по дефису на следующую строку"""
+    carry = ""
+    while True:
+        parts = [carry] if carry else []
+        carry = ""
+        for _ in range(rng.randint(min_words, min_words * 2)):
+            word = rng.choice(words)
+            roll = rng.random()
+            if roll < 0.05:
+                word = f"{word}{rng.randint(1, 999)}"
+            elif roll < 0.08:
+                word = f"{word} ,"
+            elif roll < 0.10:
+                word = f"{word}  ."
+            parts.append(word)
+
+        last = parts[-1]
+        if rng.random() < 0.15 and len(last) >= 4 and last.isalpha():
+            cut = rng.randint(2, len(last) - 2)
+            parts[-1] = last[:cut] + "-"
+            carry = last[cut:]
+        yield " ".join(parts)
+
+
+def ocr_heading(
+    rng: random.Random, titles: Sequence[str], suffixes: Sequence[str]
+) -> str:
+    """Заголовок с римским числом, иногда "слипшимся" со словами"""
+    roman = rng.choice(ROMAN_SAMPLES)
+    word = rng.choice(titles)
+    if rng.random() < 0.5:
+        return f"{word}{roman}{rng.choice(suffixes)}"
+    return f"{word} {roman}"
+
+
+def make_ocr_text(size: int, seed: int = 0, lang: str = "mixed") -> str:
+    """Детерминированный текст в стиле OCR заданного размера
+
+    Args:
+        size (int): примерный размер в байтах (UTF-8)
+        seed (int): зерно генератора
+        lang (str): "ru", "en" или "mixed" (см. LANGUAGES)
+
+    Returns:
+        str: текст не короче size байт
+    """
+    rng = random.Random(seed)
+    words, titles, suffixes = LANGUAGES[lang]
+    body = ocr_lines(rng, words)
+    lines: List[str] = []
+    total = 0
+    while total < size:
+        roll = rng.random()
+        if lines and lines[-1].endswith("-"):
+            # окончание перенесенного слова
+            line = next(body)
+        elif roll < 0.03:
+            line = ocr_heading(rng, titles, suffixes)
+        elif roll < 0.06:
+            line = ""
+        else:
+            line = next(body)
+        lines.append(line)
+        total += len(line.encode("utf-8")) + 1
+    return "\n".join(lines)
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    """Одна случайная опечатка: пропуск, замена или перестановка символов"""
+    if len(word) < 3:
+        return word
+    i = rng.randrange(1, len(word) - 1)
+    kind = rng.randrange(3)
+    if kind == 0:
+        return word[:i] + word[i + 1 :]
+    if kind == 1:
+        return word[:i] + rng.choice(word) + word[i + 1 :]
+    return word[: i - 1] + word[i] + word[i - 1] + word[i + 1 :]
+
+
+def reference_words(checker: "SpellChecker", count: int, seed: int = 0) -> List[str]:
+    """Слова словаря с одной-двумя случайными опечатками"""
+    rng = random.Random(seed)
+    words = sorted(w for w in checker.word_frequency.dictionary if len(w) >= 4)
+    result = []
+    for _ in range(count):
+        word = misspell(rng.choice(words), rng)
+        result.append(misspell(word, rng) if rng.random() < 0.3 else word)
+    return result
+
+
+def make_misspelled_text(
+    words_count: int, seed: int = 0, typo_rate: float = 0.05
+) -> str:
+    """Текст из RU/EN слов, часть которых содержит опечатки
+
+    Args:
+        words_count (int): количество слов
+        seed (int): зерно генератора
+        typo_rate (float): доля слов с опечаткой
+
+    Returns:
+        str: текст, разбитый на строки по 12 слов
+    """
+    rng = random.Random(seed)
+    vocabulary = EN_WORDS + RU_WORDS
+    words = []
+    for _ in range(words_count):
+        word = rng.choice(vocabulary)
+        if rng.random() < typo_rate:
+            word = misspell(word, rng)
+        words.append(word)
+    return "\n".join(" ".join(words[i : i + 12]) for i in range(0, len(words), 12))
+
+
+def make_paragraphs(count: int, words: int, seed: int = 0) -> List[str]:
+    """Абзацы с заголовком раздела и опечатками в тексте"""
+    return [
+        f"Раздел {i}\n"
+        + make_misspelled_text(words, seed=seed * count + i, typo_rate=0.1)
+        for i in range(count)
+    ]
+
+
+def _escape_pdf_string(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_sample_pdf(
+    path: Union[str, Path], pages: int, lines_per_page: int = 40, seed: int = 0
+) -> Path:
+    """Создает текстовый PDF (латиница, шрифт Helvetica) с детерминированным содержимым
+
+    Args:
+        path (Union[str, Path]): куда сохранить файл
+        pages (int): количество страниц
+        lines_per_page (int): количество строк на странице
+        seed (int): зерно генератора
+
+    Returns:
+        Path: путь до созданного файла
+    """
+    body = ocr_lines(random.Random(seed), EN_WORDS)
+    font = DictionaryObject(
+        {
+            NameObject("/Type"): NameObject("/Font"),
+            NameObject("/Subtype"): NameObject("/Type1"),
+            NameObject("/BaseFont"): NameObject("/Helvetica"),
+        }
+    )
+    writer = PdfWriter()
+    for page_no in range(pages):
+        lines = [f"Section {page_no + 1}"]
+        lines += [next(body) for _ in range(lines_per_page)]
+        commands = " T* ".join(f"({_escape_pdf_string(line)}) Tj" for line in lines)
+
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 10 Tf 40 800 Td 12 TL {commands} ET".encode("latin-1"))
+
+        page = PageObject.create_blank_page(None, 612, 842)
+        page[NameObject("/Contents")] = stream
+        page[NameObject("/Resources")] = DictionaryObject(
+            {NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})}
+        )
+        writer.add_page(page)
+
+    path = Path(path)
+    with open(path, "wb") as f:
+        writer.write(f)
+    return path
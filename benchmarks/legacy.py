@@ -0,0 +1,57 @@
+"""
+Реализации этапов до оптимизаций: базовая линия для сравнения в бенчмарках
+и эталон поведения для тестов.
+"""
+
+import re
+
+from text_processing.constants import (
+    DIGIT_LETTER_RE,
+    LETTER_DIGIT_RE,
+    LETTERS,
+    MULTI_SPACES_RE,
+    PUNCT_AFTER_RE,
+    PUNCT_BEFORE_RE,
+)
+from text_processing.roman import RomanNumeralSeparator
+
+
+def legacy_separate_numbers(text: str) -> str:
+    text = DIGIT_LETTER_RE.sub(" ", text)
+    return LETTER_DIGIT_RE.sub(" ", text)
+
+
+def legacy_remove_extra_spaces(text: str) -> str:
+    text = PUNCT_BEFORE_RE.sub(r"\1", text)
+    text = PUNCT_AFTER_RE.sub(r"\1 ", text)
+    text = MULTI_SPACES_RE.sub(" ", text)
+    return text.strip()
+
+
+LEGACY_ROMAN_RE = re.compile(
+    rf"({LETTERS}+?)({RomanNumeralSeparator.ROMAN_LETTERS}{{2,}})((?:{LETTERS})+)"
+)
+LEGACY_ROMAN_REGEXP = re.compile(
+    r"^(M{0,3})(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})$"
+)
+LEGACY_INVALID_ROMAN = (
+    "IIII", "VV", "XXXX", "LL", "CCCC", "DD", "MMMM", "IL", "IC", "ID", "IM",
+    "VX", "VL", "VC", "VD", "VM", "XD", "XM", "LC", "LD", "LM",
+)  # fmt: skip
+
+
+def legacy_is_valid_roman(value: str) -> bool:
+    value = value.upper()
+    if not LEGACY_ROMAN_REGEXP.match(value):
+        return False
+    return not any(invalid in value for invalid in LEGACY_INVALID_ROMAN)
+
+
+def legacy_separate_roman(text: str) -> str:
+    def replacer(match: re.Match) -> str:
+        before, roman, after = match.groups()
+        if roman.isupper() and legacy_is_valid_roman(roman):
+            return f"{before} {roman} {after}"
+        return match.group(0)
+
+    return LEGACY_ROMAN_RE.sub(replacer, text)
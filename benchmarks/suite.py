@@ -0,0 +1,222 @@
+"""
+Набор бенчмарков нормализации на детерминированных RU/EN корпусах.
+
+Каждый этап RawTextNormalizer замеряется на том входе, который он получает
+в пайплайне, плюс полный normalize и извлечение текста из PDF.
+Результат - JSON, который можно сравнивать между коммитами
+(python -m benchmarks.compare old.json new.json).
+
+Запуск:
+    python -m benchmarks.suite --sizes 1KB 1MB 100MB --out results.json
+    python -m benchmarks.suite --sizes 1KB 1MB --repeat 5
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.corpus import LANGUAGES, make_ocr_text, write_sample_pdf
+from pdf.extract_text import extract_only_text_by_pages
+from text_processing.constants import MULTI_NEWLINE_RE
+from text_processing.lines import LineJoiner
+from text_processing.normalizer import RawTextNormalizer
+from text_processing.numbers import NumberWordSeparator
+from text_processing.roman import RomanNumeralSeparator
+from text_processing.spacing import SpacingNormalizer
+from text_processing.spelling import SpellCheckerService
+
+SIZE_UNITS = {"KB": 1_000, "MB": 1_000_000, "GB": 1_000_000_000}
+
+# Средний объем текста одной страницы синтетического PDF (байт)
+PDF_PAGE_BYTES = 3_500
+
+
+def parse_size(value: str) -> int:
+    """ "1KB" -> 1000, "100MB" -> 100000000, "512" -> 512"""
+    value = value.strip().upper()
+    for unit, factor in SIZE_UNITS.items():
+        if value.endswith(unit):
+            return int(float(value[: -len(unit)]) * factor)
+    return int(value)
+
+
+def format_size(size: int) -> str:
+    for unit, factor in sorted(SIZE_UNITS.items(), key=lambda x: -x[1]):
+        if size >= factor and size % factor == 0:
+            return f"{size // factor}{unit}"
+    return str(size)
+
+
+def measure(func: Callable[[], object], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def record(
+    corpus: str, stage: str, size: int, timings: List[float]
+) -> Dict[str, object]:
+    best = min(timings)
+    return {
+        "corpus": corpus,
+        "stage": stage,
+        "bytes": size,
+        "repeat": len(timings),
+        "seconds_min": best,
+        "seconds_median": statistics.median(timings),
+        "mb_per_s": size / 1_000_000 / best if best else None,
+    }
+
+
+def pipeline_stages(
+    spellchecker: Optional[SpellCheckerService],
+) -> List[tuple[str, Callable[[str], str]]]:
+    """Этапы в порядке RawTextNormalizer.normalize"""
+    stages = [
+        ("MultiNewline", lambda text: MULTI_NEWLINE_RE.sub("\n", text)),
+        ("LineJoiner", LineJoiner.join),
+        ("SpacingNormalizer", SpacingNormalizer.remove_extra_spaces),
+        ("NumberWordSeparator", NumberWordSeparator.separate),
+        ("RomanNumeralSeparator", RomanNumeralSeparator.separate),
+    ]
+    if spellchecker is not None:
+        stages.append(("SpellCheckerService", spellchecker.correct))
+    return stages
+
+
+def bench_text(
+    lang: str,
+    size: int,
+    repeat: int,
+    spellchecker: Optional[SpellCheckerService],
+) -> List[Dict[str, object]]:
+    corpus = f"{lang}-{format_size(size)}"
+    text = make_ocr_text(size, seed=0, lang=lang)
+    size = len(text.encode("utf-8"))
+    results = []
+
+    stage_input = text
+    for stage, func in pipeline_stages(spellchecker):
+        current = stage_input
+        timings = measure(lambda: func(current), repeat)
+        results.append(record(corpus, stage, size, timings))
+        stage_input = func(current)
+
+    for name, normalizer in (
+        ("RawTextNormalizer", RawTextNormalizer()),
+        ("RawTextNormalizer[fused]", RawTextNormalizer(fused=True)),
+    ):
+        results.append(
+            record(
+                corpus, name, size, measure(lambda: normalizer.normalize(text), repeat)
+            )
+        )
+    return results
+
+
+def bench_pdf(size: int, repeat: int, tmp: Path) -> Dict[str, object]:
+    pages = max(1, size // PDF_PAGE_BYTES)
+    path = write_sample_pdf(tmp / f"sample-{pages}.pdf", pages)
+    size = sum(
+        len(text.encode("utf-8")) for text in extract_only_text_by_pages(path).values()
+    )
+    timings = measure(lambda: extract_only_text_by_pages(path), repeat)
+    result = record(f"pdf-{pages}p", "extract_only_text_by_pages", size, timings)
+    result["pages"] = pages
+    result["pages_per_s"] = pages / min(timings)
+    return result
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", nargs="+", default=["1KB", "1MB", "100MB"])
+    parser.add_argument(
+        "--langs", nargs="+", default=["ru", "en"], choices=list(LANGUAGES)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--spellcheck-max-size",
+        default="1KB",
+        help="орфография (очень медленная) замеряется только на корпусах "
+        "не больше этого размера",
+    )
+    parser.add_argument(
+        "--pdf-max-size",
+        default="1MB",
+        help="извлечение из PDF замеряется только для размеров не больше этого",
+    )
+    parser.add_argument("--out", type=Path, help="файл для JSON с результатами")
+    args = parser.parse_args()
+
+    sizes = [parse_size(size) for size in args.sizes]
+    spellcheck_max = parse_size(args.spellcheck_max_size)
+    pdf_max = parse_size(args.pdf_max_size)
+    # Без кэша исправлений: иначе со второго повтора (и на повторяющихся
+    # словах корпусов) замеряются попадания в кэш, а не исправление
+    spellchecker = (
+        SpellCheckerService(cache_size=0)
+        if any(s <= spellcheck_max for s in sizes)
+        else None
+    )
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            rows = []
+            for lang in args.langs:
+                checker = spellchecker if size <= spellcheck_max else None
+                rows += bench_text(lang, size, args.repeat, checker)
+            if size <= pdf_max:
+                rows.append(bench_pdf(size, args.repeat, Path(tmp)))
+
+            for row in rows:
+                print(
+                    f"{row['corpus']:<12} {row['stage']:<28} "
+                    f"{row['seconds_min']:10.4f}s  {row['mb_per_s'] or 0:9.2f} MB/s"
+                )
+            results += rows
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    if args.out:
+        args.out.write_text(
+            json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+        print(f"results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+swiss-knife: пакетная обработка каталогов.
+
+    python cli.py extract DIR --out OUT --workers 4
+    python cli.py normalize DIR --out OUT --workers 4 [--spellcheck]
+
+extract - текст всех *.pdf из DIR (рекурсивно) в OUT/<путь>.txt;
+normalize - нормализация всех *.txt из DIR в OUT/<путь>.txt.
+
+Уже обработанные файлы (результат новее исходника) пропускаются,
+поэтому прерванный запуск можно просто повторить. Результат пишется
+во временный файл и переименовывается, незавершенные файлы
+не считаются обработанными.
+"""
+
+import argparse
+import os
+import sys
+import time
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from text_processing.streaming import StreamingNormalizer
+
+Job = Tuple[Path, Path]
+
+
+def iter_inputs(
+    src: Path, suffix: str, exclude: Optional[Path] = None
+) -> Iterator[Path]:
+    """
+    Файлы с расширением suffix в src (рекурсивно), в стабильном порядке.
+    Каталог exclude (например, OUT внутри DIR) не обходится.
+    """
+    excluded = exclude.resolve() if exclude is not None else None
+    for root, dirs, files in os.walk(src):
+        if excluded is not None:
+            dirs[:] = [d for d in dirs if (Path(root) / d).resolve() != excluded]
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(suffix):
+                yield Path(root) / name
+
+
+def is_done(src: Path, dst: Path) -> bool:
+    return dst.exists() and dst.stat().st_mtime >= src.stat().st_mtime
+
+
+def plan_jobs(
+    src: Path, out: Path, suffix: str, force: bool = False
+) -> Tuple[List[Job], int]:
+    """
+    Returns:
+        Tuple[List[Job], int]: пары (исходник, результат) и число пропущенных
+    """
+    jobs: List[Job] = []
+    skipped = 0
+    for path in iter_inputs(src, suffix, exclude=out):
+        dst = (out / path.relative_to(src)).with_suffix(".txt")
+        if not force and is_done(path, dst):
+            skipped += 1
+        else:
+            jobs.append((path, dst))
+    return jobs, skipped
+
+
+def _temporary(dst: Path) -> Path:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    return dst.with_name(f".{dst.name}.part")
+
+
+def extract_job(src: Path, dst: Path) -> int:
+    # PyPDF2 импортируется только командой extract
+    from pdf.extract_text import extract_only_text_from_pdf
+
+    tmp = _temporary(dst)
+    tmp.write_text(extract_only_text_from_pdf(src), encoding="utf-8")
+    os.replace(tmp, dst)
+    return src.stat().st_size
+
+
+@lru_cache(maxsize=None)
+def _normalizer(spellcheck: bool) -> StreamingNormalizer:
+    """
+    Один нормализатор на процесс: словари и кэши исправлений
+    не создаются заново для каждого файла.
+    """
+    return StreamingNormalizer(enable_spellcheck=spellcheck)
+
+
+def normalize_job(src: Path, dst: Path, spellcheck: bool = False) -> int:
+    tmp = _temporary(dst)
+    _normalizer(spellcheck).normalize_file(src, tmp)
+    os.replace(tmp, dst)
+    return src.stat().st_size
+
+
+COMMANDS = {
+    "extract": (".pdf", extract_job),
+    "normalize": (".txt", normalize_job),
+}
+
+
+def run_jobs(
+    jobs: List[Job],
+    job: Callable[[Path, Path], int],
+    workers: int,
+) -> Tuple[int, int, List[Tuple[Path, str]]]:
+    """
+    Returns:
+        Tuple[int, int, List]: обработано файлов, байт исходников, ошибки
+    """
+    done = 0
+    size = 0
+    errors: List[Tuple[Path, str]] = []
+
+    def report(src: Path, result: int) -> None:
+        nonlocal done, size
+        done += 1
+        size += result
+        print(f"[{done}/{len(jobs)}] {src}", file=sys.stderr)
+
+    if workers <= 1:
+        for src, dst in jobs:
+            try:
+                report(src, job(src, dst))
+            except Exception as error:
+                errors.append((src, repr(error)))
+        return done, size, errors
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(job, src, dst): src for src, dst in jobs}
+        for future in as_completed(futures):
+            src = futures[future]
+            try:
+                report(src, future.result())
+            except Exception as error:
+                errors.append((src, repr(error)))
+    return done, size, errors
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="swiss-knife", description=__doc__)
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    parser.add_argument("src", type=Path, help="каталог с исходными файлами")
+    parser.add_argument("--out", type=Path, required=True, help="каталог результатов")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--spellcheck", action="store_true", help="орфография при normalize"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="обработать и уже готовые файлы"
+    )
+    args = parser.parse_args(argv)
+
+    if not args.src.is_dir():
+        parser.error(f"нет каталога {args.src}")
+    if args.out.resolve() == args.src.resolve():
+        parser.error("каталог результатов --out совпадает с каталогом исходников")
+
+    suffix, job = COMMANDS[args.command]
+    if job is normalize_job:
+        job = partial(normalize_job, spellcheck=args.spellcheck)
+    jobs, skipped = plan_jobs(args.src, args.out, suffix, args.force)
+
+    start = time.perf_counter()
+    done, size, errors = run_jobs(jobs, job, args.workers)
+    elapsed = time.perf_counter() - start
+
+    for src, error in errors:
+        print(f"ошибка: {src}: {error}", file=sys.stderr)
+    print(
+        f"{args.command}: files={done} skipped={skipped} errors={len(errors)} "
+        f"time={elapsed:.2f}s  {done / elapsed if elapsed else 0:.1f} files/s  "
+        f"{size / 1_000_000 / elapsed if elapsed else 0:.2f} MB/s"
+    )
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
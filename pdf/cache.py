@@ -0,0 +1,220 @@
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+
+class ExtractionCache:
+    """
+    Дисковый кэш извлеченного текста PDF (SQLite).
+
+    Ключ страницы: хэш содержимого файла + номер страницы + версия
+    пайплайна извлечения. Переименованный или скопированный файл берется
+    из кэша, измененный файл получает новый хэш и разбирается заново.
+
+    При превышении max_size (байт текста) вытесняются страницы,
+    к которым дольше всего не обращались.
+    """
+
+    HASH_BLOCK_SIZE = 1024 * 1024
+    # Ограничение числа параметров в одном запросе SQLite
+    BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_size: int = 512 * 1024 * 1024,
+    ) -> None:
+        """
+        Args:
+            path: файл базы данных (создается при отсутствии)
+            max_size: предельный объем текста в кэше, байт
+        """
+        self.path = Path(path)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                file_hash TEXT NOT NULL,
+                version TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                text TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                accessed INTEGER NOT NULL,
+                PRIMARY KEY (file_hash, version, page)
+            );
+            CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed);
+            CREATE TABLE IF NOT EXISTS documents (
+                file_hash TEXT NOT NULL,
+                version TEXT NOT NULL,
+                pages_count INTEGER NOT NULL,
+                PRIMARY KEY (file_hash, version)
+            );
+            """
+        )
+        # Логические часы для LRU: растут при каждом обращении
+        (self._clock,) = self._conn.execute(
+            "SELECT COALESCE(MAX(accessed), 0) FROM pages"
+        ).fetchone()
+        # Объем текста ведется по вставкам и удалениям этого соединения,
+        # полный подсчет - только при открытии и перед вытеснением
+        self._size = self._total_size()
+
+    def __enter__(self) -> "ExtractionCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @classmethod
+    def file_hash(cls, file_path: Union[str, Path]) -> str:
+        """SHA-256 содержимого файла (читается блоками)"""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as source:
+            for block in iter(lambda: source.read(cls.HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def pages_count(self, file_hash: str, version: str) -> Optional[int]:
+        """Количество страниц документа, если он уже разбирался"""
+        row = self._conn.execute(
+            "SELECT pages_count FROM documents WHERE file_hash = ? AND version = ?",
+            (file_hash, version),
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_pages(
+        self, file_hash: str, version: str, pages: Iterable[int]
+    ) -> Dict[int, str]:
+        """
+        Текст закэшированных страниц из pages (индексы с 0).
+        Отсутствующие страницы учитываются как промахи.
+        """
+        pages = list(pages)
+        rows = self._conn.execute(
+            "SELECT page, text FROM pages WHERE file_hash = ? AND version = ?",
+            (file_hash, version),
+        ).fetchall()
+        wanted = set(pages)
+        found = {page: text for page, text in rows if page in wanted}
+
+        self.hits += len(found)
+        self.misses += len(pages) - len(found)
+        if found:
+            clock = self._tick()
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE pages SET accessed = ? "
+                    "WHERE file_hash = ? AND version = ? AND page = ?",
+                    [(clock, file_hash, version, page) for page in found],
+                )
+        return found
+
+    def put_pages(
+        self,
+        file_hash: str,
+        version: str,
+        pages_count: int,
+        pages: Iterable[Tuple[int, str]],
+    ) -> None:
+        """Сохраняет текст страниц (индексы с 0) и вытесняет лишнее"""
+        clock = self._tick()
+        rows = [
+            (file_hash, version, page, text, len(text.encode()), clock)
+            for page, text in pages
+        ]
+        with self._conn:
+            # заменяемые страницы уже учтены в объеме
+            replaced = 0
+            for start in range(0, len(rows), self.BATCH_SIZE):
+                batch = [row[2] for row in rows[start : start + self.BATCH_SIZE]]
+                (size,) = self._conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM pages "
+                    "WHERE file_hash = ? AND version = ? "
+                    f"AND page IN ({','.join('?' * len(batch))})",
+                    (file_hash, version, *batch),
+                ).fetchone()
+                replaced += size
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?)",
+                (file_hash, version, pages_count),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+        self._size += sum(row[4] for row in rows) - replaced
+        if self._size > self.max_size:
+            self.evict()
+
+    def _total_size(self) -> int:
+        (size,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM pages"
+        ).fetchone()
+        return size
+
+    def size(self) -> int:
+        """Объем текста в кэше, байт"""
+        return self._size
+
+    def evict(self) -> int:
+        """
+        Удаляет давно использованные страницы, пока объем больше max_size.
+
+        Returns:
+            int: количество удаленных страниц
+        """
+        # файл могут менять и другие процессы: перед вытеснением объем
+        # пересчитывается точно
+        self._size = self._total_size()
+        excess = self._size - self.max_size
+        if excess <= 0:
+            return 0
+
+        victims: List[Tuple[str, str, int]] = []
+        rows = self._conn.execute(
+            "SELECT file_hash, version, page, size FROM pages ORDER BY accessed"
+        )
+        for file_hash, version, page, size in rows:
+            if excess <= 0:
+                break
+            victims.append((file_hash, version, page))
+            excess -= size
+            self._size -= size
+
+        with self._conn:
+            self._conn.executemany(
+                "DELETE FROM pages WHERE file_hash = ? AND version = ? AND page = ?",
+                victims,
+            )
+            self._conn.execute(
+                "DELETE FROM documents WHERE NOT EXISTS ("
+                "SELECT 1 FROM pages WHERE pages.file_hash = documents.file_hash "
+                "AND pages.version = documents.version)"
+            )
+        return len(victims)
+
+    def clear(self) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM pages")
+            self._conn.execute("DELETE FROM documents")
+        self._size = 0
+
+    def info(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": self.size(),
+            "max_size": self.max_size,
+        }
@@ -1,6 +1,10 @@
 from typing import Optional
 
 class Content:
+    # Один объект на строку текста: без __dict__ дерево документа занимает
+    # около 50 байт на строку вместо ~90 (benchmarks/bench_document_memory.py)
+    __slots__ = ("__text",)
+
     def __init__(self, raw_text: Optional[str]):
         if not raw_text:
             raise ValueError("Контент заполнения не может быть пустым!")
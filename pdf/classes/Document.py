@@ -6,6 +6,9 @@ class Document:
         self.__title: str = title
         self.__sections: List[Section] = []
         
+    def get_title(self) -> str:
+        return self.__title
+
     def get_sections(self) -> List[Section]:
         return self.__sections
     
@@ -16,7 +19,6 @@ class Document:
         self.__sections.extend(sections_lst)
         
     def __repr__(self) -> str:
-        text = f"Document({self.__title})"
-        for section in self.__sections:
-            text += f"\n\t{section}"
-        return text
\ No newline at end of file
+        parts = [f"Document({self.__title})"]
+        parts.extend(f"\n\t{section}" for section in self.__sections)
+        return "".join(parts)
\ No newline at end of file
@@ -0,0 +1,134 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Union
+
+from PyPDF2 import PdfReader
+
+from ..extract_text import pipeline_version, postprocess_page_with_newlines, read_page
+from .Content import Content
+from .Document import Document
+from .Section import Section
+
+if TYPE_CHECKING:
+    from ..cache import ExtractionCache
+
+
+class LazyDocument(Document):
+    """
+    Документ, открытый из PDF без предварительного разбора.
+
+    Секции страницы N извлекаются и нормализуются при первом обращении
+    и кэшируются: поиск в одной странице большого файла стоит разбора
+    одной страницы. Первая строка страницы - заголовок секции,
+    остальные строки - ее контент (как в pdf/parser.py).
+    """
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        title: Optional[str] = None,
+        postprocess: Callable[[str], str] = postprocess_page_with_newlines,
+        normalize: Optional[Callable[[str], str]] = None,
+        cache: Optional["ExtractionCache"] = None,
+    ):
+        """
+        Args:
+            file_path: путь до PDF
+            title: название документа (по умолчанию - имя файла)
+            postprocess: обработка извлеченного текста страницы
+            normalize: нормализация каждой строки контента (например,
+                RawTextNormalizer().normalize)
+            cache: дисковый кэш извлеченных страниц
+        """
+        self.__path = Path(file_path)
+        super().__init__(title or self.__path.name)
+        self.__postprocess = postprocess
+        self.__normalize = normalize
+        self.__cache = cache
+        self.__file_hash: Optional[str] = None
+        self.__reader: Optional[PdfReader] = None
+        self.__pages: Dict[int, List[Section]] = {}
+        self.__loaded = False
+        self.__page_sections = 0  # число секций страниц в начале get_sections
+
+    def _reader(self) -> PdfReader:
+        if self.__reader is None:
+            self.__reader = PdfReader(self.__path)
+        return self.__reader
+
+    @property
+    def pages_count(self) -> int:
+        return len(self._reader().pages)
+
+    def loaded_pages(self) -> List[int]:
+        """Номера уже разобранных страниц"""
+        return sorted(self.__pages)
+
+    def _page_text(self, index: int) -> str:
+        if self.__cache is None:
+            return self.__postprocess(read_page(self._reader().pages[index]))
+
+        if self.__file_hash is None:
+            self.__file_hash = self.__cache.file_hash(self.__path)
+        version = pipeline_version(self.__postprocess)
+        cached = self.__cache.get_pages(self.__file_hash, version, [index])
+        if index in cached:
+            return cached[index]
+
+        text = self.__postprocess(read_page(self._reader().pages[index]))
+        self.__cache.put_pages(
+            self.__file_hash, version, self.pages_count, [(index, text)]
+        )
+        return text
+
+    def _parse_page(self, text: str) -> List[Section]:
+        sections: List[Section] = []
+        section = None
+        for line in text.split("\n"):
+            if not line.strip():
+                continue
+            if section is None:
+                section = Section(title=line, level=1)
+                sections.append(section)
+                continue
+            if self.__normalize is not None:
+                line = self.__normalize(line)
+            if line:
+                section.add_content(Content(raw_text=line))
+        return sections
+
+    def get_page(self, page_no: int) -> List[Section]:
+        """
+        Секции страницы page_no (с 1); страница разбирается один раз.
+        """
+        if not 1 <= page_no <= self.pages_count:
+            raise IndexError(f"Нет страницы {page_no} (всего {self.pages_count})")
+
+        sections = self.__pages.get(page_no)
+        if sections is None:
+            sections = self._parse_page(self._page_text(page_no - 1))
+            self.__pages[page_no] = sections
+        return sections
+
+    def iter_sections(self) -> Iterator[Section]:
+        """Секции всех страниц по порядку, страницы разбираются по мере обхода"""
+        for page_no in range(1, self.pages_count + 1):
+            yield from self.get_page(page_no)
+
+    def get_sections(self) -> List[Section]:
+        """Все секции документа (разбирает оставшиеся страницы)"""
+        sections = super().get_sections()
+        if not self.__loaded:
+            # Секции страниц идут перед добавленными вручную
+            page_sections = list(self.iter_sections())
+            sections[:0] = page_sections
+            self.__page_sections = len(page_sections)
+            self.__loaded = True
+        return sections
+
+    def added_sections(self) -> List[Section]:
+        """Секции, добавленные вручную (add_section), без разбора страниц"""
+        return super().get_sections()[self.__page_sections :]
+
+    def __repr__(self) -> str:
+        self.get_sections()
+        return super().__repr__()
@@ -2,16 +2,28 @@ from typing import List, Any
 from .Content import Content
 
 class Section:
+    # Фиксированный набор полей, без __dict__ у экземпляра
+    __slots__ = ("__level", "__title", "__contents")
+
     def __init__(self, title: str, level: int = 1):
         self.__level: int = level
         self.__title: str = title
         self.__contents: List[Any[Section, Content]] = list()
         
+    def get_title(self) -> str:
+        return self.__title
+
+    def get_level(self) -> int:
+        return self.__level
+
+    def get_contents(self) -> List[Any]:
+        return self.__contents
+
     def add_content(self, new_block: Content):
         self.__contents.append(new_block)
         
     def __repr__(self) -> str:
-        text = f"Section(Level: {self.__level}, Title: {self.__title})"
-        for content in self.__contents:
-            text += "\n" + "\t" * (1 + self.__level) + f"{content}"
-        return text
\ No newline at end of file
+        indent = "\n" + "\t" * (1 + self.__level)
+        parts = [f"Section(Level: {self.__level}, Title: {self.__title})"]
+        parts.extend(f"{indent}{content}" for content in self.__contents)
+        return "".join(parts)
\ No newline at end of file
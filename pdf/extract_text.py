@@ -1,50 +1,270 @@
-from PyPDF2 import PdfReader, PageObject
+from PyPDF2 import PdfReader, PageObject, __version__ as PYPDF2_VERSION
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Union, Dict
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Union,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 import re
 
+if TYPE_CHECKING:
+    from pdf.cache import ExtractionCache
+
+
+# Разделитель страниц в тексте, собранном extract_only_text_from_pdf
+PAGE_SEPARATOR = "\n######################\n"
+
+# Во сколько раз больше диапазонов страниц, чем процессов:
+# страницы бывают разной "тяжести", мелкие диапазоны выравнивают нагрузку
+RANGES_PER_WORKER = 4
+
+# Версия постобработки страниц: увеличивается при изменении результата
+# извлечения, чтобы не брать из ExtractionCache устаревший текст
+EXTRACTION_VERSION = 1
+
 
 def read_page(page: PageObject) -> str:
     return page.extract_text()
 
 
-def extract_only_text_from_pdf(file_path: Union[str, Path]) -> str:
+def postprocess_page(raw_text: str) -> str:
+    """Постобработка текста одной страницы (общая для всех режимов извлечения)"""
+    text = remove_spaces_before_punctuation_marks(raw_text)
+    text = join_full_sentences(text)
+    text = separate_numbers_from_words(text)
+    return text
+
+
+def postprocess_page_with_newlines(raw_text: str) -> str:
+    """Постобработка страницы + схлопывание пустых строк"""
+    return normalize_newlines(postprocess_page(raw_text))
+
+
+def extract_page_range(
+    file_path: Union[str, Path],
+    start: int,
+    stop: int,
+    postprocess: Callable[[str], str],
+) -> List[str]:
+    """Обрабатывает страницы [start, stop), обычно в процессе пула.
+
+    Каждый процесс открывает свой PdfReader: объект читателя
+    не сериализуется и не может разделяться между процессами.
+    """
+    reader = PdfReader(file_path)
+    return [postprocess(read_page(reader.pages[i])) for i in range(start, stop)]
+
+
+def iter_pdf_pages(
+    file_path: Union[str, Path],
+    postprocess: Callable[[str], str] = postprocess_page,
+) -> Iterator[Tuple[int, str]]:
+    """Лениво извлекает текст PDF постранично
+
+    В памяти одновременно находится только текст текущей страницы,
+    первая страница доступна сразу после ее разбора.
+
+    Args:
+        file_path (Union[str, Path]): путь до файла
+        postprocess (Callable[[str], str]): обработка текста страницы
+
+    Yields:
+        Tuple[int, str]: номер страницы (с 1) и ее обработанный текст
+    """
+    reader = PdfReader(file_path)
+    for i, page in enumerate(reader.pages):
+        yield i + 1, postprocess(read_page(page))
+
+
+def split_page_ranges(pages_count: int, parts: int) -> List[range]:
+    """Делит страницы на непрерывные диапазоны примерно одинакового размера
+
+    Args:
+        pages_count (int): количество страниц
+        parts (int): желаемое количество диапазонов
+
+    Returns:
+        List[range]: диапазоны индексов страниц по порядку
+    """
+    parts = max(1, min(parts, pages_count))
+    size, rest = divmod(pages_count, parts)
+    ranges = []
+    start = 0
+    for i in range(parts):
+        stop = start + size + (1 if i < rest else 0)
+        if stop > start:
+            ranges.append(range(start, stop))
+        start = stop
+    return ranges
+
+
+def _callable_name(func: Callable) -> str:
+    """Имя функции, functools.partial (с аргументами) или вызываемого объекта"""
+    if isinstance(func, partial):
+        return f"partial({_callable_name(func.func)}, {func.args!r}, {func.keywords!r})"
+    # у экземпляров с __call__ нет __qualname__, берется имя класса
+    qualname = getattr(func, "__qualname__", type(func).__qualname__)
+    module = getattr(func, "__module__", type(func).__module__)
+    return f"{module}.{qualname}"
+
+
+def pipeline_version(postprocess: Callable[[str], str]) -> str:
+    """Версия пайплайна извлечения для ключа кэша"""
+    return f"{EXTRACTION_VERSION}:{PYPDF2_VERSION}:{_callable_name(postprocess)}"
+
+
+def extract_pages(
+    file_path: Union[str, Path],
+    postprocess: Callable[[str], str] = postprocess_page,
+    workers: int = 1,
+    cache: Optional["ExtractionCache"] = None,
+) -> List[str]:
+    """Извлекает и обрабатывает текст всех страниц, сохраняя их порядок
+
+    Args:
+        file_path (Union[str, Path]): путь до файла
+        postprocess (Callable[[str], str]): обработка текста страницы,
+            должна быть функцией уровня модуля (передается в процессы)
+        workers (int): количество процессов; 1 - последовательный режим
+        cache (ExtractionCache): кэш страниц; разбираются только
+            страницы, которых в нем нет
+
+    Returns:
+        List[str]: обработанный текст страниц в порядке следования
+    """
+    if cache is None:
+        return _extract_all_pages(file_path, postprocess, workers)
+
+    file_hash = cache.file_hash(file_path)
+    version = pipeline_version(postprocess)
+    pages_count = cache.pages_count(file_hash, version)
+
+    if pages_count is None:
+        # Новый или измененный документ: разбираем целиком
+        fresh = dict(enumerate(_extract_all_pages(file_path, postprocess, workers)))
+        pages_count = len(fresh)
+        cache.misses += pages_count
+        cached: Dict[int, str] = {}
+    else:
+        cached = cache.get_pages(file_hash, version, range(pages_count))
+        if len(cached) == pages_count:
+            return [cached[i] for i in range(pages_count)]
+        # Часть страниц вытеснена из кэша: разбираются только они,
+        # при workers > 1 - диапазонами в пуле, как и весь документ
+        missing = [i for i in range(pages_count) if i not in cached]
+        ranges = _page_ranges(missing, workers * RANGES_PER_WORKER)
+        if workers <= 1 or len(ranges) <= 1:
+            reader = PdfReader(file_path)
+            texts = [postprocess(read_page(reader.pages[i])) for i in missing]
+        else:
+            texts = _extract_ranges(file_path, postprocess, workers, ranges)
+        fresh = dict(zip(missing, texts))
+
+    cache.put_pages(file_hash, version, pages_count, fresh.items())
+    cached.update(fresh)
+    return [cached[i] for i in range(pages_count)]
+
+
+def _extract_all_pages(
+    file_path: Union[str, Path],
+    postprocess: Callable[[str], str],
+    workers: int,
+) -> List[str]:
+    if workers <= 1:
+        return [text for _, text in iter_pdf_pages(file_path, postprocess)]
+
+    reader = PdfReader(file_path)
+    ranges = split_page_ranges(len(reader.pages), workers * RANGES_PER_WORKER)
+    if len(ranges) <= 1:
+        return [postprocess(read_page(page)) for page in reader.pages]
+    return _extract_ranges(file_path, postprocess, workers, ranges)
+
+
+def _page_ranges(pages: List[int], parts: int) -> List[range]:
+    """
+    Непрерывные диапазоны из возрастающих индексов страниц; длинные
+    серии делятся так, чтобы диапазонов было около parts.
+    """
+    runs: List[range] = []
+    for page in pages:
+        if runs and runs[-1].stop == page:
+            runs[-1] = range(runs[-1].start, page + 1)
+        else:
+            runs.append(range(page, page + 1))
+    size = max(1, -(-len(pages) // max(1, parts)))
+    return [
+        range(start, min(start + size, run.stop))
+        for run in runs
+        for start in range(run.start, run.stop, size)
+    ]
+
+
+def _extract_ranges(
+    file_path: Union[str, Path],
+    postprocess: Callable[[str], str],
+    workers: int,
+    ranges: List[range],
+) -> List[str]:
+    """Текст страниц диапазонов ranges по порядку, диапазоны - в пуле процессов"""
+    pages: List[str] = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+        # map возвращает результаты в порядке диапазонов
+        for chunk in executor.map(
+            extract_page_range,
+            [file_path] * len(ranges),
+            [r.start for r in ranges],
+            [r.stop for r in ranges],
+            [postprocess] * len(ranges),
+        ):
+            pages.extend(chunk)
+    return pages
+
+
+def extract_only_text_from_pdf(
+    file_path: Union[str, Path],
+    workers: int = 1,
+    cache: Optional["ExtractionCache"] = None,
+) -> str:
     """Извлекаем текст из PDF файла целиком (без картинок)
 
     Args:
         file_path (Union[str, Path]): путь до файла
+        workers (int): количество процессов для извлечения страниц
+        cache (ExtractionCache): дисковый кэш извлеченных страниц
 
     Returns:
         str: весь текст в виде одной строки
     """
-    reader = PdfReader(file_path)
-    text = ""
-    for i, page in enumerate(reader.pages):
-        raw_text = read_page(page)
-        postprocessed_text = remove_spaces_before_punctuation_marks(raw_text)
-        postprocessed_text = join_full_sentences(postprocessed_text)
-        postprocessed_text = separate_numbers_from_words(postprocessed_text)
-        postprocessed_text = normalize_newlines(postprocessed_text)
-        text += f"""{postprocessed_text}\n######################\n"""
-    return text
+    pages = extract_pages(file_path, postprocess_page_with_newlines, workers, cache)
+    return "".join(f"{text}{PAGE_SEPARATOR}" for text in pages)
 
 
-def extract_only_text_by_pages(file_path: Union[str, Path]) -> Dict[int, str]:
+def extract_only_text_by_pages(
+    file_path: Union[str, Path],
+    workers: int = 1,
+    cache: Optional["ExtractionCache"] = None,
+) -> Dict[int, str]:
     """Извлекаем текст из PDF постронично (без картинок)
 
     Args:
         file_path (Union[str, Path]): путь до файла
+        workers (int): количество процессов для извлечения страниц
+        cache (ExtractionCache): дисковый кэш извлеченных страниц
 
     Returns:
         str: весь текст постронично
     """
-    reader = PdfReader(file_path)
     text_by_pages = dict()
-    for i, page in enumerate(reader.pages):
-        raw_text = read_page(page)
-        postprocessed_text = remove_spaces_before_punctuation_marks(raw_text)
-        postprocessed_text = join_full_sentences(postprocessed_text)
-        postprocessed_text = separate_numbers_from_words(postprocessed_text)
+    for i, postprocessed_text in enumerate(
+        extract_pages(file_path, postprocess_page, workers, cache)
+    ):
         text_by_pages[i + 1] = postprocessed_text + "\n"
     return text_by_pages
 
@@ -0,0 +1,236 @@
+"""
+Полнотекстовый инвертированный индекс по блокам Document/Section/Content.
+
+Блок - заголовок секции или строка контента. Для каждого нормализованного
+токена хранятся блоки и позиции токена в них, поэтому поддерживаются
+запросы по словам, фразам ("..." - слова подряд в одном блоке)
+и префиксам (слово*).
+"""
+
+import bisect
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from text_processing.tokens import Tokenizer
+
+from .classes.Content import Content
+from .classes.Document import Document
+from .classes.LazyDocument import LazyDocument
+from .classes.Section import Section
+
+
+class SearchHit:
+    """
+    Найденный блок.
+    """
+
+    __slots__ = ("doc_id", "page", "section", "block", "section_title", "text")
+
+    def __init__(
+        self,
+        doc_id: str,
+        page: int,
+        section: int,
+        block: int,
+        section_title: str,
+        text: str,
+    ) -> None:
+        self.doc_id = doc_id
+        # номер страницы с 1; 0 - документ без страниц или секция,
+        # добавленная в LazyDocument вручную
+        self.page = page
+        self.section = section  # номер секции в документе с 0
+        self.block = block  # 0 - заголовок секции, далее строки контента
+        self.section_title = section_title
+        self.text = text
+
+    def __repr__(self) -> str:
+        return (
+            f"SearchHit({self.doc_id}, page {self.page}, "
+            f"section {self.section} ({self.section_title}), block {self.block})"
+        )
+
+
+class InvertedIndex:
+    """
+    Инвертированный индекс, пополняемый документами по одному.
+
+    Пример:
+        index = InvertedIndex()
+        index.add_document("contract-1", LazyDocument("contract-1.pdf"))
+        index.search('"срок действия" догов*')
+        index.save("index.json")
+    """
+
+    # Элемент запроса: фраза в кавычках или отдельное слово
+    QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+    def __init__(self) -> None:
+        # токен -> {номер блока: позиции токена в блоке}
+        self._postings: Dict[str, Dict[int, List[int]]] = {}
+        # атрибуты блоков по номеру блока
+        self._blocks: List[Tuple[str, int, int, int, str]] = []
+        self._section_titles: Dict[str, List[str]] = {}
+        self._vocabulary: Optional[List[str]] = None  # сортированный, для префиксов
+
+    def __len__(self) -> int:
+        return len(self._section_titles)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._section_titles
+
+    @property
+    def blocks_count(self) -> int:
+        return len(self._blocks)
+
+    @staticmethod
+    def _iter_pages(document: Document) -> Iterator[Tuple[int, Section]]:
+        if isinstance(document, LazyDocument):
+            for page_no in range(1, document.pages_count + 1):
+                for section in document.get_page(page_no):
+                    yield page_no, section
+            for section in document.added_sections():
+                yield 0, section
+        else:
+            for section in document.get_sections():
+                yield 0, section
+
+    @classmethod
+    def _iter_blocks(cls, section: Section) -> Iterator[str]:
+        yield section.get_title()
+        for block in section.get_contents():
+            if isinstance(block, Content):
+                yield block.get_text()
+            else:
+                yield from cls._iter_blocks(block)
+
+    def add_document(self, doc_id: str, document: Document) -> None:
+        """
+        Индексирует документ; LazyDocument разбирается постранично,
+        и у блоков сохраняются номера страниц.
+        """
+        if doc_id in self._section_titles:
+            raise ValueError(f"Документ уже в индексе: {doc_id}")
+
+        titles = self._section_titles[doc_id] = []
+        for page_no, section in self._iter_pages(document):
+            section_no = len(titles)
+            titles.append(section.get_title())
+            for block_no, text in enumerate(self._iter_blocks(section)):
+                self._add_block((doc_id, page_no, section_no, block_no, text))
+        self._vocabulary = None
+
+    def add_documents(self, documents: Iterable[Tuple[str, Document]]) -> None:
+        for doc_id, document in documents:
+            self.add_document(doc_id, document)
+
+    def _add_block(self, block: Tuple[str, int, int, int, str]) -> None:
+        block_id = len(self._blocks)
+        self._blocks.append(block)
+        for position, token in enumerate(Tokenizer.tokens(block[4])):
+            self._postings.setdefault(token, {}).setdefault(block_id, []).append(
+                position
+            )
+
+    # ------------------------------------------------------------ поиск
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        stop = bisect.bisect_left(self._vocabulary, prefix + "\U0010ffff")
+        return self._vocabulary[start:stop]
+
+    def prefix_blocks(self, prefix: str) -> Set[int]:
+        """
+        Блоки, где есть слово, начинающееся с prefix. Префикс делится на
+        токены так же, как индексируемый текст ("глава1" -> "глава", "1"):
+        токены, кроме последнего, должны идти подряд перед словом,
+        начинающимся с последнего.
+        """
+        tokens = Tokenizer.tokens(prefix)
+        if not tokens:
+            return set()
+        expanded: Dict[int, List[int]] = {}
+        for token in self._expand_prefix(tokens[-1]):
+            for block_id, positions in self._postings[token].items():
+                expanded.setdefault(block_id, []).extend(positions)
+        postings = [self._postings.get(token, {}) for token in tokens[:-1]]
+        return self._sequence_blocks(postings + [expanded])
+
+    def phrase_blocks(self, phrase: str) -> Set[int]:
+        """Блоки, где токены phrase идут подряд"""
+        tokens = Tokenizer.tokens(phrase)
+        if not tokens:
+            return set()
+        return self._sequence_blocks([self._postings.get(t, {}) for t in tokens])
+
+    @staticmethod
+    def _sequence_blocks(postings: List[Dict[int, List[int]]]) -> Set[int]:
+        """Блоки, где токены postings[0], postings[1], ... идут подряд"""
+        candidates = set.intersection(*(set(p) for p in postings))
+
+        result = set()
+        for block_id in candidates:
+            starts = set(postings[0][block_id])
+            for offset, posting in enumerate(postings[1:], 1):
+                starts &= {position - offset for position in posting[block_id]}
+                if not starts:
+                    break
+            if starts:
+                result.add(block_id)
+        return result
+
+    def search_blocks(self, query: str) -> List[int]:
+        """
+        Номера блоков, подходящих под все элементы запроса:
+        слово, "фраза", префикс*.
+        """
+        blocks: Optional[Set[int]] = None
+        for phrase, word in self.QUERY_RE.findall(query):
+            if word.endswith("*") and len(word) > 1:
+                found = self.prefix_blocks(word[:-1])
+            else:
+                # Слово может дать несколько токенов ("глава1" -> "глава 1")
+                found = self.phrase_blocks(phrase or word)
+            blocks = found if blocks is None else blocks & found
+            if not blocks:
+                return []
+        return sorted(blocks or ())
+
+    def search(self, query: str) -> List[SearchHit]:
+        return [self.hit(block_id) for block_id in self.search_blocks(query)]
+
+    def hit(self, block_id: int) -> SearchHit:
+        doc_id, page_no, section_no, block_no, text = self._blocks[block_id]
+        title = self._section_titles[doc_id][section_no]
+        return SearchHit(doc_id, page_no, section_no, block_no, title, text)
+
+    # ------------------------------------------------------------ хранение
+
+    def save(self, path: Union[str, Path]) -> None:
+        data = {
+            "blocks": self._blocks,
+            "section_titles": self._section_titles,
+            "postings": {
+                token: list(posting.items())
+                for token, posting in self._postings.items()
+            },
+        }
+        with open(path, "w", encoding="utf-8") as target:
+            json.dump(data, target, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "InvertedIndex":
+        with open(path, encoding="utf-8") as source:
+            data = json.load(source)
+        index = cls()
+        index._blocks = [tuple(block) for block in data["blocks"]]
+        index._section_titles = data["section_titles"]
+        index._postings = {
+            token: {block_id: positions for block_id, positions in posting}
+            for token, posting in data["postings"].items()
+        }
+        return index
@@ -1,21 +1,27 @@
-from extract_text import extract_only_text_from_pdf
-from classes.Section import Section
-from classes.Document import Document
-from classes.Content import Content
+from pathlib import Path
 
-raw_text = extract_only_text_from_pdf("./materials/sample.pdf")
-print(raw_text)
+from pdf.extract_text import iter_pdf_pages, postprocess_page_with_newlines
+from pdf.classes.Section import Section
+from pdf.classes.Document import Document
+from pdf.classes.Content import Content
 
-new_doc = Document()
+# Запуск из корня репозитория: python -m pdf.parser
+if __name__ == "__main__":
+    new_doc = Document()
 
-for page in raw_text.split("\n######################\n"):
-    lines = page.split('\n')
-    for i in range(len(lines)):
-        if i == 0:
-            section = Section(title=lines[i], level=1)
-            new_doc.add_section(section)
-        else:
-            content_block = Content(raw_text=lines[i])
-            section.add_content(content_block)
+    # Страницы обрабатываются по мере извлечения, без сборки всего текста
+    for page_no, page in iter_pdf_pages(
+        Path(__file__).parent.parent / "materials" / "sample.pdf",
+        postprocess_page_with_newlines,
+    ):
+        print(page)
+        lines = page.split('\n')
+        for i in range(len(lines)):
+            if i == 0:
+                section = Section(title=lines[i], level=1)
+                new_doc.add_section(section)
+            elif lines[i]:
+                content_block = Content(raw_text=lines[i])
+                section.add_content(content_block)
 
-print(new_doc)
\ No newline at end of file
+    print(new_doc)
@@ -0,0 +1,254 @@
+"""
+Бинарный формат разобранного документа (Document/Section/Content).
+
+Структура файла:
+    MAGIC
+    блоб строк: для каждой строки u32 длина + байты utf-8
+    таблица записей: по RECORD на секцию / контент (в порядке обхода дерева)
+    индекс секций верхнего уровня: u64 номер записи для каждой
+    FOOTER: смещения таблицы и индекса, их размеры, смещение названия, MAGIC
+
+Таблица и индекс пишутся в конце, поэтому документ можно записывать
+потоково, секция за секцией, не держа дерево в памяти.
+"""
+
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from .classes.Content import Content
+from .classes.Document import Document
+from .classes.Section import Section
+
+MAGIC = b"SKDOC\x00\x01\x00"
+
+KIND_SECTION = 1
+KIND_CONTENT = 2
+
+# номер первой записи секции верхнего уровня
+INDEX = struct.Struct("<Q")
+# kind, уровень секции, число вложенных блоков секции, смещение строки в файле
+RECORD = struct.Struct("<BxHIQ")
+# u32 длина строки перед ее байтами
+LENGTH = struct.Struct("<I")
+# смещение таблицы, число записей, смещение индекса, число секций,
+# смещение названия документа, MAGIC
+FOOTER = struct.Struct("<QQQQQ8s")
+
+
+class DocumentWriter:
+    """
+    Потоковая запись документа: секции пишутся по мере добавления.
+
+    Пример:
+        with DocumentWriter(path, title) as writer:
+            for section in document.iter_sections():
+                writer.add_section(section)
+    """
+
+    def __init__(self, path: Union[str, Path], title: str = "Untitled Document"):
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._offset = len(MAGIC)
+        self._records = bytearray()
+        self._records_count = 0
+        self._index: List[int] = []
+        self._title_offset = self._write_string(title)
+
+    def __enter__(self) -> "DocumentWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+
+    def _write_string(self, text: str) -> int:
+        offset = self._offset
+        data = text.encode("utf-8")
+        self._file.write(LENGTH.pack(len(data)))
+        self._file.write(data)
+        self._offset += LENGTH.size + len(data)
+        return offset
+
+    def _add_record(self, kind: int, level: int, children: int, text: str) -> None:
+        self._records += RECORD.pack(kind, level, children, self._write_string(text))
+        self._records_count += 1
+
+    def _add_block(self, block: Union[Section, Content]) -> None:
+        if isinstance(block, Section):
+            contents = block.get_contents()
+            self._add_record(
+                KIND_SECTION, block.get_level(), len(contents), block.get_title()
+            )
+            for content in contents:
+                self._add_block(content)
+        else:
+            self._add_record(KIND_CONTENT, 0, 0, block.get_text())
+
+    def add_section(self, section: Section) -> None:
+        self._index.append(self._records_count)
+        self._add_block(section)
+
+    def close(self) -> None:
+        table_offset = self._offset
+        self._file.write(self._records)
+        index_offset = table_offset + len(self._records)
+        for record in self._index:
+            self._file.write(INDEX.pack(record))
+        self._file.write(
+            FOOTER.pack(
+                table_offset,
+                self._records_count,
+                index_offset,
+                len(self._index),
+                self._title_offset,
+                MAGIC,
+            )
+        )
+        self._file.close()
+
+
+def write_document(document: Document, path: Union[str, Path]) -> None:
+    """Сохраняет документ в бинарном формате"""
+    with DocumentWriter(path, document.get_title()) as writer:
+        for section in document.get_sections():
+            writer.add_section(section)
+
+
+class _Reader:
+    """Разбор формата поверх bytes или mmap"""
+
+    def __init__(self, data: Union[bytes, mmap.mmap]) -> None:
+        if len(data) < len(MAGIC) + FOOTER.size or data[: len(MAGIC)] != MAGIC:
+            raise ValueError("Файл не является сохраненным документом")
+        (
+            self.table_offset,
+            self.records_count,
+            index_offset,
+            self.sections_count,
+            title_offset,
+            magic,
+        ) = FOOTER.unpack_from(data, len(data) - FOOTER.size)
+        if magic != MAGIC:
+            raise ValueError("Поврежден конец файла документа")
+
+        self.data = data
+        self.index_offset = index_offset
+        self.title = self.string(title_offset)
+
+    def section_record(self, index: int) -> int:
+        (record,) = INDEX.unpack_from(self.data, self.index_offset + index * INDEX.size)
+        return record
+
+    def string(self, offset: int) -> str:
+        (length,) = LENGTH.unpack_from(self.data, offset)
+        start = offset + LENGTH.size
+        return str(self.data[start : start + length], "utf-8")
+
+    def section(self, record: int) -> Section:
+        """Собирает секцию, начинающуюся с записи record"""
+        section, _ = self._block(record)
+        return section
+
+    def _block(self, record: int):
+        kind, level, children, offset = RECORD.unpack_from(
+            self.data, self.table_offset + record * RECORD.size
+        )
+        text = self.string(offset)
+        if kind == KIND_CONTENT:
+            return Content(text), record + 1
+
+        section = Section(title=text, level=level)
+        record += 1
+        for _ in range(children):
+            block, record = self._block(record)
+            section.add_content(block)
+        return section, record
+
+
+def read_document(path: Union[str, Path]) -> Document:
+    """Загружает документ целиком"""
+    reader = _Reader(Path(path).read_bytes())
+    document = Document(reader.title)
+    document.add_sections(
+        [
+            reader.section(reader.section_record(index))
+            for index in range(reader.sections_count)
+        ]
+    )
+    return document
+
+
+class MappedDocument:
+    """
+    Доступ только для чтения через mmap: секции собираются по запросу,
+    открытие файла не зависит от его размера.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self._file = open(path, "rb")
+        self._mmap: Optional[mmap.mmap] = None
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._reader: Optional[_Reader] = _Reader(self._mmap)
+        except Exception:
+            # Чужой или поврежденный файл: не оставляем открытыми файл и mmap
+            if self._mmap is not None:
+                self._mmap.close()
+            self._file.close()
+            raise
+
+    def __enter__(self) -> "MappedDocument":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._reader.sections_count
+
+    @property
+    def title(self) -> str:
+        return self._reader.title
+
+    def get_section(self, index: int) -> Section:
+        if not 0 <= index < len(self):
+            raise IndexError(f"Нет секции {index} (всего {len(self)})")
+        return self._reader.section(self._reader.section_record(index))
+
+    def iter_sections(self) -> Iterator[Section]:
+        for index in range(len(self)):
+            yield self.get_section(index)
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader = None
+            self._mmap.close()
+            self._file.close()
+
+
+def _block_to_dict(block: Union[Section, Content]) -> Union[str, Dict[str, Any]]:
+    if isinstance(block, Content):
+        return block.get_text()
+    return {
+        "title": block.get_title(),
+        "level": block.get_level(),
+        "contents": [_block_to_dict(content) for content in block.get_contents()],
+    }
+
+
+def document_to_dict(document: Document) -> Dict[str, Any]:
+    """Представление для JSON: контент - строка, секция - словарь"""
+    return {
+        "title": document.get_title(),
+        "sections": [_block_to_dict(section) for section in document.get_sections()],
+    }
+
+
+def export_json(document: Document, path: Union[str, Path]) -> None:
+    with open(path, "w", encoding="utf-8") as target:
+        json.dump(document_to_dict(document), target, ensure_ascii=False)
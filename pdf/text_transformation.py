@@ -1,4 +1,5 @@
 import re
+from typing import Dict, Iterable, Set
 from spellchecker import SpellChecker
 
 
@@ -208,40 +209,73 @@ class RawTextHandler:
 
         return "\n".join(result)
 
+    # ================================================================#
+    # Орфография                                                      #
+    # ================================================================#
+
+    WORD_RE = re.compile(r"\w+")
+
+    # Словари загружаются один раз (при первой проверке) и переиспользуются
+    _checkers: Dict[str, SpellChecker] = {}
+
+    def get_checker(lang: str) -> SpellChecker:
+        """
+        Словарь языка ("ru" / "en"), загруженный один раз на процесс
+        """
+        checker = RawTextHandler._checkers.get(lang)
+        if checker is None:
+            checker = SpellChecker(language=lang)
+            RawTextHandler._checkers[lang] = checker
+        return checker
+
+    def detect_language(word: str) -> str:
+        """
+        Простое определение языка слова по наличию кириллических букв
+        """
+        if re.search(RawTextHandler.RUSSIAN_LETTERS, word):
+            return "ru"
+        elif re.search(RawTextHandler.ENGLISH_LETTERS, word):
+            return "en"
+        else:
+            return "unknown"
+
+    def correct_words(words: Iterable[str]) -> Dict[str, str]:
+        """
+        Пакетное исправление: каждое уникальное слово проверяется один раз.
+        Возвращает только слова, которые нужно заменить: {слово: исправление}
+        """
+        unknown_by_lang: Dict[str, Set[str]] = {"ru": set(), "en": set()}
+        for word in set(words):
+            lang = RawTextHandler.detect_language(word)
+            if lang in unknown_by_lang:
+                unknown_by_lang[lang].add(word)
+
+        corrections = {}
+        for lang, lang_words in unknown_by_lang.items():
+            if not lang_words:
+                continue
+            checker = RawTextHandler.get_checker(lang)
+            # unknown приводит слова к нижнему регистру
+            unknown = checker.unknown(lang_words)
+            for word in lang_words:
+                if word.lower() not in unknown:
+                    continue
+                correction = checker.correction(word)
+                if correction and correction != word:
+                    corrections[word] = correction
+        return corrections
+
     def spell_check_text(text: str) -> str:
         """
         Проверяем орфографию текста, через spellchecker (расстояние Левенштейна)
         Языки: английский и русский
-        """
 
-        def detect_languale(word: str) -> str:
-            """
-            Простое определение языка слова по наличию кириллических букв
-            """
-            if re.search(RawTextHandler.RUSSIAN_LETTERS, word):
-                return "ru"
-            elif re.search(RawTextHandler.ENGLISH_LETTERS, word):
-                return "en"
-            else:
-                return "unknown"
-
-        def correct_word(word: str) -> str:
-            checker_en = SpellChecker(language="en")
-            checker_ru = SpellChecker(language="ru")
-            lang = detect_languale(word)
-            if lang == "ru":
-                misspelled = checker_ru.unknown([word])
-                if misspelled:
-                    return checker_ru.candidates(word).pop()
-            elif lang == "en":
-                misspelled = checker_en.unknown([word])
-                if misspelled:
-                    return checker_en.candidates(word).pop()
-            return word
-
-        words = re.findall(r"\w+", text)
-        corrected_words = {word: correct_word(word) for word in words}
-        for word, correction in corrected_words.items():
-            if word != correction:
-                text = re.sub(r"\b" + re.escape(word) + r"\b", correction, text)
-        return text
+        Словари загружаются один раз, все слова исправляются пакетно,
+        текст пересобирается за один проход.
+        """
+        corrections = RawTextHandler.correct_words(RawTextHandler.WORD_RE.findall(text))
+        if not corrections:
+            return text
+        return RawTextHandler.WORD_RE.sub(
+            lambda m: corrections.get(m.group(0), m.group(0)), text
+        )
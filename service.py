@@ -0,0 +1,192 @@
+"""
+Asyncio-интерфейс извлечения и нормализации для асинхронных сервисов.
+
+    async with AsyncProcessor(workers=4) as processor:
+        text = await processor.extract_async("contract.pdf")
+        normalized = await processor.normalize_async(text)
+
+Работа выполняется в пуле процессов и не блокирует event loop:
+    - не больше max_concurrency запросов выполняются одновременно,
+      остальные ждут своей очереди;
+    - если ждущих больше max_pending, новый запрос сразу получает
+      ServiceOverloaded (сервис может ответить 503);
+    - PDF извлекается диапазонами по pages_per_task страниц: большой
+      документ не занимает пул целиком, а отмена запроса (task.cancel())
+      останавливает его до следующего диапазона.
+"""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from pdf.extract_text import (
+    PAGE_SEPARATOR,
+    extract_page_range,
+    postprocess_page_with_newlines,
+    split_page_ranges,
+)
+from PyPDF2 import PdfReader
+from text_processing.normalizer import init_worker, normalize_chunk
+
+
+class ServiceOverloaded(RuntimeError):
+    """Очередь ожидающих запросов заполнена"""
+
+
+def _pages_count(file_path: Union[str, Path]) -> int:
+    return len(PdfReader(file_path).pages)
+
+
+def _extract_range(file_path: Union[str, Path], start: int, stop: int) -> List[str]:
+    return extract_page_range(file_path, start, stop, postprocess_page_with_newlines)
+
+
+class AsyncProcessor:
+    """
+    Ограниченный пул для асинхронных запросов извлечения и нормализации.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        max_concurrency: Optional[int] = None,
+        max_pending: int = 100,
+        pages_per_task: int = 8,
+        enable_spellcheck: bool = False,
+    ) -> None:
+        """
+        Args:
+            workers: количество процессов пула
+            max_concurrency: одновременно выполняемых запросов
+                (по умолчанию workers * 2: пул не простаивает между задачами)
+            max_pending: предел ожидающих запросов (backpressure)
+            pages_per_task: страниц PDF в одной задаче пула
+            enable_spellcheck: орфографическая коррекция в normalize_async
+        """
+        self.max_concurrency = max_concurrency or workers * 2
+        self.max_pending = max_pending
+        self.pages_per_task = pages_per_task
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=({"enable_spellcheck": enable_spellcheck},),
+        )
+        # Семафор привязан к event loop: свой для каждого работающего loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.rejected = 0
+
+    async def __aenter__(self) -> "AsyncProcessor":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self._executor.shutdown(cancel_futures=True)
+        )
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "pending": self.pending,
+            "running": self.running,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+        }
+
+    async def _submit(self, func: Callable, *args: Any) -> Any:
+        """Задача пула; отмена await отменяет еще не начатую задачу"""
+        return await asyncio.wrap_future(self._executor.submit(func, *args))
+
+    async def _run(self, request: Callable[[], Any]) -> Any:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise ServiceOverloaded(f"Слишком много запросов в очереди: {self.pending}")
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            # Новый event loop (например, следующий asyncio.run): семафор
+            # прежнего loop в нем не работает
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        semaphore = self._semaphore
+
+        self.pending += 1
+        try:
+            await semaphore.acquire()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.pending -= 1
+
+        self.running += 1
+        try:
+            result = await request()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.running -= 1
+            semaphore.release()
+        self.completed += 1
+        return result
+
+    async def extract_async(self, file_path: Union[str, Path]) -> str:
+        """То же, что extract_only_text_from_pdf, без блокировки event loop"""
+
+        async def request() -> str:
+            pages_count = await self._submit(_pages_count, file_path)
+            parts = -(-pages_count // self.pages_per_task)
+            texts: List[str] = []
+            for pages in split_page_ranges(pages_count, parts):
+                texts.extend(
+                    await self._submit(
+                        _extract_range, file_path, pages.start, pages.stop
+                    )
+                )
+            return "".join(f"{text}{PAGE_SEPARATOR}" for text in texts)
+
+        return await self._run(request)
+
+    async def normalize_async(self, text: str) -> str:
+        """То же, что RawTextNormalizer.normalize, без блокировки event loop"""
+
+        async def request() -> str:
+            (result,) = await self._submit(normalize_chunk, [text])
+            return result
+
+        return await self._run(request)
+
+
+# Общий процессор для функций уровня модуля, создается при первом вызове
+_default_processor: Optional[AsyncProcessor] = None
+
+
+def _default() -> AsyncProcessor:
+    global _default_processor
+    if _default_processor is None:
+        _default_processor = AsyncProcessor()
+    return _default_processor
+
+
+async def extract_async(file_path: Union[str, Path]) -> str:
+    return await _default().extract_async(file_path)
+
+
+async def normalize_async(text: str) -> str:
+    return await _default().normalize_async(text)
+
+
+async def shutdown_default() -> None:
+    """Закрывает общий процессор (например, при остановке сервиса)"""
+    global _default_processor
+    if _default_processor is not None:
+        await _default_processor.close()
+        _default_processor = None
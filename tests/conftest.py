@@ -0,0 +1,17 @@
+import pytest
+
+from benchmarks.corpus import write_sample_pdf
+
+
+@pytest.fixture(scope="session")
+def sample_pdf(tmp_path_factory):
+    return write_sample_pdf(tmp_path_factory.mktemp("pdf") / "sample.pdf", pages=9)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def symspell_index_dir(tmp_path_factory):
+    """Индексы SymSpellIndex строятся раз за сессию во временном каталоге"""
+    path = tmp_path_factory.mktemp("symspell")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("SWISS_KNIFE_CACHE", str(path))
+        yield path
@@ -0,0 +1,94 @@
+import shutil
+
+import pytest
+
+import cli
+from pdf.extract_text import extract_only_text_from_pdf
+from text_processing.normalizer import RawTextNormalizer
+
+
+def test_extract_and_resume(sample_pdf, tmp_path, capsys):
+    src = tmp_path / "src"
+    (src / "nested").mkdir(parents=True)
+    shutil.copy(sample_pdf, src / "a.pdf")
+    shutil.copy(sample_pdf, src / "nested" / "b.PDF")
+    out = tmp_path / "out"
+
+    assert cli.main(["extract", str(src), "--out", str(out)]) == 0
+    expected = extract_only_text_from_pdf(sample_pdf)
+    assert (out / "a.txt").read_text(encoding="utf-8") == expected
+    assert (out / "nested" / "b.txt").read_text(encoding="utf-8") == expected
+    assert "files=2 skipped=0" in capsys.readouterr().out
+
+    # повторный запуск пропускает готовые файлы
+    (out / "a.txt").unlink()
+    assert cli.main(["extract", str(src), "--out", str(out)]) == 0
+    assert "files=1 skipped=1" in capsys.readouterr().out
+    assert not list(out.rglob("*.part"))
+
+
+def test_normalize_with_workers(tmp_path, capsys):
+    src = tmp_path / "src"
+    src.mkdir()
+    texts = {
+        f"doc{i}.txt": f"Глава{i}  текст ,  пере-\nнос\n\n\nконец" for i in range(3)
+    }
+    for name, text in texts.items():
+        (src / name).write_text(text, encoding="utf-8")
+    (src / "skip.pdf.bak").write_text("x")
+    out = tmp_path / "out"
+
+    code = cli.main(["normalize", str(src), "--out", str(out), "--workers", "2"])
+    assert code == 0
+    normalizer = RawTextNormalizer()
+    for name, text in texts.items():
+        assert (out / name).read_text(encoding="utf-8") == normalizer.normalize(text)
+    assert "files=3 skipped=0 errors=0" in capsys.readouterr().out
+
+
+def test_errors_are_reported(tmp_path, capsys):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "broken.pdf").write_bytes(b"not a pdf")
+
+    assert cli.main(["extract", str(src), "--out", str(tmp_path / "out")]) == 1
+    captured = capsys.readouterr()
+    assert "errors=1" in captured.out
+    assert "broken.pdf" in captured.err
+
+
+def test_normalizer_is_created_once_per_process(tmp_path, capsys):
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(3):
+        (src / f"doc{i}.txt").write_text(f"Догвор {i}", encoding="utf-8")
+
+    cli._normalizer.cache_clear()
+    code = cli.main(
+        ["normalize", str(src), "--out", str(tmp_path / "out"), "--spellcheck"]
+    )
+    assert code == 0
+    info = cli._normalizer.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+    assert (tmp_path / "out" / "doc0.txt").read_text(encoding="utf-8") == "Договор 0"
+
+
+def test_out_inside_src_is_not_processed(tmp_path, capsys):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "doc.txt").write_text("Глава1  текст", encoding="utf-8")
+    out = src / "out"
+
+    assert cli.main(["normalize", str(src), "--out", str(out)]) == 0
+    assert "files=1 skipped=0" in capsys.readouterr().out
+    # результаты прошлого запуска не становятся новыми входными файлами
+    assert cli.main(["normalize", str(src), "--out", str(out)]) == 0
+    assert "files=0 skipped=1" in capsys.readouterr().out
+    assert not (out / "out").exists()
+
+
+def test_out_equal_to_src_is_rejected(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    with pytest.raises(SystemExit):
+        cli.main(["normalize", str(src), "--out", str(src / ".")])
@@ -0,0 +1,124 @@
+import shutil
+from functools import partial
+
+from pdf.cache import ExtractionCache
+from pdf.classes.LazyDocument import LazyDocument
+from pdf.extract_text import (
+    extract_only_text_by_pages,
+    extract_only_text_from_pdf,
+    extract_pages,
+    pipeline_version,
+)
+
+
+def test_cached_extraction_matches_uncached(sample_pdf, tmp_path):
+    expected = extract_only_text_by_pages(sample_pdf)
+
+    with ExtractionCache(tmp_path / "cache.db") as cache:
+        assert extract_only_text_by_pages(sample_pdf, cache=cache) == expected
+        assert cache.info()["misses"] == 9
+        assert cache.info()["hits"] == 0
+
+        assert extract_only_text_by_pages(sample_pdf, cache=cache) == expected
+        info = cache.info()
+        assert info["hits"] == 9
+        assert info["hit_rate"] == 0.5
+
+
+def test_cache_is_keyed_by_content_and_pipeline(sample_pdf, tmp_path):
+    copy = tmp_path / "copy.pdf"
+    shutil.copy(sample_pdf, copy)
+
+    with ExtractionCache(tmp_path / "cache.db") as cache:
+        extract_only_text_by_pages(sample_pdf, cache=cache)
+        # Тот же контент под другим именем - из кэша
+        extract_only_text_by_pages(copy, cache=cache)
+        assert cache.hits == 9
+        # Другая постобработка - другая версия пайплайна
+        full = extract_only_text_from_pdf(copy, cache=cache)
+        assert full == extract_only_text_from_pdf(sample_pdf)
+        assert cache.misses == 18
+
+
+def test_cache_persists_between_instances(sample_pdf, tmp_path):
+    with ExtractionCache(tmp_path / "cache.db") as cache:
+        extract_only_text_by_pages(sample_pdf, cache=cache)
+
+    with ExtractionCache(tmp_path / "cache.db") as cache:
+        extract_only_text_by_pages(sample_pdf, cache=cache)
+        assert cache.info()["hit_rate"] == 1.0
+
+
+def test_eviction_reparses_only_missing_pages(sample_pdf, tmp_path):
+    expected = extract_only_text_by_pages(sample_pdf)
+    page_size = max(len(text.encode()) for text in expected.values())
+
+    with ExtractionCache(tmp_path / "cache.db", max_size=page_size * 5) as cache:
+        extract_only_text_by_pages(sample_pdf, cache=cache)
+        assert cache.size() <= cache.max_size
+
+        cache.hits = cache.misses = 0
+        assert extract_only_text_by_pages(sample_pdf, cache=cache) == expected
+        assert 0 < cache.hits < 9
+        assert cache.hits + cache.misses == 9
+
+
+class Suffix:
+    def __init__(self, suffix):
+        self.suffix = suffix
+
+    def __call__(self, text):
+        return text + self.suffix
+
+
+def add_suffix(text, suffix):
+    return text + suffix
+
+
+def test_partial_and_callable_postprocess(sample_pdf, tmp_path):
+    first = partial(add_suffix, suffix="!")
+    second = partial(add_suffix, suffix="?")
+    assert pipeline_version(first) != pipeline_version(second)
+    assert pipeline_version(Suffix("!")).endswith("test_pdf_cache.Suffix")
+
+    raw = extract_pages(sample_pdf, partial(add_suffix, suffix=""))
+    expected = [text + "!" for text in raw]
+    with ExtractionCache(tmp_path / "cache.db") as cache:
+        assert extract_pages(sample_pdf, first, cache=cache) == expected
+        assert extract_pages(sample_pdf, first, cache=cache) == expected
+        assert cache.hits == 9
+        assert extract_pages(sample_pdf, second, cache=cache)[0].endswith("?")
+
+        document = LazyDocument(sample_pdf, postprocess=Suffix("!"), cache=cache)
+        assert document.get_page(1)
+        file_hash = cache.file_hash(sample_pdf)
+        version = pipeline_version(Suffix("!"))
+        assert cache.get_pages(file_hash, version, [0])[0].endswith("!")
+
+
+def test_put_tracks_size_without_full_scan(tmp_path):
+    with ExtractionCache(tmp_path / "cache.db", max_size=100) as cache:
+        statements = []
+        cache._conn.set_trace_callback(statements.append)
+        for page in range(5):
+            cache.put_pages("hash", "v", 5, [(page, "0123456789")])
+        cache.put_pages("hash", "v", 5, [(0, "01234")])  # замена страницы
+        assert cache.size() == 45
+        assert not [s for s in statements if s.endswith("FROM pages")]
+
+        cache.put_pages("hash", "v", 5, [(5, "x" * 60)])
+        assert cache.size() <= 100
+        assert cache.size() == cache._total_size()
+
+
+def test_evicted_pages_are_reparsed_in_pool(sample_pdf, tmp_path):
+    expected = extract_only_text_by_pages(sample_pdf)
+    page_size = max(len(text.encode()) for text in expected.values())
+
+    with ExtractionCache(tmp_path / "cache.db", max_size=page_size * 3) as cache:
+        extract_only_text_by_pages(sample_pdf, cache=cache)
+        cache.hits = cache.misses = 0
+        assert extract_only_text_by_pages(sample_pdf, workers=2, cache=cache) == (
+            expected
+        )
+        assert 0 < cache.hits < 9
@@ -0,0 +1,33 @@
+import pytest
+
+from pdf.classes.Content import Content
+from pdf.classes.Document import Document
+from pdf.classes.Section import Section
+
+
+def test_blocks_have_no_instance_dict():
+    content = Content("text")
+    section = Section("Title")
+
+    assert not hasattr(content, "__dict__")
+    assert not hasattr(section, "__dict__")
+    with pytest.raises(AttributeError):
+        content.extra = 1
+
+
+def test_tree_api():
+    section = Section("Title", level=2)
+    content = Content("first")
+    section.add_content(content)
+    content.set_text("changed")
+
+    document = Document("Doc")
+    document.add_section(section)
+
+    assert section.get_contents()[0].get_text() == "changed"
+    assert section.get_level() == 2
+    assert document.get_sections() == [section]
+    assert "Title: Title" in repr(document)
+
+    with pytest.raises(ValueError):
+        Content("")
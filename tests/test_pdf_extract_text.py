@@ -0,0 +1,55 @@
+import types
+
+from pdf.extract_text import (
+    PAGE_SEPARATOR,
+    extract_only_text_from_pdf,
+    extract_only_text_by_pages,
+    iter_pdf_pages,
+    postprocess_page_with_newlines,
+    split_page_ranges,
+)
+from text_processing.normalizer import RawTextNormalizer
+
+
+def test_split_page_ranges():
+    assert split_page_ranges(10, 3) == [range(0, 4), range(4, 7), range(7, 10)]
+    assert split_page_ranges(2, 8) == [range(0, 1), range(1, 2)]
+    assert split_page_ranges(0, 4) == []
+
+
+def test_extract_by_pages_parallel_matches_serial(sample_pdf):
+    serial = extract_only_text_by_pages(sample_pdf)
+    parallel = extract_only_text_by_pages(sample_pdf, workers=2)
+
+    assert list(parallel) == list(range(1, 10))
+    assert parallel == serial
+    assert serial[1].startswith("Section 1")
+
+
+def test_extract_full_text_parallel_matches_serial(sample_pdf):
+    serial = extract_only_text_from_pdf(sample_pdf)
+    parallel = extract_only_text_from_pdf(sample_pdf, workers=3)
+
+    assert parallel == serial
+    assert serial.count("\n######################\n") == 9
+
+
+def test_iter_pdf_pages_is_lazy_and_matches_full_text(sample_pdf):
+    pages = iter_pdf_pages(sample_pdf, postprocess_page_with_newlines)
+    assert isinstance(pages, types.GeneratorType)
+
+    page_no, first = next(pages)
+    assert page_no == 1 and first.startswith("Section 1")
+
+    texts = [first] + [text for _, text in pages]
+    assert "".join(t + PAGE_SEPARATOR for t in texts) == extract_only_text_from_pdf(
+        sample_pdf
+    )
+
+
+def test_normalize_pages_streams_page_numbers(sample_pdf):
+    normalizer = RawTextNormalizer()
+    by_pages = extract_only_text_by_pages(sample_pdf)
+
+    for page_no, text in normalizer.normalize_pages(iter_pdf_pages(sample_pdf)):
+        assert text == normalizer.normalize(by_pages[page_no][:-1])
@@ -0,0 +1,105 @@
+import pytest
+
+from pdf.classes.Content import Content
+from pdf.classes.Document import Document
+from pdf.classes.LazyDocument import LazyDocument
+from pdf.classes.Section import Section
+from pdf.index import InvertedIndex
+
+
+def make_document(*sections):
+    document = Document()
+    for title, lines in sections:
+        section = Section(title)
+        for line in lines:
+            section.add_content(Content(line))
+        document.add_section(section)
+    return document
+
+
+@pytest.fixture
+def index():
+    index = InvertedIndex()
+    index.add_document(
+        "contract",
+        make_document(
+            ("Глава1. Срок действия", ["Договор действует до 2025 года.", "Ёлки"]),
+            ("PartIVPayment", ["Payment terms are strict", "terms payment"]),
+        ),
+    )
+    return index
+
+
+def test_word_and_normalized_tokens(index):
+    hits = index.search("глава")
+    assert [(h.section, h.block) for h in hits] == [(0, 0)]
+    # цифры отделяются от слов, ё == е, римские числа отделяются
+    assert index.search("1")[0].section_title == "Глава1. Срок действия"
+    assert index.search("елки")[0].text == "Ёлки"
+    assert index.search("iv")[0].section == 1
+
+
+def test_phrase_query(index):
+    assert [h.block for h in index.search('"payment terms"')] == [1]
+    assert [h.block for h in index.search('"terms payment"')] == [2]
+    assert index.search('"срок договор"') == []
+
+
+def test_prefix_and_conjunction(index):
+    assert {h.block for h in index.search("pay*")} == {0, 1, 2}
+    assert [h.block for h in index.search("pay* strict")] == [1]
+    assert [h.section for h in index.search("догов*")] == [0]
+
+
+def test_prefix_is_tokenized_like_text(index):
+    # "Глава1" проиндексировано как "глава", "1"
+    assert [(h.section, h.block) for h in index.search("глава1*")] == [(0, 0)]
+    assert [h.section for h in index.search("PartIVpay*")] == [1]
+    assert index.search("глава2*") == []
+    assert index.search("*") == []
+
+
+def test_incremental_update(index):
+    assert index.search("invoice") == []
+    index.add_document("other", make_document(("Invoice", ["payment due"])))
+    assert [h.doc_id for h in index.search("invoice")] == ["other"]
+    assert {h.doc_id for h in index.search("paym*")} == {"contract", "other"}
+    assert len(index) == 2
+
+    with pytest.raises(ValueError):
+        index.add_document("other", Document())
+
+
+def test_pages_of_lazy_document(sample_pdf):
+    index = InvertedIndex()
+    index.add_document("sample", LazyDocument(sample_pdf))
+    hits = index.search('"section 7"')
+    assert [(h.page, h.section, h.block) for h in hits] == [(7, 6, 0)]
+
+
+def test_added_sections_of_lazy_document(sample_pdf):
+    document = LazyDocument(sample_pdf)
+    appendix = Section("Appendix")
+    appendix.add_content(Content("extra notes"))
+    document.add_section(appendix)
+
+    index = InvertedIndex()
+    index.add_document("sample", document)
+    hits = index.search("notes")
+    assert [(h.page, h.section_title, h.block) for h in hits] == [(0, "Appendix", 1)]
+    assert document.added_sections() == [appendix]
+    document.get_sections()
+    assert document.added_sections() == [appendix]
+
+
+def test_save_and_load(index, tmp_path):
+    path = tmp_path / "index.json"
+    index.save(path)
+    loaded = InvertedIndex.load(path)
+
+    for query in ("глава", '"payment terms"', "pay*", "елки"):
+        assert [repr(h) for h in loaded.search(query)] == [
+            repr(h) for h in index.search(query)
+        ]
+    loaded.add_document("more", make_document(("Extra", ["payment"])))
+    assert len(loaded.search("payment")) == 4
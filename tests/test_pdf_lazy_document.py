@@ -0,0 +1,61 @@
+import pytest
+
+from pdf.cache import ExtractionCache
+from pdf.classes.LazyDocument import LazyDocument
+from pdf.classes.Section import Section
+from pdf.extract_text import postprocess_page_with_newlines
+
+
+class CountingPostprocess:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, raw_text):
+        self.calls += 1
+        return postprocess_page_with_newlines(raw_text)
+
+
+def test_page_is_parsed_on_first_access_only(sample_pdf):
+    postprocess = CountingPostprocess()
+    document = LazyDocument(sample_pdf, postprocess=postprocess)
+
+    assert document.pages_count == 9
+    assert postprocess.calls == 0
+
+    sections = document.get_page(5)
+    assert [section.get_title() for section in sections] == ["Section 5"]
+    assert sections[0].get_contents()
+    assert document.get_page(5) is sections
+    assert postprocess.calls == 1
+    assert document.loaded_pages() == [5]
+
+
+def test_get_sections_loads_all_pages_in_order(sample_pdf):
+    document = LazyDocument(sample_pdf)
+    document.get_page(7)
+    extra = Section("Appendix")
+    document.add_section(extra)
+
+    titles = [section.get_title() for section in document.get_sections()]
+    assert titles == [f"Section {i}" for i in range(1, 10)] + ["Appendix"]
+    assert len(document.get_sections()) == 10
+    assert repr(document).startswith("Document(sample.pdf)")
+
+
+def test_page_contents_are_normalized(sample_pdf):
+    document = LazyDocument(sample_pdf, normalize=str.upper)
+    texts = [content.get_text() for content in document.get_page(1)[0].get_contents()]
+    assert texts and all(text == text.upper() for text in texts)
+
+
+def test_page_out_of_range(sample_pdf):
+    with pytest.raises(IndexError):
+        LazyDocument(sample_pdf).get_page(10)
+
+
+def test_pages_come_from_extraction_cache(sample_pdf, tmp_path):
+    with ExtractionCache(tmp_path / "cache.db") as cache:
+        first = LazyDocument(sample_pdf, cache=cache).get_page(2)
+        second = LazyDocument(sample_pdf, cache=cache).get_page(2)
+        assert cache.hits == 1
+        assert repr(first) == repr(second)
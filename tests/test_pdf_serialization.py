@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from pdf.classes.Content import Content
+from pdf.classes.Document import Document
+from pdf.classes.LazyDocument import LazyDocument
+from pdf.classes.Section import Section
+from pdf.serialization import (
+    DocumentWriter,
+    MappedDocument,
+    document_to_dict,
+    export_json,
+    read_document,
+    write_document,
+)
+
+
+def make_document():
+    document = Document("Договор №1")
+    intro = Section("Введение")
+    intro.add_content(Content("первая строка"))
+    nested = Section("Пункт 1.1", level=2)
+    nested.add_content(Content("вложенный текст ✓"))
+    intro.add_content(nested)
+    intro.add_content(Content("последняя строка"))
+    document.add_sections([intro, Section("Пустая секция")])
+    return document
+
+
+def test_roundtrip(tmp_path):
+    document = make_document()
+    path = tmp_path / "doc.bin"
+    write_document(document, path)
+
+    loaded = read_document(path)
+    assert repr(loaded) == repr(document)
+    assert document_to_dict(loaded) == document_to_dict(document)
+
+
+def test_mapped_document_random_access(tmp_path):
+    document = make_document()
+    path = tmp_path / "doc.bin"
+    write_document(document, path)
+
+    with MappedDocument(path) as mapped:
+        assert mapped.title == "Договор №1"
+        assert len(mapped) == 2
+        assert mapped.get_section(1).get_title() == "Пустая секция"
+        assert [repr(s) for s in mapped.iter_sections()] == [
+            repr(s) for s in document.get_sections()
+        ]
+        with pytest.raises(IndexError):
+            mapped.get_section(2)
+
+
+def test_streaming_write_from_lazy_document(sample_pdf, tmp_path):
+    lazy = LazyDocument(sample_pdf)
+    path = tmp_path / "doc.bin"
+    with DocumentWriter(path, lazy.get_title()) as writer:
+        for section in lazy.iter_sections():
+            writer.add_section(section)
+
+    assert repr(read_document(path)) == repr(LazyDocument(sample_pdf))
+
+
+def test_json_export(tmp_path):
+    path = tmp_path / "doc.json"
+    export_json(make_document(), path)
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["title"] == "Договор №1"
+    intro = data["sections"][0]
+    assert intro["contents"][1] == {
+        "title": "Пункт 1.1",
+        "level": 2,
+        "contents": ["вложенный текст ✓"],
+    }
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a document" * 10)
+    with pytest.raises(ValueError):
+        read_document(path)
+
+
+def test_mapped_document_closes_file_on_error(tmp_path, monkeypatch):
+    opened = []
+    real_open = open
+
+    def tracking_open(*args, **kwargs):
+        opened.append(real_open(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr("builtins.open", tracking_open)
+    for data in (b"not a document" * 10, b""):
+        path = tmp_path / "other.bin"
+        path.write_bytes(data)
+        with pytest.raises(ValueError):
+            MappedDocument(path)
+    assert opened and all(file.closed for file in opened)
@@ -0,0 +1,17 @@
+from pdf.text_transformation import RawTextHandler
+
+
+def test_get_checker_loads_dictionary_once():
+    assert RawTextHandler.get_checker("en") is RawTextHandler.get_checker("en")
+
+
+def test_correct_words_returns_only_changes():
+    corrections = RawTextHandler.correct_words(["smple", "test", "тест", "123"])
+    assert corrections == {"smple": "simple"}
+
+
+def test_spell_check_text_rebuilds_in_one_pass():
+    text = "a smple test, smple again\nand 123 тест"
+    assert RawTextHandler.spell_check_text(text) == (
+        "a simple test, simple again\nand 123 тест"
+    )
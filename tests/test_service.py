@@ -0,0 +1,98 @@
+import asyncio
+import time
+
+import pytest
+
+from pdf.extract_text import extract_only_text_from_pdf
+import service
+from service import AsyncProcessor, ServiceOverloaded
+from text_processing.normalizer import RawTextNormalizer
+
+
+TEXT = "Глава1  текст ,  пере-\nнос\n\n\nChapterIVisHere"
+
+
+def test_results_match_blocking_api(sample_pdf):
+    async def scenario():
+        async with AsyncProcessor(workers=2, pages_per_task=2) as processor:
+            return await asyncio.gather(
+                processor.extract_async(sample_pdf),
+                processor.normalize_async(TEXT),
+            )
+
+    extracted, normalized = asyncio.run(scenario())
+    assert extracted == extract_only_text_from_pdf(sample_pdf)
+    assert normalized == RawTextNormalizer().normalize(TEXT)
+
+
+def test_event_loop_stays_responsive_under_load(sample_pdf):
+    async def scenario():
+        async with AsyncProcessor(workers=2, pages_per_task=1) as processor:
+            lag = 0.0
+
+            async def ticker():
+                nonlocal lag
+                while True:
+                    start = time.perf_counter()
+                    await asyncio.sleep(0.001)
+                    lag = max(lag, time.perf_counter() - start)
+
+            tick = asyncio.create_task(ticker())
+            requests = [processor.extract_async(sample_pdf) for _ in range(4)]
+            requests += [processor.normalize_async(TEXT * 50) for _ in range(20)]
+            results = await asyncio.gather(*requests)
+            tick.cancel()
+            return results, lag, processor.info()
+
+    results, lag, info = asyncio.run(scenario())
+    assert len(results) == 24
+    assert info["completed"] == 24
+    assert lag < 0.5
+
+
+def test_backpressure_rejects_excess_requests():
+    async def scenario():
+        async with AsyncProcessor(max_concurrency=1, max_pending=2) as processor:
+            tasks = [
+                asyncio.create_task(processor.normalize_async(TEXT)) for _ in range(5)
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            return results, processor.info()
+
+    results, info = asyncio.run(scenario())
+    rejected = [r for r in results if isinstance(r, ServiceOverloaded)]
+    assert len(rejected) == info["rejected"] == 2
+    assert info["completed"] == 3
+
+
+def test_cancellation_stops_pdf_extraction(sample_pdf):
+    async def scenario():
+        async with AsyncProcessor(pages_per_task=1) as processor:
+            task = asyncio.create_task(processor.extract_async(sample_pdf))
+            # запрос успевает отправить в пул первую задачу и ждет ее
+            await asyncio.sleep(0)
+            assert processor.running == 1
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            # пул свободен для следующих запросов
+            result = await processor.normalize_async(TEXT)
+            return result, processor.info()
+
+    result, info = asyncio.run(scenario())
+    assert result == RawTextNormalizer().normalize(TEXT)
+    assert info["cancelled"] == 1
+    assert info["running"] == 0
+
+
+def test_default_processor_works_across_event_loops():
+    async def scenario():
+        # запросов больше max_concurrency: часть ждет семафор
+        return await asyncio.gather(*(service.normalize_async(TEXT) for _ in range(6)))
+
+    expected = RawTextNormalizer().normalize(TEXT)
+    try:
+        for _ in range(2):
+            assert asyncio.run(scenario()) == [expected] * 6
+    finally:
+        asyncio.run(service.shutdown_default())
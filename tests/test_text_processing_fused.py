@@ -0,0 +1,85 @@
+import random
+
+import pytest
+
+from benchmarks.corpus import make_ocr_text
+from text_processing.constants import MULTI_NEWLINE_RE
+from text_processing.fused import FusedNormalizer
+from text_processing.lines import LineJoiner
+from text_processing.normalizer import RawTextNormalizer
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        " ",
+        "\n\n\n",
+        "Hello , world !",
+        "This  is  a         test . ",
+        "Hello.  ,world",
+        "abc123def ,  тест456тест !",
+        "Page 12\n\n\n13 is next.",
+        "This is a test-\ncase for line-\n\njoining.",
+        "ChapterIVisHere and SectionXIIandMore",
+        "a \t b\r\n  c\xa0\xa0, d",
+        "Ivanov I.\nv. is important.",
+        "  Indented line  \n continues here. ",
+    ],
+)
+def test_fused_matches_sequential(text):
+    assert FusedNormalizer.normalize(text) == RawTextNormalizer().normalize(text)
+
+
+def test_fused_matches_sequential_random():
+    alphabet = list("abcXIVMивЁ129 \n\t\r.,:;!?\"')]}%-(«") + ["  ", " .", "IV", "\xa0"]
+    rng = random.Random(0)
+    sequential = RawTextNormalizer()
+    fused = RawTextNormalizer(fused=True)
+
+    for _ in range(5000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert fused.normalize(text) == sequential.normalize(text), repr(text)
+
+
+def test_fused_matches_sequential_corpus():
+    text = make_ocr_text(50_000, seed=1)
+    assert FusedNormalizer.normalize(text) == RawTextNormalizer().normalize(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "\n", "\n\n", "\n\na", "a\n\n", "a\n\n\nb\n\nc", "a-\n\n\nb", "x\n \n\ny"],
+)
+def test_line_joiner_collapse_newlines(text):
+    expected = LineJoiner.join(MULTI_NEWLINE_RE.sub("\n", text))
+    assert LineJoiner.join(text, collapse_newlines=True) == expected
+
+
+def test_line_joiner_long_paragraph_is_linear(monkeypatch):
+    # Раньше каждая склейка копировала весь абзац и искала аббревиатуру по нему.
+    # Считаем символы, переданные регулярному выражению, а не время
+    class CountingRegex:
+        def __init__(self, regex):
+            self.regex = regex
+            self.examined = 0
+
+        def search(self, string, pos=0):
+            self.examined += len(string)
+            return self.regex.search(string, pos)
+
+    def examined(lines):
+        counter = CountingRegex(LineJoiner.ABBREVIATION_RE)
+        monkeypatch.setattr(LineJoiner, "ABBREVIATION_RE", counter)
+        text = "\n".join(["word and more words"] * lines)
+        joined = LineJoiner.join(text)
+        monkeypatch.undo()
+        assert "\n" not in joined
+        assert len(joined) == len(text)
+        return counter.examined
+
+    # в 4 раза больше строк: линейно x4, квадратично ~x16
+    small = examined(1_000)
+    large = examined(4_000)
+    assert 0 < small
+    assert large <= 4 * small + 100
@@ -0,0 +1,107 @@
+import pytest
+
+from benchmarks.corpus import make_ocr_text, make_paragraphs
+from text_processing.incremental import (
+    IncrementalNormalizer,
+    IncrementalStats,
+    MemoryParagraphStore,
+    ParagraphStore,
+    SqliteParagraphStore,
+)
+from text_processing.normalizer import RawTextNormalizer
+from text_processing.spelling import SpellCheckerService
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_incremental_matches_normalize(fused):
+    normalizer = RawTextNormalizer(fused=fused)
+    incremental = IncrementalNormalizer(normalizer)
+    for seed in range(5):
+        text = make_ocr_text(8000, seed=seed)
+        assert incremental.normalize(text) == normalizer.normalize(text)
+    for text in ["", "  a\n  ,b\n\n c  ", "ChapterIV\nII текст1\n. x"]:
+        assert incremental.normalize(text) == normalizer.normalize(text)
+
+
+def test_only_changed_paragraphs_are_recomputed():
+    paragraphs = make_paragraphs(20, words=24)
+    incremental = IncrementalNormalizer()
+    first = IncrementalStats()
+    incremental.normalize("\n\n".join(paragraphs), first)
+    assert first.reused == 0 and first.paragraphs == 40  # заголовок + текст
+
+    paragraphs[3] += " дополнение"
+    paragraphs[7] += " addition"
+    stats = IncrementalStats()
+    edited = "\n\n".join(paragraphs)
+    result = incremental.normalize(edited, stats)
+
+    assert result == RawTextNormalizer().normalize(edited)
+    assert stats.recomputed == 2
+    assert stats.reuse_ratio == pytest.approx(38 / 40)
+    assert incremental.stats.documents == 0  # stats передан явно
+
+
+def test_sqlite_store_survives_restart(tmp_path):
+    text = make_ocr_text(4000)
+    path = tmp_path / "paragraphs.db"
+    with SqliteParagraphStore(path) as store:
+        expected = IncrementalNormalizer(store=store).normalize(text)
+        assert len(store) > 0
+
+    with SqliteParagraphStore(path) as store:
+        incremental = IncrementalNormalizer(store=store)
+        assert incremental.normalize(text) == expected
+        assert incremental.stats.reuse_ratio == 1.0
+
+
+def test_store_keys_depend_on_pipeline():
+    store = MemoryParagraphStore()
+    text = "Глава1 текст ,здесь"
+    IncrementalNormalizer(RawTextNormalizer(), store).normalize(text)
+
+    other = IncrementalNormalizer(
+        RawTextNormalizer(stages=["MultiNewline", "LineJoiner"]), store
+    )
+    assert other.normalize(text) == text
+    assert other.stats.reused == 0
+
+
+def test_store_keys_depend_on_stage_functions():
+    store = MemoryParagraphStore()
+    text = "hello world"
+    upper = IncrementalNormalizer(
+        RawTextNormalizer(stages=[("Case", str.upper)]), store
+    )
+    lower = IncrementalNormalizer(
+        RawTextNormalizer(stages=[("Case", str.lower)]), store
+    )
+    assert upper.normalize(text) == "HELLO WORLD"
+    assert lower.normalize(text) == "hello world"
+    assert lower.stats.reused == 0
+
+
+def test_store_keys_depend_on_spellcheck_settings():
+    indexed = RawTextNormalizer(stages=[("Spell", SpellCheckerService().correct)])
+    plain = RawTextNormalizer(
+        stages=[("Spell", SpellCheckerService(use_index=False).correct)]
+    )
+    key = IncrementalNormalizer(indexed)._key("текст")
+    assert key != IncrementalNormalizer(plain)._key("текст")
+
+
+def test_memory_store_lru():
+    store = MemoryParagraphStore(maxsize=2)
+    store.put_many({"a": "1", "b": "2"})
+    assert store.get_many(["a"]) == {"a": "1"}
+    store.put_many({"c": "3"})
+    assert store.get_many(["a", "b", "c"]) == {"a": "1", "c": "3"}
+
+
+def test_store_interface_is_abstract():
+    class Incomplete(ParagraphStore):
+        def get_many(self, keys):
+            return {}
+
+    with pytest.raises(TypeError):
+        Incomplete()
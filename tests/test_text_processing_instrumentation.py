@@ -0,0 +1,71 @@
+import cProfile
+import pstats
+from contextlib import contextmanager
+
+from text_processing.instrumentation import Instrumentation, profile_stage
+from text_processing.normalizer import RawTextNormalizer
+
+
+TEXT = "Hello , world123\n\n\nChapterIVisHere  text-\nwrapped"
+
+
+def test_normalize_without_instrumentation_has_no_stats():
+    normalizer = RawTextNormalizer()
+    assert normalizer.instrumentation is None
+    assert (
+        normalizer.normalize(TEXT) == "Hello, world 123\nChapter IV isHere textwrapped"
+    )
+
+
+def test_instrumentation_records_every_stage():
+    instrumentation = Instrumentation()
+    normalizer = RawTextNormalizer(instrumentation=instrumentation)
+
+    result = normalizer.normalize(TEXT)
+    normalizer.normalize(TEXT)
+
+    assert result == RawTextNormalizer().normalize(TEXT)
+    report = instrumentation.report()
+    assert list(report) == normalizer.stage_names
+    assert all(stats["calls"] == 2 for stats in report.values())
+    assert report["MultiNewline"]["input_size"] == 2 * len(TEXT)
+    assert report["RomanNumeralSeparator"]["output_size"] == 2 * len(result)
+
+    instrumentation.reset()
+    assert instrumentation.report() == {}
+
+
+def test_instrumentation_callbacks_and_wrappers():
+    events = []
+    entered = []
+
+    @contextmanager
+    def wrapper(stage):
+        entered.append(stage)
+        yield
+
+    instrumentation = Instrumentation(callbacks=[events.append], wrappers=[wrapper])
+    normalizer = RawTextNormalizer(fused=True, instrumentation=instrumentation)
+    normalizer.normalize(TEXT)
+
+    fused_stages = [
+        "MultiNewline+LineJoiner",
+        "SpacingNormalizer+NumberWordSeparator",
+        "RomanNumeralSeparator",
+    ]
+    assert entered == fused_stages
+    assert [event.stage for event in events] == fused_stages
+    assert events[0].input_size == len(TEXT)
+    assert events[0].seconds >= 0
+
+
+def test_profile_single_stage():
+    profiler = cProfile.Profile()
+    instrumentation = Instrumentation(
+        wrappers=[profile_stage("RomanNumeralSeparator", profiler)]
+    )
+    RawTextNormalizer(instrumentation=instrumentation).normalize(TEXT)
+
+    functions = {name for _, _, name in pstats.Stats(profiler).stats}
+    assert "separate" in functions
+    assert "join" not in functions
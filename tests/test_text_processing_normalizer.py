@@ -0,0 +1,91 @@
+import concurrent.futures
+import multiprocessing
+import subprocess
+import sys
+from functools import partial
+from itertools import count, islice
+from pathlib import Path
+
+import pytest
+
+from text_processing.normalizer import BatchStats, RawTextNormalizer
+from text_processing.pipeline import PipelineBuilder
+
+
+DOCS = [f"Doc{i} ,  text  line-\nwrapped  ChapterIVisHere" for i in range(25)]
+
+
+def test_normalize_many_serial_matches_normalize():
+    normalizer = RawTextNormalizer()
+    stats = BatchStats()
+    results = list(normalizer.normalize_many(DOCS, stats=stats))
+
+    assert results == [normalizer.normalize(doc) for doc in DOCS]
+    assert stats.documents == len(DOCS)
+    assert stats.characters == sum(map(len, DOCS))
+
+
+def test_normalize_many_parallel_keeps_order():
+    normalizer = RawTextNormalizer(fused=True)
+    stats = BatchStats()
+    results = list(normalizer.normalize_many(DOCS, workers=2, chunksize=3, stats=stats))
+
+    assert results == [normalizer.normalize(doc) for doc in DOCS]
+    assert stats.documents == len(DOCS)
+    assert stats.docs_per_sec > 0
+
+
+def test_normalize_many_reads_input_lazily():
+    docs = (f"doc{i}" for i in count())
+    results = RawTextNormalizer().normalize_many(docs, workers=2, chunksize=2)
+    assert list(islice(results, 3)) == ["doc 0", "doc 1", "doc 2"]
+    results.close()
+
+
+def test_normalize_many_rejects_unpicklable_stages():
+    normalizer = RawTextNormalizer(stages=[("Lower", lambda text: text.lower())])
+    with pytest.raises(ValueError, match="pickle"):
+        list(normalizer.normalize_many(DOCS, workers=2))
+    # в одном процессе pickle не нужен
+    assert list(normalizer.normalize_many(DOCS[:1])) == [DOCS[0].lower()]
+
+
+def test_normalize_many_registered_stage_in_spawned_workers(monkeypatch):
+    spawn = partial(
+        concurrent.futures.ProcessPoolExecutor,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", spawn)
+    PipelineBuilder.register("TestUpper", lambda: str.upper)
+    try:
+        normalizer = RawTextNormalizer(stages=["LineJoiner", "TestUpper"])
+        results = list(normalizer.normalize_many(DOCS, workers=2, chunksize=5))
+    finally:
+        PipelineBuilder.unregister("TestUpper")
+    assert results == [normalizer.normalize(doc) for doc in DOCS]
+
+
+def test_import_does_not_load_heavy_modules():
+    code = (
+        "import sys\n"
+        "from text_processing.normalizer import RawTextNormalizer\n"
+        "RawTextNormalizer().normalize('Глава1 текст')\n"
+        "heavy = ('spellchecker', 'text_processing.spelling', 'multiprocessing')\n"
+        "print(sorted(m for m in heavy if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_stages_property_is_a_copy():
+    normalizer = RawTextNormalizer()
+    stages = normalizer.stages
+    assert [name for name, _ in stages] == normalizer.stage_names
+    stages.clear()
+    assert normalizer.normalize("abc123") == "abc 123"
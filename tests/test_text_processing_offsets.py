@@ -0,0 +1,72 @@
+import random
+import re
+
+import pytest
+
+from benchmarks.corpus import make_ocr_text
+from text_processing.normalizer import RawTextNormalizer
+from text_processing.offsets import OffsetMap
+
+
+def assert_maps_back(raw, text, offsets):
+    """Монотонная карта, непробельные символы указывают на те же символы"""
+    assert len(offsets) == len(text)
+    assert offsets.source_length == len(raw)
+    positions = list(offsets.positions)
+    assert positions == sorted(positions)
+    for i, char in enumerate(text):
+        if not char.isspace():
+            assert raw[offsets[i]] == char, (i, char)
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_offsets_match_normalize(fused):
+    normalizer = RawTextNormalizer(fused=fused)
+    texts = [make_ocr_text(8000, seed=seed) for seed in range(3)]
+    rng = random.Random(0)
+    texts += [
+        "".join(rng.choice("ab1 \n-,.IVX(") for _ in range(rng.randrange(30)))
+        for _ in range(500)
+    ]
+    for raw in texts:
+        text, offsets = normalizer.normalize_with_offsets(raw)
+        assert text == normalizer.normalize(raw)
+        assert_maps_back(raw, text, offsets)
+
+
+def test_span_of_joined_and_separated_words():
+    raw = "  Глава1 дого-\nвор ,ChapterIVisHere"
+    text, offsets = RawTextNormalizer().normalize_with_offsets(raw)
+    assert text == "Глава 1 договор,Chapter IV isHere"
+
+    start = text.index("договор")
+    assert offsets.span(start, start + len("договор")) == (
+        raw.index("дого"),
+        raw.index("вор") + 3,
+    )
+    # вставленный пробел указывает на следующий исходный символ
+    assert raw[offsets[text.index(" 1")]] == "1"
+    assert offsets.span(3, 3) == (offsets[3], offsets[3])
+
+
+def test_offsets_with_spellcheck():
+    raw = "Догвор  вступаит\nв силу. The contrct ,is"
+    normalizer = RawTextNormalizer(enable_spellcheck=True)
+    text, offsets = normalizer.normalize_with_offsets(raw)
+    assert text == normalizer.normalize(raw)
+    assert text.startswith("Договор ")
+    # исправленное слово целиком соответствует слову с опечаткой
+    source_words = [m.span() for m in re.finditer(r"\w+", raw)]
+    words = [offsets.span(*m.span()) for m in re.finditer(r"\w+", text)]
+    assert words == source_words
+
+
+def test_identity_and_custom_stage():
+    offsets = OffsetMap.identity(3)
+    assert list(offsets.positions) == [0, 1, 2, 3]
+    assert list(offsets.follow("abc", "ab c").positions) == [0, 1, 2, 2, 3]
+
+    normalizer = RawTextNormalizer(stages=[("Upper", str.upper)])
+    text, offsets = normalizer.normalize_with_offsets("ab, cd")
+    assert text == "AB, CD"
+    assert len(offsets) == len(text) and offsets.source_length == 6
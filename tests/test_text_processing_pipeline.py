@@ -0,0 +1,118 @@
+import random
+
+import pytest
+
+from text_processing.fused import FusedNormalizer
+from text_processing.normalizer import RawTextNormalizer
+from text_processing.numbers import NumberWordSeparator
+from text_processing.pipeline import PipelineBuilder
+from text_processing.spacing import SpacingNormalizer
+
+
+TEXT = "Hello , world123\n\n\nChapterIVisHere  text-\nwrapped"
+
+
+def test_default_pipeline_matches_normalizer():
+    pipeline = PipelineBuilder().build(fuse=False)
+    assert pipeline.names == list(PipelineBuilder.DEFAULT_STAGES)
+    assert pipeline(TEXT) == RawTextNormalizer().normalize(TEXT)
+
+
+def test_fusion_merges_adjacent_stages():
+    pipeline = PipelineBuilder().build()
+    assert pipeline.names == [
+        "MultiNewline+LineJoiner",
+        "SpacingNormalizer+NumberWordSeparator",
+        "RomanNumeralSeparator",
+    ]
+    assert pipeline(TEXT) == RawTextNormalizer().normalize(TEXT)
+
+
+def test_fusion_requires_adjacent_default_stages():
+    reordered = PipelineBuilder().order(
+        ["LineJoiner", "MultiNewline", "NumberWordSeparator", "SpacingNormalizer"]
+    )
+    assert reordered.build().names == reordered.names
+
+    custom = PipelineBuilder().add("SpacingNormalizer", str.strip)
+    assert "SpacingNormalizer+NumberWordSeparator" not in custom.build().names
+
+
+def test_remove_and_custom_stages():
+    pipeline = (
+        PipelineBuilder()
+        .remove("RomanNumeralSeparator")
+        .add("Upper", str.upper)
+        .add("Mark", lambda text: f"<{text}>", position=0)
+        .build()
+    )
+    assert pipeline.names[0] == "Mark"
+    assert pipeline.names[-1] == "Upper"
+    assert pipeline("ChapterIVisHere") == "<CHAPTERIVISHERE>"
+
+
+def test_registered_stage_factory_is_called_only_when_selected():
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return str.lower
+
+    PipelineBuilder.register("TestLower", factory)
+    try:
+        PipelineBuilder().build()
+        assert calls == []
+
+        pipeline = PipelineBuilder(["TestLower"]).build()
+        assert calls == [1]
+        assert pipeline("ABC") == "abc"
+    finally:
+        PipelineBuilder.unregister("TestLower")
+
+    assert "TestLower" not in PipelineBuilder.available_stages()
+    with pytest.raises(ValueError):
+        PipelineBuilder.unregister("TestLower")
+
+
+def test_unknown_stage_raises():
+    with pytest.raises(ValueError):
+        PipelineBuilder(["NoSuchStage"])
+    with pytest.raises(ValueError):
+        PipelineBuilder().remove("SpellCheckerService")
+
+
+def test_normalizer_stage_selection():
+    normalizer = RawTextNormalizer(stages=["MultiNewline", "LineJoiner"], fused=True)
+    assert normalizer.stage_names == ["MultiNewline+LineJoiner"]
+    assert normalizer.normalize("a\n\n\nb-\nc") == "a bc"
+
+
+def test_spacing_and_numbers_fusion_on_arbitrary_text():
+    alphabet = list("aXiвЁ19 \n\t\r.,:;!?\"')]}%-(«") + ["  ", "\xa0", "\n\n"]
+    rng = random.Random(1)
+    for _ in range(5000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 25)))
+        expected = NumberWordSeparator.separate(
+            SpacingNormalizer.remove_extra_spaces(text)
+        )
+        assert FusedNormalizer.spacing_and_numbers(text) == expected, repr(text)
+
+
+def test_overridden_builtin_stage_is_not_fused():
+    PipelineBuilder.register("SpacingNormalizer", lambda: str.upper)
+    try:
+        text = "abc  , d"
+        assert PipelineBuilder().build(fuse=False)(text) == "ABC  , D"
+        assert PipelineBuilder().build(fuse=True)(text) == "ABC  , D"
+        assert RawTextNormalizer(fused=True).normalize(text) == "ABC  , D"
+        assert "SpacingNormalizer" in RawTextNormalizer(fused=True).stage_names
+    finally:
+        PipelineBuilder.unregister("SpacingNormalizer")
+
+    # unregister вернул встроенный этап, слияние снова работает
+    assert RawTextNormalizer(fused=True).normalize("abc  , d") == "abc, d"
+    assert "SpacingNormalizer+NumberWordSeparator" in (
+        RawTextNormalizer(fused=True).stage_names
+    )
+    with pytest.raises(ValueError):
+        PipelineBuilder.unregister("SpacingNormalizer")
@@ -0,0 +1,64 @@
+import random
+
+import itertools
+
+from benchmarks.legacy import (
+    legacy_is_valid_roman,
+    legacy_remove_extra_spaces,
+    legacy_separate_numbers,
+    legacy_separate_roman,
+)
+from text_processing.numbers import NumberWordSeparator
+from text_processing.roman import RomanNumeralSeparator
+from text_processing.spacing import SpacingNormalizer
+
+
+ALPHABET = list("aBzЖёIVXLCDMivx19 \t\n.,;!?)%-") + ["  ", "\xa0"]
+
+
+def random_texts(count=5000, seed=3):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 20)))
+
+
+def test_stages_match_previous_behaviour():
+    for text in random_texts():
+        assert NumberWordSeparator.separate(text) == legacy_separate_numbers(text)
+        assert SpacingNormalizer.remove_extra_spaces(
+            text
+        ) == legacy_remove_extra_spaces(text)
+        assert RomanNumeralSeparator.separate(text) == legacy_separate_roman(text)
+
+
+def test_clean_text_is_returned_unchanged():
+    clean = "Section 1. Payment of 100 USD, see Chapter IV and XIV (MIX). Готово!"
+    for stage in (
+        NumberWordSeparator.separate,
+        SpacingNormalizer.remove_extra_spaces,
+        RomanNumeralSeparator.separate,
+    ):
+        assert stage(clean) is clean
+
+
+def test_invalid_roman_match_does_not_copy():
+    text = "SomeIIIIthing"
+    assert RomanNumeralSeparator.separate(text) is text
+    assert RomanNumeralSeparator.separate("ChapterIVisHere") == "Chapter IV isHere"
+
+
+def test_roman_scanner_matches_regex_on_dense_input():
+    rng = random.Random(7)
+    alphabet = list("IVXLCDMIIXXaiМ -")
+    for _ in range(20000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 14)))
+        assert RomanNumeralSeparator.separate(text) == legacy_separate_roman(text)
+
+
+def test_valid_numerals_table_matches_legacy_validation():
+    for length in range(1, 7):
+        for chars in itertools.product("IVXLCDM", repeat=length):
+            value = "".join(chars)
+            valid = value in RomanNumeralSeparator.VALID_NUMERALS
+            assert valid == legacy_is_valid_roman(value), value
+    assert len(RomanNumeralSeparator.VALID_NUMERALS) == 3999
@@ -0,0 +1,76 @@
+import pytest
+
+from text_processing.spelling import (
+    CorrectionCache,
+    ScriptClassifier,
+    SpellCheckerService,
+)
+
+
+@pytest.fixture(scope="module")
+def spell_service():
+    return SpellCheckerService(cache_size=100)
+
+
+def test_correction_cache_lru_eviction():
+    cache = CorrectionCache(maxsize=2)
+    cache.put("a", "x")
+    cache.put("b", None)
+    assert cache.get("a") == "x"  # "a" становится самым свежим
+    cache.put("c", "z")
+
+    assert cache.get("b") is CorrectionCache._MISSING
+    assert cache.get("c") == "z"
+    assert cache.info() == {"hits": 2, "misses": 1, "size": 2, "maxsize": 2}
+
+
+def test_correction_cache_disabled():
+    cache = CorrectionCache(maxsize=0)
+    cache.put("a", "x")
+    assert len(cache) == 0
+
+
+def test_spellchecker_cache_hits_on_repeated_words():
+    # свой сервис: общий фикстурный кэш зависит от порядка тестов
+    spell_service = SpellCheckerService(cache_size=100)
+    text = "Ths smple tst. Ths smple tst."
+    first = spell_service.correct(text)
+    info = spell_service.cache_info()["en"]
+
+    assert info["misses"] == 3
+    assert info["hits"] == 3
+    assert spell_service.correct(text) == first
+    assert spell_service.cache_info()["en"]["hits"] == 9
+
+
+def test_spellchecker_cache_roundtrip(spell_service, tmp_path):
+    text = "Эттт тест и some erors"
+    expected = spell_service.correct(text)
+    path = tmp_path / "cache.json"
+    spell_service.save_cache(path)
+
+    warm = SpellCheckerService(cache_path=path)
+    assert warm.correct(text) == expected
+    info = warm.cache_info()
+    assert info["ru"]["misses"] == 0 and info["en"]["misses"] == 0
+    assert info["ru"]["hits"] >= 1 and info["en"]["hits"] >= 1
+
+
+def test_script_classifier():
+    classifier = ScriptClassifier(maxsize=2)
+    assert classifier.classify_all(["тест", "test", "123", "testд", "Ёж"]) == [
+        "ru",
+        "en",
+        "unknown",
+        "ru",
+        "ru",
+    ]
+    assert len(classifier._cache) <= 2
+    assert classifier.classify_all(["test", "test"]) == ["en", "en"]
+
+
+def test_spellchecker_loads_only_used_languages():
+    service = SpellCheckerService()
+    assert service.loaded_languages == []
+    assert service.correct("Превет 2024") == "Привет 2024"
+    assert service.loaded_languages == ["ru"]
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from benchmarks.corpus import make_ocr_text
+from text_processing.lines import LineJoiner
+from text_processing.normalizer import RawTextNormalizer
+from text_processing.streaming import StreamingNormalizer
+
+
+def split_randomly(text: str, rng: random.Random) -> list[str]:
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, 5)))
+    return [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "\n\n",
+        "  Hello ,  world !  ",
+        "This is a test-\ncase for line-\njoining.",
+        "Ivanov I.\nv. is important.",
+        "ChapterIVisHere\n\n\nSectionXIIandMore",
+        "abc123 \n, def",
+        "Page 12\n13 is next.   \n\n",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 4, 1024])
+def test_streaming_matches_normalize(text, chunk_size):
+    streaming = StreamingNormalizer(chunk_size=chunk_size)
+    expected = RawTextNormalizer().normalize(text)
+
+    assert "".join(streaming.iter_normalize([text])) == expected
+    assert "".join(streaming.iter_normalize(list(text))) == expected
+    assert "".join(streaming.iter_normalize(text.splitlines(True))) == expected
+
+
+def test_streaming_matches_normalize_on_corpus():
+    text = make_ocr_text(200_000, seed=2)
+    rng = random.Random(0)
+    streaming = StreamingNormalizer(chunk_size=512)
+
+    result = "".join(streaming.iter_normalize(split_randomly(text, rng)))
+    assert result == RawTextNormalizer().normalize(text)
+
+
+def test_normalize_file(tmp_path):
+    text = make_ocr_text(20_000, seed=4)
+    src = tmp_path / "in.txt"
+    dst = tmp_path / "out.txt"
+    src.write_text(text, encoding="utf-8")
+
+    StreamingNormalizer(chunk_size=256).normalize_file(src, dst)
+    assert dst.read_text(encoding="utf-8") == RawTextNormalizer().normalize(text)
+
+
+def test_iter_join_flush_keeps_only_tail():
+    lines = ["word and more words"] * 1000 + ["a-", "b", "I."]
+    fragments = list(LineJoiner.iter_join(lines, flush_size=64))
+
+    assert "".join(fragments) == LineJoiner.join("\n".join(lines))
+    assert max(map(len, fragments)) < 128
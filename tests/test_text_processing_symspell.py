@@ -0,0 +1,122 @@
+from itertools import product
+
+import pytest
+from spellchecker import SpellChecker
+
+from benchmarks.corpus import reference_words
+from text_processing.spelling import SpellCheckerService
+from text_processing.symspell import SymSpellIndex
+
+
+def edits1(word: str, letters: str) -> set:
+    """Все строки на одну правку от word (как SpellChecker.edit_distance_1)"""
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+    return (
+        {left + right[1:] for left, right in splits if right}
+        | {
+            left + right[1] + right[0] + right[2:]
+            for left, right in splits
+            if len(right) > 1
+        }
+        | {left + c + right[1:] for left, right in splits if right for c in letters}
+        | {left + c + right for left, right in splits for c in letters}
+    )
+
+
+def test_distance_matches_sequential_edits():
+    letters = "abc"
+    words = ["".join(p) for n in range(5) for p in product(letters, repeat=n)]
+    for word in words:
+        first = edits1(word, letters)
+        second = {e2 for e1 in first for e2 in edits1(e1, letters)}
+        for other in words:
+            expected = next(
+                (
+                    d
+                    for d, found in enumerate(({word}, first, second))
+                    if other in found
+                ),
+                3,
+            )
+            assert SymSpellIndex.distance(word, other) == expected, (word, other)
+
+
+def test_build_save_load(tmp_path):
+    index = SymSpellIndex.build({"договор": 50, "догово": 1, "оплата": 30, "2024": 5})
+    path = tmp_path / "index.bin"
+    index.save(path)
+    mapped = SymSpellIndex.load(path)
+    copied = SymSpellIndex.load(path, mapped=False)
+    assert mapped.mapped and not copied.mapped
+
+    for checker in (index, mapped, copied):
+        assert len(checker) == 4
+        assert "Договор" in checker
+        assert checker["договор"] == 50
+        assert checker.correction("догвор") == "договор"  # пропуск буквы
+        assert checker.correction("оплта") == "оплата"
+        assert checker.correction("договор") == "договор"
+        assert checker.correction("2025") == "2025"  # числа не проверяются
+        assert checker.correction("xyz") is None
+    mapped.close()
+
+
+def test_word_table_finds_every_word():
+    words = {f"слово{i}": i + 1 for i in range(3000)}
+    index = SymSpellIndex.build(words)
+    assert all(word in index and index[word] == i for word, i in words.items())
+    assert "слово3000" not in index and "" not in index
+
+
+def test_load_rejects_foreign_file(tmp_path):
+    path = tmp_path / "index.bin"
+    path.write_bytes(b"not an index")
+    with pytest.raises(ValueError):
+        SymSpellIndex.load(path)
+
+    SymSpellIndex.build({"договор": 1}).save(path)
+    data = path.read_bytes()
+    for size in (len(data) - 1, 12, 0):
+        path.write_bytes(data[:size])
+        with pytest.raises(ValueError):
+            SymSpellIndex.load(path)
+
+
+def test_load_or_build_persists(tmp_path):
+    index = SymSpellIndex.load_or_build("ru", tmp_path)
+    path = SymSpellIndex.index_path("ru", tmp_path)
+    assert path.exists()
+    assert len(SymSpellIndex.load_or_build("ru", tmp_path)) == len(index)
+
+
+def test_load_or_build_replaces_corrupt_file(tmp_path, monkeypatch):
+    # маленький словарь вместо полного, чтобы не строить индекс языка
+    small = SymSpellIndex.build({"договор": 5, "довод": 1})
+    monkeypatch.setattr(SymSpellIndex, "from_checker", lambda checker: small)
+    path = SymSpellIndex.index_path("ru", tmp_path)
+    small.save(path)
+    path.write_bytes(path.read_bytes()[:-8])
+
+    index = SymSpellIndex.load_or_build("ru", tmp_path)
+    assert index.mapped and index.correction("догвор") == "договор"
+    assert SymSpellIndex.load(path).correction("догвор") == "договор"
+
+
+@pytest.mark.parametrize("language, count", [("ru", 40), ("en", 15)])
+def test_matches_spellchecker_on_reference_words(language, count):
+    checker = SpellChecker(language=language)
+    index = SymSpellIndex.load_or_build(language)
+    for word in reference_words(checker, count):
+        expected = checker.correction(word)
+        actual = index.correction(word)
+        if expected != actual:
+            # при равной частоте pyspellchecker выбирает произвольного кандидата
+            assert expected is not None and actual is not None, word
+            assert checker[expected] == checker[actual], word
+
+
+def test_service_index_matches_spellchecker():
+    text = "Догвор вступаит в силу. The contrct shal be signd"
+    indexed = SpellCheckerService(use_index=True)
+    legacy = SpellCheckerService(use_index=False)
+    assert indexed.correct(text) == legacy.correct(text)
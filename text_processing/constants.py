@@ -12,6 +12,17 @@ RUSSIAN_LETTERS: str = r"[А-Яа-яЁё]"
 ENGLISH_LETTERS: str = r"[A-Za-z]"
 LETTERS: str = rf"(?:{RUSSIAN_LETTERS}|{ENGLISH_LETTERS})"
 
+# Те же множества в виде символов (для проверок без regex)
+PUNCTUATION_CHARS: frozenset[str] = frozenset(".,:;!?\"')]}%")
+RUSSIAN_CHARS: frozenset[str] = frozenset(
+    [chr(c) for c in range(ord("А"), ord("я") + 1)] + ["Ё", "ё"]
+)
+ENGLISH_CHARS: frozenset[str] = frozenset(
+    [chr(c) for c in range(ord("A"), ord("Z") + 1)]
+    + [chr(c) for c in range(ord("a"), ord("z") + 1)]
+)
+LETTER_CHARS: frozenset[str] = RUSSIAN_CHARS | ENGLISH_CHARS
+
 # ================================================================#
 # Предкомпилированные regex                                      #
 # ================================================================#
@@ -22,6 +33,14 @@ PUNCT_AFTER_RE = re.compile(rf"({PUNCTUATION_SIGNS})\s{{2,}}")
 DIGIT_LETTER_RE = re.compile(rf"(?<=\d)(?={LETTERS})")
 LETTER_DIGIT_RE = re.compile(rf"(?<={LETTERS})(?=\d)")
 
+# Быстрые проверки "есть ли что исправлять" (шаблоны начинаются с класса
+# символов, поэтому re пропускает остальной текст без возвратов)
+# цифра рядом с буквой: DIGIT_LETTER_RE / LETTER_DIGIT_RE
+DIGIT_LETTER_BOUNDARY_RE = re.compile(rf"\d(?:(?={LETTERS})|(?<={LETTERS}\d))")
+# пробел перед знаком препинания или перед еще одним пробелом:
+# PUNCT_BEFORE_RE / PUNCT_AFTER_RE / MULTI_SPACES_RE
+SPACING_ISSUE_RE = re.compile(rf"\s(?={PUNCTUATION_SIGNS}|\s)")
+
 MULTI_NEWLINE_RE = re.compile(r"\n{2,}")
 MULTI_SPACES_RE = re.compile(r" {2,}")
 SPACES_RE = re.compile(r"\s+")
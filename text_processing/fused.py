@@ -0,0 +1,69 @@
+import re
+
+from .constants import (
+    PUNCTUATION_SIGNS,
+    PUNCTUATION_CHARS,
+    LETTER_CHARS,
+    MULTI_SPACES_RE,
+)
+from .lines import LineJoiner
+from .roman import RomanNumeralSeparator
+
+
+class FusedNormalizer:
+    """
+    Нормализация (без орфографии) за минимальное число проходов по тексту.
+
+    Результат побайтово совпадает с последовательным пайплайном
+    MULTI_NEWLINE_RE -> LineJoiner -> SpacingNormalizer
+    -> NumberWordSeparator -> RomanNumeralSeparator:
+        1. схлопывание переносов совмещено со склейкой строк;
+        2. правила пробелов и разделение цифр/букв - один проход regex;
+        3. римские числа - отдельный проход.
+    """
+
+    # Кандидаты на переписывание: пробельная серия (>= 2 символов или перед
+    # знаком препинания) либо серия цифр. Шаблон начинается с класса символов,
+    # поэтому re быстро пропускает все остальное.
+    SCAN_RE = re.compile(
+        rf"[\s\d](?:(?<=\s)(?:\s+|(?={PUNCTUATION_SIGNS}))|(?<=\d)\d*)"
+    )
+
+    @staticmethod
+    def _replace(match: re.Match) -> str:
+        text = match.string
+        start, end = match.span()
+        value = match.group()
+
+        if value[0].isspace():
+            # PUNCT_BEFORE_RE: пробелы перед знаком препинания удаляются
+            if end < len(text) and text[end] in PUNCTUATION_CHARS:
+                return ""
+            # PUNCT_AFTER_RE: после знака препинания остается один пробел
+            if start and text[start - 1] in PUNCTUATION_CHARS:
+                return " "
+            # MULTI_SPACES_RE
+            return MULTI_SPACES_RE.sub(" ", value)
+
+        # DIGIT_LETTER_RE / LETTER_DIGIT_RE на границах серии цифр
+        if start and text[start - 1] in LETTER_CHARS:
+            value = " " + value
+        if end < len(text) and text[end] in LETTER_CHARS:
+            value = value + " "
+        return value
+
+    @staticmethod
+    def join_lines(text: str) -> str:
+        """MULTI_NEWLINE_RE + LineJoiner.join"""
+        return LineJoiner.join(text, collapse_newlines=True)
+
+    @classmethod
+    def spacing_and_numbers(cls, text: str) -> str:
+        """SpacingNormalizer.remove_extra_spaces + NumberWordSeparator.separate"""
+        return cls.SCAN_RE.sub(cls._replace, text).strip()
+
+    @classmethod
+    def normalize(cls, text: str) -> str:
+        text = cls.join_lines(text)
+        text = cls.spacing_and_numbers(text)
+        return RomanNumeralSeparator.separate(text)
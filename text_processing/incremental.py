@@ -0,0 +1,249 @@
+"""
+Инкрементальная нормализация повторно загружаемых документов.
+
+Текст проходит этапы до LineJoiner включительно (дешевые проходы по всему
+тексту), затем делится на абзацы. Нормализованный абзац ищется в хранилище
+по хэшу (пайплайн + текст абзаца), заново через остальные этапы
+(пробелы, числа, орфография) проходят только новые и измененные абзацы.
+
+    store = SqliteParagraphStore("paragraphs.db")
+    normalizer = IncrementalNormalizer(RawTextNormalizer(enable_spellcheck=True), store)
+    normalizer.normalize(text)          # все абзацы обрабатываются
+    normalizer.normalize(edited_text)   # только измененные
+    normalizer.stats.reuse_ratio
+"""
+
+import hashlib
+import re
+import sqlite3
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+from .constants import PUNCTUATION_SIGNS
+from .normalizer import RawTextNormalizer
+from .pipeline import stage_signature
+
+
+class ParagraphStore(ABC):
+    """
+    Хранилище нормализованных абзацев: ключ -> текст.
+    """
+
+    @abstractmethod
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Найденные в хранилище ключи и их тексты"""
+
+    @abstractmethod
+    def put_many(self, items: Dict[str, str]) -> None:
+        """Сохраняет тексты по ключам"""
+
+
+class MemoryParagraphStore(ParagraphStore):
+    """
+    LRU-хранилище в памяти процесса.
+    """
+
+    def __init__(self, maxsize: int = 100_000) -> None:
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, str]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        found = {}
+        for key in keys:
+            text = self._data.get(key)
+            if text is not None:
+                self._data.move_to_end(key)
+                found[key] = text
+        return found
+
+    def put_many(self, items: Dict[str, str]) -> None:
+        self._data.update(items)
+        for key in items:
+            self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+class SqliteParagraphStore(ParagraphStore):
+    """
+    Хранилище в файле SQLite: переживает перезапуск процесса.
+    """
+
+    # Ограничение числа параметров в одном запросе SQLite
+    BATCH_SIZE = 500
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS paragraphs ("
+            "key TEXT PRIMARY KEY, text TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> "SqliteParagraphStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM paragraphs").fetchone()
+        return count
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        keys = list(keys)
+        found: Dict[str, str] = {}
+        for start in range(0, len(keys), self.BATCH_SIZE):
+            batch = keys[start : start + self.BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            found.update(
+                self._conn.execute(
+                    f"SELECT key, text FROM paragraphs WHERE key IN ({placeholders})",
+                    batch,
+                )
+            )
+        return found
+
+    def put_many(self, items: Dict[str, str]) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO paragraphs (key, text) VALUES (?, ?)",
+                items.items(),
+            )
+
+
+class IncrementalStats:
+    """
+    Статистика повторного использования абзацев (накапливается по вызовам).
+    """
+
+    def __init__(self) -> None:
+        self.documents = 0
+        self.paragraphs = 0
+        self.reused = 0
+        self.characters = 0
+        self.reused_characters = 0
+
+    @property
+    def recomputed(self) -> int:
+        return self.paragraphs - self.reused
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Доля абзацев, взятых из хранилища"""
+        return self.reused / self.paragraphs if self.paragraphs else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"IncrementalStats(documents={self.documents}, "
+            f"paragraphs={self.paragraphs}, reused={self.reused}, "
+            f"reuse_ratio={self.reuse_ratio:.2f})"
+        )
+
+
+class IncrementalNormalizer:
+    """
+    Нормализация по абзацам с повторным использованием результатов.
+
+    Результат совпадает с normalizer.normalize(text) для этапов по умолчанию:
+    абзацы режутся по переводу строки между непробельными символами,
+    если следующий абзац начинается не со знака препинания. Этапы после
+    LineJoiner не меняют текст через такую границу. Собственные этапы
+    (PipelineBuilder.register) после LineJoiner тоже должны работать
+    в пределах абзаца.
+
+    Ключ записи в хранилище включает VERSION, имена этапов, модуль и имя
+    их функций (stage_signature) и настройки орфографии. Если код
+    собственного этапа изменился без переименования, хранилище нужно
+    очистить.
+    """
+
+    # Увеличивается при изменении результата встроенных этапов:
+    # старые записи хранилища перестают совпадать по ключу
+    VERSION = 1
+
+    BOUNDARY_RE = re.compile(rf"(?<=\S)\n(?=\S)(?!{PUNCTUATION_SIGNS})")
+
+    def __init__(
+        self,
+        normalizer: Optional[RawTextNormalizer] = None,
+        store: Optional[ParagraphStore] = None,
+    ) -> None:
+        """
+        Args:
+            normalizer: нормализатор, чьи этапы выполняются
+                (по умолчанию RawTextNormalizer())
+            store: хранилище абзацев (по умолчанию MemoryParagraphStore())
+        """
+        self.normalizer = normalizer if normalizer is not None else RawTextNormalizer()
+        self.store = store if store is not None else MemoryParagraphStore()
+        self.stats = IncrementalStats()
+
+        # Этапы до LineJoiner включительно (в т.ч. слитые с ним) - по всему
+        # тексту, остальные - по абзацам
+        stages = self.normalizer.stages
+        split = 0
+        for i, (name, _) in enumerate(stages):
+            if "LineJoiner" in name.split("+"):
+                split = i + 1
+        self._text_stages = stages[:split]
+        self._paragraph_stages = stages[split:]
+
+        # Ключ зависит от реализации этапов, а не только от их имен:
+        # одноименные собственные этапы разных пайплайнов не смешиваются
+        signature = "|".join(
+            [str(self.VERSION)]
+            + [f"{name}={stage_signature(func)}" for name, func in stages]
+        )
+        self._hasher = hashlib.blake2b(signature.encode("utf-8"), digest_size=16)
+
+    def _key(self, paragraph: str) -> str:
+        hasher = self._hasher.copy()
+        hasher.update(paragraph.encode("utf-8"))
+        return hasher.hexdigest()
+
+    def split(self, text: str) -> List[str]:
+        """Абзацы текста после этапов до LineJoiner включительно"""
+        for _, stage in self._text_stages:
+            text = stage(text)
+        return self.BOUNDARY_RE.split(text)
+
+    def _normalize_paragraph(self, paragraph: str) -> str:
+        for _, stage in self._paragraph_stages:
+            paragraph = stage(paragraph)
+        return paragraph
+
+    def normalize(self, text: str, stats: Optional[IncrementalStats] = None) -> str:
+        """
+        Args:
+            stats: куда записать статистику (по умолчанию self.stats)
+        """
+        stats = stats if stats is not None else self.stats
+        paragraphs = self.split(text)
+        keys = [self._key(paragraph) for paragraph in paragraphs]
+
+        results = self.store.get_many(set(keys))
+        computed: Dict[str, str] = {}
+        for key, paragraph in zip(keys, paragraphs):
+            stats.paragraphs += 1
+            stats.characters += len(paragraph)
+            if key in results:
+                stats.reused += 1
+                stats.reused_characters += len(paragraph)
+            else:
+                # повтор абзаца в том же документе тоже не пересчитывается
+                results[key] = computed[key] = self._normalize_paragraph(paragraph)
+        stats.documents += 1
+
+        if computed:
+            self.store.put_many(computed)
+        return "\n".join(results[key] for key in keys)
@@ -0,0 +1,128 @@
+import cProfile
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Callable, ContextManager, Dict, Iterable, Iterator, List
+
+
+class StageEvent:
+    """
+    Результат одного вызова этапа пайплайна.
+    """
+
+    __slots__ = ("stage", "seconds", "input_size", "output_size")
+
+    def __init__(
+        self, stage: str, seconds: float, input_size: int, output_size: int
+    ) -> None:
+        self.stage = stage
+        self.seconds = seconds
+        self.input_size = input_size
+        self.output_size = output_size
+
+    def __repr__(self) -> str:
+        return (
+            f"StageEvent({self.stage}: {self.seconds:.6f}s, "
+            f"{self.input_size} -> {self.output_size} chars)"
+        )
+
+
+class StageStats:
+    """
+    Накопленная статистика этапа.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.input_size = 0
+        self.output_size = 0
+
+    def add(self, event: StageEvent) -> None:
+        self.calls += 1
+        self.seconds += event.seconds
+        self.input_size += event.input_size
+        self.output_size += event.output_size
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "input_size": self.input_size,
+            "output_size": self.output_size,
+        }
+
+
+# Вызывается после каждого этапа (например, отправка метрик)
+StageCallback = Callable[[StageEvent], None]
+# Вызывается с именем этапа, возвращает контекстный менеджер вокруг этапа
+StageWrapper = Callable[[str], ContextManager]
+
+
+class Instrumentation:
+    """
+    Инструментирование этапов нормализации: время, размеры входа/выхода,
+    количество вызовов, плюс подключаемые хуки.
+
+    Включается передачей в RawTextNormalizer(instrumentation=...);
+    без него пайплайн работает без каких-либо замеров.
+    """
+
+    def __init__(
+        self,
+        callbacks: Iterable[StageCallback] = (),
+        wrappers: Iterable[StageWrapper] = (),
+    ) -> None:
+        self.stats: Dict[str, StageStats] = {}
+        self._callbacks: List[StageCallback] = list(callbacks)
+        self._wrappers: List[StageWrapper] = list(wrappers)
+
+    def add_callback(self, callback: StageCallback) -> None:
+        self._callbacks.append(callback)
+
+    def add_wrapper(self, wrapper: StageWrapper) -> None:
+        self._wrappers.append(wrapper)
+
+    def run(self, stage: str, func: Callable[[str], str], text: str) -> str:
+        """Выполняет этап с замером и хуками"""
+        with ExitStack() as stack:
+            for wrapper in self._wrappers:
+                stack.enter_context(wrapper(stage))
+            start = time.perf_counter()
+            result = func(text)
+            seconds = time.perf_counter() - start
+
+        event = StageEvent(stage, seconds, len(text), len(result))
+        self.stats.setdefault(stage, StageStats()).add(event)
+        for callback in self._callbacks:
+            callback(event)
+        return result
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """Статистика по этапам в порядке первого вызова"""
+        return {stage: stats.as_dict() for stage, stats in self.stats.items()}
+
+    def reset(self) -> None:
+        self.stats.clear()
+
+
+def profile_stage(stage: str, profiler: cProfile.Profile) -> StageWrapper:
+    """
+    Обертка для Instrumentation: включает profiler только на время этапа stage.
+
+    Пример:
+        profiler = cProfile.Profile()
+        Instrumentation(wrappers=[profile_stage("RomanNumeralSeparator", profiler)])
+    """
+
+    @contextmanager
+    def wrapper(name: str) -> Iterator[None]:
+        if name != stage:
+            yield
+            return
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+
+    return wrapper
@@ -1,4 +1,5 @@
 import re
+from typing import Iterable, Iterator, Optional
 
 
 class LineJoiner:
@@ -12,54 +13,137 @@ class LineJoiner:
     # ( скобки, [ квадратные, { фигурные, " ' кавычки, « елочки
     OPENING_PUNCTUATION = {"(", "[", "{", '"', "'", "«"}
 
+    # Сколько последних символов склеиваемой строки нужно для проверок
+    # (дефис, цифра, аббревиатура "\b[a-z]\.$")
+    TAIL_SIZE = 3
+
+    @staticmethod
+    def _tail(parts: list[str], size: int = TAIL_SIZE) -> str:
+        """
+        Последние `size` символов склеиваемой строки (или вся строка, если короче).
+        """
+        tail = parts[-1]
+        i = len(parts) - 1
+        while len(tail) < size and i > 0:
+            i -= 1
+            tail = parts[i] + tail
+        return tail
+
+    @staticmethod
+    def _is_abbreviation(parts: list[str]) -> bool:
+        # ABBREVIATION_RE смотрит только на конец строки: "\b" + буква + точка.
+        # Ищем с позиции предпоследнего символа, чтобы не сканировать весь абзац.
+        tail = LineJoiner._tail(parts)
+        return bool(LineJoiner.ABBREVIATION_RE.search(tail, len(tail) - 2))
+
+    @staticmethod
+    def collapse_empty_lines(lines: Iterable[str]) -> Iterator[str]:
+        """
+        Построчный аналог MULTI_NEWLINE_RE.sub("\\n", ...): пропускает пустые
+        строки, кроме первой и последней.
+        """
+        lines = iter(lines)
+        first = next(lines, None)
+        if first is None:
+            return
+        yield first
+
+        last_is_empty = False
+        for line in lines:
+            last_is_empty = not line
+            if line:
+                yield line
+        if last_is_empty:
+            yield ""
+
+    @staticmethod
+    def join(text: str, collapse_newlines: bool = False) -> str:
+        """
+        Args:
+            text: исходный текст
+            collapse_newlines: предварительно схлопнуть "\\n{2,}" в "\\n"
+                (то же, что MULTI_NEWLINE_RE.sub, но без отдельного прохода)
+        """
+        lines: Iterable[str] = text.split("\n")
+        if collapse_newlines:
+            lines = LineJoiner.collapse_empty_lines(lines)
+        return "".join(LineJoiner.iter_join(lines))
+
     @staticmethod
-    def join(text: str) -> str:
-        lines = text.split("\n")
-        if not lines:
-            return ""
+    def iter_join(
+        lines: Iterable[str], flush_size: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Потоковая склейка: выдает фрагменты, конкатенация которых равна
+        "\\n".join(склеенные строки).
+
+        Args:
+            lines: строки без символов "\\n"
+            flush_size: если задан, склеиваемая строка длиннее этого размера
+                выдается частями (в буфере остаются только последние символы),
+                так что память не зависит от длины абзаца
+        """
+        lines = iter(lines)
+        first = next(lines, None)
+        if first is None:
+            return
 
-        result: list[str] = []
-        buffer = lines[0].rstrip()
+        # Текущая строка хранится частями: склейка через "+" квадратична
+        # на длинных абзацах
+        buffer = [first.rstrip()]
+        size = len(buffer[0])
 
-        for i in range(1, len(lines)):
-            next_line_original = lines[i].rstrip()
-            next_line_stripped = lines[i].lstrip()
+        for line in lines:
+            next_line_original = line.rstrip()
+            next_line_stripped = line.lstrip()
 
-            if not buffer or not next_line_stripped:
-                result.append(buffer)
-                buffer = next_line_original
+            if not buffer[-1] or not next_line_stripped:
+                yield "".join(buffer)
+                yield "\n"
+                buffer = [next_line_original]
+                size = len(next_line_original)
                 continue
 
             # --- Логика склейки ---
 
             # 1. Перенос по дефису (всегда клеим)
-            if buffer.endswith("-"):
-                buffer = buffer[:-1] + next_line_stripped
-                continue
+            if buffer[-1].endswith("-"):
+                buffer[-1] = buffer[-1][:-1]
+                buffer.append(next_line_stripped)
+                size += len(next_line_stripped) - 1
+            else:
+                # Для проверки мягкого переноса нам нужен первый символ следующей строки
+                first_char = next_line_stripped[0]
 
-            # Для проверки мягкого переноса нам нужен первый символ следующей строки
-            first_char = next_line_stripped[0]
-
-            # 2. Мягкий перенос (пробел)
-            # Строка считается продолжением, если:
-            # - Она начинается с маленькой буквы
-            # - ИЛИ она начинается со скобки/кавычки (исправление твоей ошибки)
-            is_continuation = (
-                first_char.islower() or first_char in LineJoiner.OPENING_PUNCTUATION
-            )
-
-            if (
-                not buffer[-1].isdigit()  # Предыдущая не кончается цифрой
-                and is_continuation  # Следующая похожа на продолжение
-                and not first_char.isdigit()  # Следующая не начинается с цифры (защита от списков)
-                and not LineJoiner.ABBREVIATION_RE.search(buffer)  # Не аббревиатура
-            ):
-                buffer = buffer + " " + next_line_stripped
-                continue
+                # 2. Мягкий перенос (пробел)
+                # Строка считается продолжением, если:
+                # - Она начинается с маленькой буквы
+                # - ИЛИ она начинается со скобки/кавычки (исправление твоей ошибки)
+                is_continuation = (
+                    first_char.islower() or first_char in LineJoiner.OPENING_PUNCTUATION
+                )
+
+                if (
+                    not buffer[-1][-1].isdigit()  # Предыдущая не кончается цифрой
+                    and is_continuation  # Следующая похожа на продолжение
+                    and not first_char.isdigit()  # Следующая не начинается с цифры (защита от списков)
+                    and not LineJoiner._is_abbreviation(buffer)  # Не аббревиатура
+                ):
+                    buffer.append(" ")
+                    buffer.append(next_line_stripped)
+                    size += 1 + len(next_line_stripped)
+                else:
+                    # Иначе: это новая строка
+                    yield "".join(buffer)
+                    yield "\n"
+                    buffer = [next_line_original]
+                    size = len(next_line_original)
+                    continue
 
-            # Иначе: это новая строка
-            result.append(buffer)
-            buffer = next_line_original
+            if flush_size is not None and size > max(flush_size, LineJoiner.TAIL_SIZE):
+                joined = "".join(buffer)
+                yield joined[: -LineJoiner.TAIL_SIZE]
+                buffer = [joined[-LineJoiner.TAIL_SIZE :]]
+                size = LineJoiner.TAIL_SIZE
 
-        result.append(buffer)
-        return "\n".join(result)
+        yield "".join(buffer)
@@ -1,9 +1,57 @@
-from .spacing import SpacingNormalizer
-from .numbers import NumberWordSeparator
-from .roman import RomanNumeralSeparator
-from .lines import LineJoiner
-from .spelling import SpellCheckerService
-from .constants import MULTI_NEWLINE_RE
+import pickle
+import time
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .instrumentation import Instrumentation
+from .offsets import OffsetMap
+from .pipeline import PipelineBuilder, StageFunc, StageSpec
+
+
+class BatchStats:
+    """
+    Статистика пакетной нормализации (обновляется по мере выдачи результатов).
+    """
+
+    def __init__(self) -> None:
+        self.documents = 0
+        self.characters = 0
+        self.seconds = 0.0
+
+    @property
+    def docs_per_sec(self) -> float:
+        return self.documents / self.seconds if self.seconds else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchStats(documents={self.documents}, seconds={self.seconds:.3f}, "
+            f"docs/sec={self.docs_per_sec:.1f})"
+        )
+
+
+# Нормализатор процесса-воркера: создается один раз в initializer пула
+_worker_normalizer: Optional["RawTextNormalizer"] = None
+
+
+def init_worker(options: Dict[str, Any]) -> None:
+    """
+    initializer пула процессов (normalize_many, service.AsyncProcessor):
+    создает нормализатор процесса с параметрами RawTextNormalizer(**options).
+    """
+    global _worker_normalizer
+    _worker_normalizer = RawTextNormalizer(**options)
+
+
+def normalize_chunk(texts: List[str]) -> List[str]:
+    """Задача пула: нормализатор процесса из init_worker"""
+    return [_worker_normalizer.normalize(text) for text in texts]
+
+
+def _chunked(texts: Iterable[str], size: int) -> Iterator[List[str]]:
+    iterator = iter(texts)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
 
 
 class RawTextNormalizer:
@@ -11,17 +59,168 @@ class RawTextNormalizer:
     Основной пайплайн нормализации текста.
     """
 
-    def __init__(self, enable_spellcheck: bool = False) -> None:
-        self._spellchecker = SpellCheckerService() if enable_spellcheck else None
+    def __init__(
+        self,
+        enable_spellcheck: bool = False,
+        fused: bool = False,
+        instrumentation: Optional[Instrumentation] = None,
+        stages: Optional[Sequence[StageSpec]] = None,
+    ) -> None:
+        """
+        Args:
+            enable_spellcheck: включить орфографическую коррекцию
+            fused: объединять соседние этапы в общие проходы
+                (PipelineBuilder.FUSIONS), результат идентичен обычному режиму
+            instrumentation: замеры и хуки по этапам (None - без замеров)
+            stages: этапы и их порядок (см. PipelineBuilder);
+                по умолчанию PipelineBuilder.DEFAULT_STAGES
+        """
+        self._spellchecker = None
+        if enable_spellcheck:
+            from .spelling import SpellCheckerService
 
-    def normalize(self, text: str) -> str:
-        text = MULTI_NEWLINE_RE.sub("\n", text)
-        text = LineJoiner.join(text)
-        text = SpacingNormalizer.remove_extra_spaces(text)
-        text = NumberWordSeparator.separate(text)
-        text = RomanNumeralSeparator.separate(text)
+            self._spellchecker = SpellCheckerService()
+        self.instrumentation = instrumentation
+        # Параметры для воссоздания нормализатора в процессах normalize_many
+        # (инструментирование в процессы не передается)
+        self._options = {
+            "enable_spellcheck": enable_spellcheck,
+            "fused": fused,
+            "stages": stages,
+        }
 
+        builder = PipelineBuilder(
+            stages if stages is not None else PipelineBuilder.DEFAULT_STAGES
+        )
         if self._spellchecker:
-            text = self._spellchecker.correct(text)
+            builder.add("SpellCheckerService", self._spellchecker.correct)
+        self._pipeline = builder.build(fuse=fused)
+        self._stages = self._pipeline.stages
+
+    def _worker_options(self) -> Dict[str, Any]:
+        """
+        Параметры для init_worker. Проверяются заранее: ошибка pickle внутри
+        ProcessPoolExecutor выглядит как сбой пула, а не как неверный этап.
+        """
+        stages = self._options["stages"]
+        options = dict(
+            self._options,
+            stages=PipelineBuilder.detach(
+                stages if stages is not None else PipelineBuilder.DEFAULT_STAGES
+            ),
+        )
+        try:
+            pickle.dumps(options)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            raise ValueError(
+                "Этапы для normalize_many(workers > 1) должны передаваться "
+                "в процессы через pickle: используйте функции уровня модуля, "
+                f"а не lambda или вложенные функции ({error})"
+            ) from error
+        return options
+
+    @property
+    def stages(self) -> List[Tuple[str, StageFunc]]:
+        """Этапы (имя, функция) в порядке выполнения (копия списка)"""
+        return list(self._stages)
 
+    @property
+    def stage_names(self) -> List[str]:
+        return self._pipeline.names
+
+    def normalize(self, text: str) -> str:
+        if self.instrumentation is None:
+            for _, stage in self._stages:
+                text = stage(text)
+            return text
+
+        for name, stage in self._stages:
+            text = self.instrumentation.run(name, stage, text)
         return text
+
+    def normalize_with_offsets(self, text: str) -> Tuple[str, OffsetMap]:
+        """
+        Нормализация с картой смещений: результат совпадает с normalize(text),
+        offsets[i] - позиция в text символа i результата (см. OffsetMap).
+        """
+        offsets = OffsetMap.identity(len(text))
+        for name, stage in self._stages:
+            if self.instrumentation is None:
+                result = stage(text)
+            else:
+                result = self.instrumentation.run(name, stage, text)
+            offsets = offsets.follow(text, result)
+            text = result
+        return text, offsets
+
+    def normalize_pages(
+        self, pages: Iterable[Tuple[int, str]]
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Ленивая нормализация постраничного потока (например, iter_pdf_pages).
+        Каждая страница нормализуется независимо, по мере поступления.
+        """
+        for page_no, text in pages:
+            yield page_no, self.normalize(text)
+
+    def normalize_many(
+        self,
+        texts: Iterable[str],
+        workers: int = 1,
+        chunksize: int = 16,
+        stats: Optional[BatchStats] = None,
+    ) -> Iterator[str]:
+        """
+        Нормализация потока документов, результаты выдаются в исходном порядке.
+
+        Args:
+            texts: документы (читаются лениво, порциями)
+            workers: количество процессов; каждый создает один нормализатор
+                (и словари орфографии) на все время работы
+            chunksize: документов в одной задаче процесса
+            stats: объект BatchStats для учета docs/sec
+
+        При workers > 1 этапы передаются в процессы через pickle (процессы
+        могут запускаться через spawn/forkserver): функции собственных этапов
+        должны быть доступны по имени модуля - lambda и вложенные функции
+        не подходят (ValueError при первом обращении к результату). Этапы,
+        зарегистрированные через PipelineBuilder.register, передаются
+        функциями, а не именами; инструментирование в процессах не ведется.
+        """
+        stats = stats if stats is not None else BatchStats()
+        start = time.perf_counter()
+
+        if workers <= 1:
+            for text in texts:
+                result = self.normalize(text)
+                stats.documents += 1
+                stats.characters += len(text)
+                stats.seconds = time.perf_counter() - start
+                yield result
+            return
+
+        # multiprocessing нужен только пакетной обработке, не при старте
+        from concurrent.futures import ProcessPoolExecutor
+
+        options = self._worker_options()
+        chunks = _chunked(texts, chunksize)
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker, initargs=(options,)
+        ) as executor:
+
+            def submit(chunk: List[str]) -> Tuple[Any, int]:
+                return executor.submit(normalize_chunk, chunk), sum(map(len, chunk))
+
+            # Ограниченное окно задач: вход не вычитывается целиком в память
+            pending = deque(submit(chunk) for chunk in islice(chunks, workers * 2))
+            while pending:
+                future, characters = pending.popleft()
+                results = future.result()
+                next_chunk = next(chunks, None)
+                if next_chunk is not None:
+                    pending.append(submit(next_chunk))
+
+                stats.documents += len(results)
+                stats.characters += characters
+                stats.seconds = time.perf_counter() - start
+                yield from results
@@ -1,4 +1,4 @@
-from .constants import DIGIT_LETTER_RE, LETTER_DIGIT_RE
+from .constants import DIGIT_LETTER_RE, LETTER_DIGIT_RE, DIGIT_LETTER_BOUNDARY_RE
 
 
 class NumberWordSeparator:
@@ -13,7 +13,11 @@ class NumberWordSeparator:
             "abc123" -> "abc 123"
             "123abc" -> "123 abc"
             "тест456тест" -> "тест 456 тест"
+
+        Если разделять нечего, возвращается тот же объект text.
         """
+        if not DIGIT_LETTER_BOUNDARY_RE.search(text):
+            return text
         text = DIGIT_LETTER_RE.sub(" ", text)
         text = LETTER_DIGIT_RE.sub(" ", text)
         return text
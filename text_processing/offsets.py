@@ -0,0 +1,155 @@
+"""
+Карта смещений: позиции нормализованного текста -> позиции исходного.
+
+    text, offsets = RawTextNormalizer().normalize_with_offsets(raw)
+    offsets[i]                 # позиция в raw символа text[i]
+    offsets.span(start, end)   # фрагмент raw, из которого получен text[start:end]
+
+Этапы пайплайна не сообщают о своих правках: после каждого этапа его вход
+и выход выравниваются (OffsetMap.follow), а карта пересобирается из
+кусков предыдущей. Совпадающие участки находятся сравнением срезов
+(на стороне C), поэтому работа на Python пропорциональна числу правок
+этапа, а не длине текста.
+
+Выравнивание рассчитано на правки встроенных этапов: удаление, вставка
+и замена пробельных символов, удаление дефиса переноса, замена слова
+(орфография). Для собственных этапов с другими правками карта остается
+монотонной и в пределах исходного текста, но может быть менее точной.
+"""
+
+import re
+from array import array
+from typing import Tuple
+
+_WORD_RE = re.compile(r"\w*")
+_SPACES_RE = re.compile(r"\s+")
+
+
+def _common_prefix(source: str, i: int, result: str, j: int) -> int:
+    """Длина общего префикса source[i:] и result[j:]"""
+    limit = min(len(source) - i, len(result) - j)
+    low = 0
+    step = 32
+    # Галоп: шаг растет, пока срезы совпадают
+    while (
+        step <= limit - low
+        and source[i + low : i + low + step] == result[j + low : j + low + step]
+    ):
+        low += step
+        step *= 2
+    high = min(low + step, limit)
+    # Бинарный поиск первого несовпадения в [low, high]
+    while low < high:
+        middle = (low + high + 1) // 2
+        if source[i + low : i + middle] == result[j + low : j + middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+class OffsetMap:
+    """
+    Компактная карта смещений на массиве array("I").
+
+    positions[i] - позиция в исходном тексте символа i результата;
+    вставленные этапами символы указывают на следующий исходный символ.
+    Последний элемент (i == len(результата)) - длина исходного текста.
+    """
+
+    TYPECODE = "I"
+
+    def __init__(self, positions: array) -> None:
+        self.positions = positions
+
+    @classmethod
+    def identity(cls, length: int) -> "OffsetMap":
+        """Карта текста, который еще не менялся"""
+        return cls(array(cls.TYPECODE, range(length + 1)))
+
+    def __len__(self) -> int:
+        """Длина нормализованного текста"""
+        return len(self.positions) - 1
+
+    def __getitem__(self, index: int) -> int:
+        return self.positions[index]
+
+    @property
+    def source_length(self) -> int:
+        return self.positions[-1]
+
+    def span(self, start: int, end: int) -> Tuple[int, int]:
+        """
+        Фрагмент исходного текста [start, end), соответствующий
+        нормализованному text[start:end] (например, найденному слову).
+        """
+        if end <= start:
+            position = self.positions[start]
+            return position, position
+        return self.positions[start], self.positions[end - 1] + 1
+
+    def follow(self, source: str, result: str) -> "OffsetMap":
+        """
+        Карта после этапа, превратившего source в result
+        (self - карта для source).
+        """
+        if result is source:
+            return self
+
+        previous = self.positions
+        positions = array(self.TYPECODE)
+        i = j = 0
+        while j < len(result):
+            common = _common_prefix(source, i, result, j)
+            if common:
+                positions.extend(previous[i : i + common])
+                i += common
+                j += common
+                continue
+
+            char = result[j]
+            if i == len(source):
+                # вставка в конец текста
+                positions.append(previous[i])
+                j += 1
+            elif char.isspace():
+                if source[i].isspace():
+                    # замена пробельного символа ("\n" -> " ")
+                    positions.append(previous[i])
+                    i += 1
+                    j += 1
+                elif j + 1 < len(result) and result[j + 1] == source[i]:
+                    # вставленный пробел ("abc123" -> "abc 123")
+                    positions.append(previous[i])
+                    j += 1
+                elif source[i].isalnum() or source[i] == "_":
+                    # слово укорочено: остаток слова удален
+                    i = _WORD_RE.match(source, i).end()
+                else:
+                    i += 1
+            elif source[i].isspace():
+                # удаленные пробелы (перед знаком препинания, по краям)
+                i = _SPACES_RE.match(source, i).end()
+            elif source[i] == "-":
+                # дефис переноса при склейке строк
+                i += 1
+            else:
+                # замена остатка слова (орфография) или одного символа
+                word_end = _WORD_RE.match(source, i).end()
+                result_end = _WORD_RE.match(result, j).end()
+                if word_end == i and result_end == j:
+                    word_end, result_end = i + 1, j + 1
+                # последний символ замены - на последний символ слова,
+                # чтобы span замененного слова покрывал исходное слово целиком
+                last = max(word_end - 1, i)
+                for k in range(result_end - j - 1):
+                    positions.append(previous[min(i + k, last)])
+                if result_end > j:
+                    positions.append(previous[last])
+                i, j = word_end, result_end
+
+        positions.append(previous[len(source)])
+        return OffsetMap(positions)
+
+    def __repr__(self) -> str:
+        return f"OffsetMap(length={len(self)}, source_length={self.source_length})"
@@ -0,0 +1,248 @@
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .constants import MULTI_NEWLINE_RE
+from .fused import FusedNormalizer
+from .lines import LineJoiner
+from .numbers import NumberWordSeparator
+from .roman import RomanNumeralSeparator
+from .spacing import SpacingNormalizer
+
+StageFunc = Callable[[str], str]
+# Фабрика вызывается один раз при сборке пайплайна (например, загрузка словарей)
+StageFactory = Callable[[], StageFunc]
+# Этап в конфигурации: имя зарегистрированного этапа или (имя, функция)
+StageSpec = Union[str, Tuple[str, StageFunc]]
+
+
+def stage_signature(func: StageFunc) -> str:
+    """
+    Идентификатор функции этапа для ключей кэшей результатов: модуль и имя;
+    для lambda и вложенных функций - еще место определения, для
+    functools.partial - аргументы, для метода объекта со свойством
+    signature (SpellCheckerService) - его настройки.
+    """
+    if isinstance(func, partial):
+        return (
+            f"partial({stage_signature(func.func)}, {func.args!r}, {func.keywords!r})"
+        )
+    qualname = getattr(func, "__qualname__", type(func).__qualname__)
+    module = getattr(func, "__module__", type(func).__module__)
+    result = f"{module}.{qualname}"
+    if "<" in qualname:
+        code = func.__code__
+        result += f"@{code.co_filename}:{code.co_firstlineno}"
+    settings = getattr(getattr(func, "__self__", None), "signature", None)
+    if isinstance(settings, str):
+        result += f"[{settings}]"
+    return result
+
+
+def _collapse_newlines(text: str) -> str:
+    return MULTI_NEWLINE_RE.sub("\n", text)
+
+
+def _spellchecker() -> StageFunc:
+    # spelling (и pyspellchecker) импортируется, только если этап нужен
+    from .spelling import SpellCheckerService
+
+    return SpellCheckerService().correct
+
+
+class Pipeline:
+    """
+    Собранный пайплайн: упорядоченный список этапов (имя, функция).
+    """
+
+    def __init__(self, stages: List[Tuple[str, StageFunc]]) -> None:
+        self.stages = stages
+
+    @property
+    def names(self) -> List[str]:
+        return [name for name, _ in self.stages]
+
+    def __call__(self, text: str) -> str:
+        for _, stage in self.stages:
+            text = stage(text)
+        return text
+
+    def __repr__(self) -> str:
+        return f"Pipeline({' -> '.join(self.names)})"
+
+
+class PipelineBuilder:
+    """
+    Сборка пайплайна нормализации: выбор, порядок и регистрация этапов.
+
+    Пример:
+        pipeline = (
+            PipelineBuilder()
+            .remove("RomanNumeralSeparator")
+            .add("Lowercase", str.lower)
+            .build()
+        )
+        pipeline(text)
+    """
+
+    # Порядок этапов RawTextNormalizer по умолчанию
+    DEFAULT_STAGES: Tuple[str, ...] = (
+        "MultiNewline",
+        "LineJoiner",
+        "SpacingNormalizer",
+        "NumberWordSeparator",
+        "RomanNumeralSeparator",
+    )
+
+    _registry: Dict[str, StageFactory] = {
+        "MultiNewline": lambda: _collapse_newlines,
+        "LineJoiner": lambda: LineJoiner.join,
+        "SpacingNormalizer": lambda: SpacingNormalizer.remove_extra_spaces,
+        "NumberWordSeparator": lambda: NumberWordSeparator.separate,
+        "RomanNumeralSeparator": lambda: RomanNumeralSeparator.separate,
+        "SpellCheckerService": _spellchecker,
+    }
+    # Встроенные фабрики: register может их переопределить, unregister - вернуть
+    _builtins: Dict[str, StageFactory] = dict(_registry)
+
+    # Соседние этапы, которые выполняются одним проходом с тем же результатом
+    FUSIONS: Dict[Tuple[str, str], StageFunc] = {
+        ("MultiNewline", "LineJoiner"): FusedNormalizer.join_lines,
+        (
+            "SpacingNormalizer",
+            "NumberWordSeparator",
+        ): FusedNormalizer.spacing_and_numbers,
+    }
+
+    @classmethod
+    def register(cls, name: str, factory: StageFactory) -> None:
+        """
+        Регистрирует этап, доступный по имени во всех сборщиках.
+
+        Args:
+            name: имя этапа
+            factory: вызывается при сборке и возвращает функцию str -> str
+        """
+        cls._registry[name] = factory
+
+    @classmethod
+    def unregister(cls, name: str) -> None:
+        """
+        Удаляет этап, зарегистрированный через register. Для переопределенного
+        встроенного этапа восстанавливает исходную фабрику; встроенные этапы
+        не удаляются.
+        """
+        if name in cls._builtins:
+            if cls._registry[name] is cls._builtins[name]:
+                raise ValueError(f"Встроенный этап нельзя удалить: {name}")
+            cls._registry[name] = cls._builtins[name]
+        elif name in cls._registry:
+            del cls._registry[name]
+        else:
+            raise ValueError(f"Неизвестный этап: {name}")
+
+    @classmethod
+    def _is_builtin(cls, name: str) -> bool:
+        """Этап из реестра с исходной (не переопределенной) фабрикой"""
+        factory = cls._registry.get(name)
+        return factory is not None and factory is cls._builtins.get(name)
+
+    @classmethod
+    def detach(cls, stages: Iterable[StageSpec]) -> List[StageSpec]:
+        """
+        Этапы для передачи в другой процесс: имена этапов из register
+        (в том числе переопределенных встроенных) заменяются парами
+        (имя, функция) - в процессах spawn/forkserver реестр родителя
+        не повторяется.
+        """
+        return [
+            (spec, cls._registry[spec]())
+            if isinstance(spec, str)
+            and spec in cls._registry
+            and not cls._is_builtin(spec)
+            else spec
+            for spec in stages
+        ]
+
+    @classmethod
+    def available_stages(cls) -> List[str]:
+        return list(cls._registry)
+
+    def __init__(self, stages: Iterable[StageSpec] = DEFAULT_STAGES) -> None:
+        # (имя, явно заданная функция или None - взять из реестра)
+        self._stages: List[Tuple[str, Optional[StageFunc]]] = []
+        for spec in stages:
+            if isinstance(spec, str):
+                self.add(spec)
+            else:
+                self.add(*spec)
+
+    @property
+    def names(self) -> List[str]:
+        return [name for name, _ in self._stages]
+
+    def add(
+        self,
+        name: str,
+        func: Optional[StageFunc] = None,
+        position: Optional[int] = None,
+    ) -> "PipelineBuilder":
+        """
+        Добавляет этап (или заменяет функцию уже добавленного этапа).
+
+        Args:
+            name: имя этапа
+            func: функция этапа; если не задана, этап берется из реестра
+            position: индекс вставки (по умолчанию - в конец)
+        """
+        if func is None and name not in self._registry:
+            raise ValueError(f"Неизвестный этап: {name}")
+
+        if name in self.names:
+            self._stages[self.names.index(name)] = (name, func)
+        elif position is None:
+            self._stages.append((name, func))
+        else:
+            self._stages.insert(position, (name, func))
+        return self
+
+    def remove(self, name: str) -> "PipelineBuilder":
+        if name not in self.names:
+            raise ValueError(f"Этап не выбран: {name}")
+        del self._stages[self.names.index(name)]
+        return self
+
+    def order(self, names: Sequence[str]) -> "PipelineBuilder":
+        """Оставляет только перечисленные этапы в указанном порядке"""
+        stages = dict(self._stages)
+        missing = [name for name in names if name not in stages]
+        if missing:
+            raise ValueError(f"Этапы не выбраны: {', '.join(missing)}")
+        self._stages = [(name, stages[name]) for name in names]
+        return self
+
+    def build(self, fuse: bool = True) -> Pipeline:
+        """
+        Собирает пайплайн один раз: фабрики вызываются только для выбранных
+        этапов, соседние этапы из FUSIONS (со стандартными функциями,
+        не переопределенными через register) объединяются в один проход.
+        """
+        stages: List[Tuple[str, StageFunc]] = []
+        i = 0
+        while i < len(self._stages):
+            name, func = self._stages[i]
+            if fuse and func is None and i + 1 < len(self._stages):
+                next_name, next_func = self._stages[i + 1]
+                fused = self.FUSIONS.get((name, next_name))
+                if (
+                    fused is not None
+                    and next_func is None
+                    and self._is_builtin(name)
+                    and self._is_builtin(next_name)
+                ):
+                    stages.append((f"{name}+{next_name}", fused))
+                    i += 2
+                    continue
+
+            stages.append((name, func if func is not None else self._registry[name]()))
+            i += 1
+        return Pipeline(stages)
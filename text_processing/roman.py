@@ -1,63 +1,77 @@
 import re
-from .constants import LETTERS
+from typing import FrozenSet
+
+from .constants import LETTERS, LETTER_CHARS
+
+
+def _roman_numerals() -> FrozenSet[str]:
+    """Все римские числа в канонической записи от 1 до 3999"""
+    digits = (
+        ("", "M", "MM", "MMM"),
+        ("", "C", "CC", "CCC", "CD", "D", "DC", "DCC", "DCCC", "CM"),
+        ("", "X", "XX", "XXX", "XL", "L", "LX", "LXX", "LXXX", "XC"),
+        ("", "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX"),
+    )
+    return frozenset(
+        thousands + hundreds + tens + ones
+        for thousands in digits[0]
+        for hundreds in digits[1]
+        for tens in digits[2]
+        for ones in digits[3]
+    ) - {""}
 
 
 class RomanNumeralSeparator:
+    """
+    Отделение римских чисел, слипшихся со словами:
+    "ChapterIVisHere" -> "Chapter IV isHere".
+
+    В каждой серии букв ищется первая позиция (не с начала серии), с которой
+    идут две и более заглавные римские цифры, а за ними еще буква. Если
+    серия букв кончается римскими цифрами, последняя из них считается
+    буквой после числа.
+    """
+
     ROMAN_LETTERS = r"[IVXLCDM]"
-    ROMAN_REGEXP = re.compile(
-        r"^(M{0,3})(CM|CD|D?C{0,3})"
-        r"(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})$"
-    )
+    VALID_NUMERALS: FrozenSet[str] = _roman_numerals()
 
-    # три захватывающие группы: before, roman, after
-    PATTERN = re.compile(rf"({LETTERS}+?)({ROMAN_LETTERS}{{2,}})((?:{LETTERS})+)")
-
-    INVALID_PATTERNS = (
-        "IIII",
-        "VV",
-        "XXXX",
-        "LL",
-        "CCCC",
-        "DD",
-        "MMMM",
-        "IL",
-        "IC",
-        "ID",
-        "IM",
-        "VX",
-        "VL",
-        "VC",
-        "VD",
-        "VM",
-        "XD",
-        "XM",
-        "LC",
-        "LD",
-        "LM",
+    # Кандидат: серия римских цифр, перед которой буква, длиной от двух.
+    # Шаблон начинается с класса символов, квантификатор жадный и без
+    # вложенности, поэтому поиск линеен по длине текста.
+    CANDIDATE_RE = re.compile(
+        rf"{ROMAN_LETTERS}(?<={LETTERS}{ROMAN_LETTERS}){ROMAN_LETTERS}+"
     )
-
-    @classmethod
-    def _is_valid_roman(cls, value: str) -> bool:
-        value = value.upper()
-        if not cls.ROMAN_REGEXP.match(value):
-            return False
-        for invalid in cls.INVALID_PATTERNS:
-            if invalid in value:
-                return False
-        return True
+    LETTERS_RE = re.compile(rf"{LETTERS}*")
 
     @classmethod
     def separate(cls, text: str) -> str:
-        def replacer(match: re.Match) -> str:
-            before, roman, after = match.groups()
-            after = after or ""  # может быть None
-
-            if not roman.isupper():
-                return match.group(0)
-
-            if cls._is_valid_roman(roman):
-                return f"{before} {roman} {after}"
+        """
+        Если разделять нечего, возвращается тот же объект text.
+        """
+        parts = []
+        last = 0
+        pos = 0
+        while match := cls.CANDIDATE_RE.search(text, pos):
+            start, end = match.span()
+            if end < len(text) and text[end] in LETTER_CHARS:
+                roman_end = end
+                pos = cls.LETTERS_RE.match(text, end).end()
+            elif end - start >= 3:
+                # Серия букв кончается числом: последняя цифра - буква "после"
+                roman_end = end - 1
+                pos = end
+            else:
+                pos = end
+                continue
 
-            return match.group(0)
+            # Серия букв разбирается один раз, даже если число некорректно
+            roman = text[start:roman_end]
+            if roman in cls.VALID_NUMERALS:
+                parts.append(text[last:start])
+                parts.append(f" {roman} ")
+                last = roman_end
 
-        return cls.PATTERN.sub(replacer, text)
+        if not parts:
+            return text
+        parts.append(text[last:])
+        return "".join(parts)
@@ -1,4 +1,9 @@
-from .constants import PUNCT_BEFORE_RE, PUNCT_AFTER_RE, MULTI_SPACES_RE
+from .constants import (
+    PUNCT_BEFORE_RE,
+    PUNCT_AFTER_RE,
+    MULTI_SPACES_RE,
+    SPACING_ISSUE_RE,
+)
 
 
 class SpacingNormalizer:
@@ -12,7 +17,12 @@ class SpacingNormalizer:
         1. Убирает пробелы перед знаками препинания
         2. Оставляет ровно один пробел после них
         3. Убирает лишние пробелы
+
+        Если исправлять нечего, возвращается тот же объект text.
         """
+        if not SPACING_ISSUE_RE.search(text):
+            # strip возвращает тот же объект, если пробелов по краям нет
+            return text.strip()
         text = PUNCT_BEFORE_RE.sub(r"\1", text)
         text = PUNCT_AFTER_RE.sub(r"\1 ", text)
         text = MULTI_SPACES_RE.sub(" ", text)
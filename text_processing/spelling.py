@@ -1,47 +1,222 @@
+import json
 import re
-from spellchecker import SpellChecker
-from .constants import RUSSIAN_LETTERS, ENGLISH_LETTERS
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Union
 
+from .constants import RUSSIAN_CHARS, ENGLISH_CHARS
+from .symspell import SymSpellIndex
 
-class SpellCheckerService:
+if TYPE_CHECKING:
+    from spellchecker import SpellChecker
+
+
+class CorrectionCache:
     """
-    Орфографическая коррекция (EN / RU).
+    LRU-кэш исправлений одного языка: слово (в нижнем регистре) -> исправление.
+    None тоже кэшируется: у слова нет кандидатов.
     """
 
-    WORD_RE = re.compile(r"\b\w+\b")
+    _MISSING = object()
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[str, Optional[str]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, word: str):
+        """Возвращает исправление или CorrectionCache._MISSING"""
+        value = self._data.get(word, self._MISSING)
+        if value is self._MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._data.move_to_end(word)
+        return value
+
+    def put(self, word: str, correction: Optional[str]) -> None:
+        if self.maxsize <= 0:
+            return
+        self._data[word] = correction
+        self._data.move_to_end(word)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def items(self) -> list[tuple[str, Optional[str]]]:
+        """Записи от давно использованных к недавним"""
+        return list(self._data.items())
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
 
-    def __init__(self) -> None:
-        self._checker_en = SpellChecker(language="en")
-        self._checker_ru = SpellChecker(language="ru")
+
+class ScriptClassifier:
+    """
+    Язык токена по алфавиту: "ru" - есть русская буква, "en" - есть
+    латинская, иначе "unknown". Проверка - пересечение с таблицей символов
+    (без regex), результат кэшируется для повторяющихся токенов.
+    """
+
+    def __init__(self, maxsize: int = 100_000) -> None:
+        self.maxsize = maxsize
+        self._cache: Dict[str, str] = {}
 
     @staticmethod
-    def _detect_language(word: str) -> str:
-        if re.search(RUSSIAN_LETTERS, word):
+    def detect(token: str) -> str:
+        if not RUSSIAN_CHARS.isdisjoint(token):
             return "ru"
-        if re.search(ENGLISH_LETTERS, word):
+        if not ENGLISH_CHARS.isdisjoint(token):
             return "en"
         return "unknown"
 
-    def correct(self, text: str) -> str:
-        def replacer(match: re.Match) -> str:
-            word = match.group(0)
-            lang = self._detect_language(word)
+    def classify_all(self, tokens: Sequence[str]) -> List[str]:
+        """
+        Языки всех токенов текста: каждый различный токен проверяется
+        один раз, повторы берутся из таблицы за один проход по списку.
+        """
+        cache = self._cache
+        labels: Dict[str, str] = {}
+        missing = []
+        for token in set(tokens):
+            lang = cache.get(token)
+            if lang is None:
+                lang = self.detect(token)
+                missing.append(token)
+            labels[token] = lang
+
+        if missing:
+            if len(cache) + len(missing) > self.maxsize:
+                cache.clear()
+            if len(missing) <= self.maxsize:
+                cache.update((token, labels[token]) for token in missing)
+        return list(map(labels.__getitem__, tokens))
+
+
+# Словарь языка: у обоих есть "in" и correction с одинаковым результатом
+Checker = Union["SpellChecker", SymSpellIndex]
+
 
-            checker = (
-                self._checker_ru
-                if lang == "ru"
-                else self._checker_en
-                if lang == "en"
-                else None
-            )
+class SpellCheckerService:
+    """
+    Орфографическая коррекция (EN / RU).
+
+    По умолчанию исправления ищутся по индексу SymSpellIndex (строится
+    при первом запуске и сохраняется на диск), результат тот же, что
+    у SpellChecker.correction. Словарь языка загружается при первом
+    слове на этом языке; файл индекса открывается через mmap, и процессы
+    пула делят его страницы, а не держат каждый свою копию.
+    """
+
+    LANGUAGES = ("en", "ru")
+
+    # Слова с группой: в split нечетные элементы - слова
+    WORD_SPLIT_RE = re.compile(r"\b(\w+)\b")
+
+    def __init__(
+        self,
+        cache_size: int = 10_000,
+        cache_path: Optional[Union[str, Path]] = None,
+        use_index: bool = True,
+        index_dir: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """
+        Args:
+            cache_size: размер LRU-кэша исправлений для каждого языка (0 - без кэша)
+            cache_path: файл кэша, сохраненный save_cache (загружается, если есть)
+            use_index: искать исправления по SymSpellIndex, а не перебором
+                правок SpellChecker
+            index_dir: каталог индексов (по умолчанию default_index_dir())
+        """
+        self._use_index = use_index
+        self._index_dir = index_dir
+        self._checkers: Dict[str, Checker] = {}
+        self._caches = {lang: CorrectionCache(cache_size) for lang in self.LANGUAGES}
+        self._scripts = ScriptClassifier()
+        if cache_path is not None and Path(cache_path).exists():
+            self.load_cache(cache_path)
+
+    @property
+    def signature(self) -> str:
+        """Настройки, от которых зависит результат correct (для ключей кэшей)"""
+        from spellchecker import __version__
+
+        return f"pyspellchecker={__version__},index={self._use_index}"
+
+    @property
+    def loaded_languages(self) -> List[str]:
+        return sorted(self._checkers)
+
+    def _checker(self, lang: str) -> Checker:
+        """Словарь языка, загружается при первом обращении"""
+        checker = self._checkers.get(lang)
+        if checker is None:
+            if self._use_index:
+                checker = SymSpellIndex.load_or_build(lang, self._index_dir)
+            else:
+                from spellchecker import SpellChecker
+
+                checker = SpellChecker(language=lang)
+            self._checkers[lang] = checker
+        return checker
+
+    def _correction(self, lang: str, checker: Checker, word: str) -> Optional[str]:
+        """checker.correction с кэшированием (поиск кандидатов - самая дорогая часть)"""
+        cache = self._caches[lang]
+        corrected = cache.get(word)
+        if corrected is CorrectionCache._MISSING:
+            corrected = checker.correction(word)
+            cache.put(word, corrected)
+        return corrected
+
+    def _correct_word(self, word: str, lang: str) -> str:
+        checker = self._checker(lang)
+        if word.lower() in checker:
+            return word
+
+        corrected = self._correction(lang, checker, word.lower())
+        if not corrected:
+            return word
+
+        return corrected.capitalize() if word[0].isupper() else corrected
+
+    def correct(self, text: str) -> str:
+        parts = self.WORD_SPLIT_RE.split(text)
+        words = parts[1::2]
+        # Языки всех слов текста размечаются одним пакетом до исправлений
+        langs = self._scripts.classify_all(words)
+        for i, (word, lang) in enumerate(zip(words, langs)):
+            if lang in self._caches:
+                parts[2 * i + 1] = self._correct_word(word, lang)
+        return "".join(parts)
 
-            if not checker or word.lower() in checker:
-                return word
+    # ================================================================#
+    # Кэш исправлений                                                 #
+    # ================================================================#
 
-            corrected = checker.correction(word.lower())
-            if not corrected:
-                return word
+    def cache_info(self) -> Dict[str, Dict[str, int]]:
+        """Попадания, промахи и размер кэша по языкам"""
+        return {lang: cache.info() for lang, cache in self._caches.items()}
 
-            return corrected.capitalize() if word[0].isupper() else corrected
+    def save_cache(self, path: Union[str, Path]) -> None:
+        """Сохраняет кэш исправлений в JSON (с сохранением порядка LRU)"""
+        data = {lang: cache.items() for lang, cache in self._caches.items()}
+        Path(path).write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
 
-        return self.WORD_RE.sub(replacer, text)
+    def load_cache(self, path: Union[str, Path]) -> None:
+        """Загружает кэш исправлений, сохраненный save_cache"""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        for lang, items in data.items():
+            cache = self._caches.get(lang)
+            if cache is None:
+                continue
+            for word, corrected in items:
+                cache.put(word, corrected)
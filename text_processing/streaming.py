@@ -0,0 +1,154 @@
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, List, Union
+
+from .fused import FusedNormalizer
+from .lines import LineJoiner
+from .roman import RomanNumeralSeparator
+
+
+class StreamingNormalizer:
+    """
+    Потоковая нормализация: текст читается и выдается частями,
+    память не зависит от размера входа.
+
+    Результат (конкатенация выданных фрагментов) совпадает с
+    RawTextNormalizer.normalize для всего текста целиком:
+        - склейка строк хранит только хвост текущей строки
+          (дефис, цифра, аббревиатура на конце);
+        - текст режется только на границе "пробел -> не пробел", поэтому
+          пробельные серии, серии цифр и букв (римские числа) не разрываются;
+        - пробелы в конце выданного текста придерживаются до следующего
+          фрагмента (итоговый strip).
+    """
+
+    # Конец пробельной серии в перевернутом тексте: не пробел, за ним пробел
+    _CUT_RE = re.compile(r"\S\s")
+
+    def __init__(
+        self,
+        enable_spellcheck: bool = False,
+        chunk_size: int = 64 * 1024,
+    ) -> None:
+        """
+        Args:
+            enable_spellcheck: включить орфографическую коррекцию фрагментов
+            chunk_size: примерный размер обрабатываемой порции (символов)
+        """
+        self._spellchecker = None
+        if enable_spellcheck:
+            from .spelling import SpellCheckerService
+
+            self._spellchecker = SpellCheckerService()
+        self._chunk_size = chunk_size
+
+    @staticmethod
+    def _iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Разбивает поток произвольных фрагментов на строки, как text.split("\\n").
+        """
+        pending: List[str] = []
+        for chunk in chunks:
+            if "\n" not in chunk:
+                pending.append(chunk)
+                continue
+            lines = chunk.split("\n")
+            pending.append(lines[0])
+            yield "".join(pending)
+            yield from lines[1:-1]
+            pending = [lines[-1]]
+        yield "".join(pending)
+
+    def _process(self, text: str, stop: int) -> str:
+        """
+        Пробелы, цифры и римские числа для text[:stop].
+        text[stop] (если есть) - первый символ следующей порции, нужен
+        для решения о пробелах перед ним.
+        """
+        parts = []
+        last = 0
+        for match in FusedNormalizer.SCAN_RE.finditer(text):
+            if match.start() >= stop:
+                break
+            parts.append(text[last : match.start()])
+            parts.append(FusedNormalizer._replace(match))
+            last = match.end()
+        parts.append(text[last:stop])
+
+        result = RomanNumeralSeparator.separate("".join(parts))
+        if self._spellchecker:
+            result = self._spellchecker.correct(result)
+        return result
+
+    def iter_normalize(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Args:
+            chunks: фрагменты текста (строки файла, блоки произвольной длины)
+
+        Yields:
+            str: фрагменты нормализованного текста
+        """
+        lines = LineJoiner.collapse_empty_lines(self._iter_lines(chunks))
+        joined = LineJoiner.iter_join(lines, flush_size=self._chunk_size)
+
+        pending: List[str] = []
+        pending_size = 0
+        # Порог обработки; растет, если в порции нет ни одной границы пробелов
+        limit = self._chunk_size
+        held_spaces = ""  # пробелы в конце уже обработанного текста
+        started = False  # выдан ли хотя бы один непробельный символ
+
+        def emit(result: str) -> Iterator[str]:
+            nonlocal held_spaces, started
+            if not started:
+                result = result.lstrip()
+                if not result:
+                    return
+                started = True
+            body = result.rstrip()
+            if body:
+                yield held_spaces + body
+                held_spaces = result[len(body) :]
+            else:
+                held_spaces += result
+
+        for fragment in joined:
+            pending.append(fragment)
+            pending_size += len(fragment)
+            if pending_size < limit:
+                continue
+
+            text = "".join(pending)
+            match = self._CUT_RE.search(text[::-1])
+            if match is None:
+                pending = [text]
+                limit = pending_size * 2
+                continue
+
+            stop = len(text) - 1 - match.start()
+            yield from emit(self._process(text[: stop + 1], stop))
+            pending = [text[stop:]]
+            pending_size = len(text) - stop
+            limit = self._chunk_size
+
+        text = "".join(pending)
+        yield from emit(self._process(text, len(text)))
+
+    def iter_file(
+        self, path: Union[str, Path], encoding: str = "utf-8"
+    ) -> Iterator[str]:
+        """
+        Нормализует текстовый файл построчным чтением, выдавая фрагменты.
+        """
+        with open(path, encoding=encoding) as source:
+            yield from self.iter_normalize(source)
+
+    def normalize_file(
+        self, src: Union[str, Path], dst: Union[str, Path], encoding: str = "utf-8"
+    ) -> None:
+        """
+        Нормализует файл src в файл dst, не загружая его в память целиком.
+        """
+        with open(dst, "w", encoding=encoding) as target:
+            for fragment in self.iter_file(src, encoding):
+                target.write(fragment)
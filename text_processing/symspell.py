@@ -0,0 +1,472 @@
+"""
+Индекс symmetric delete для исправления опечаток (расстояние до 2).
+
+pyspellchecker на каждое неизвестное слово перебирает все варианты
+на расстоянии 1 и 2 (вставки и замены - по каждой букве алфавита),
+для длинного русского слова это десятки тысяч строк. Здесь варианты
+удалений строятся один раз для словаря:
+
+    - для каждого слова берутся первые PREFIX_LENGTH символов и все
+      их варианты с удалением до MAX_DISTANCE символов;
+    - если два слова на расстоянии не больше 2, у их префиксов найдется
+      общий вариант удаления, поэтому кандидаты для запроса - слова,
+      у которых есть общий с запросом вариант;
+    - кандидаты проверяются расстоянием Дамерау-Левенштейна.
+
+Поиск зависит от длины префикса (не больше 29 вариантов для 7 символов),
+но не от размера алфавита. Варианты хранятся как crc32 в сортированном
+массиве u64 (crc32 << 32 | номер группы слов с этим префиксом);
+коллизии crc32 отсеиваются проверкой расстояния.
+
+Выбор исправления повторяет SpellChecker.correction: известное слово -
+оно само, иначе кандидаты на расстоянии 1, иначе на расстоянии 2;
+предпочтение словам, совпадающим без диакритики, затем самое частое.
+При равной частоте выбирается первое по алфавиту (в pyspellchecker -
+произвольное).
+
+Файл индекса только для чтения и используется через mmap без
+разбора: массивы - memoryview над файлом, слова ищутся по хеш-таблице
+в том же файле. Процессы пула, открывшие один индекс, делят его страницы
+через page cache, а не держат каждый свой dict слов.
+
+Формат файла (числа little-endian, массивы выровнены на 8 байт):
+    MAGIC
+    HEADER
+    частоты слов: u64 на слово
+    смещения слов в блобе: u64 на слово и размер блоба в конце
+    хеш-таблица слов (открытая адресация, crc32 utf-8 слова):
+        u64 номер слова + 1 на слот, 0 - пустой слот
+    группы слов с общим префиксом: u64 номер первого слова на группу
+        и число слов в конце
+    варианты: u64 на вариант, по возрастанию
+    блоб слов: utf-8 слов по возрастанию, без разделителей
+"""
+
+import mmap
+import os
+import string
+import struct
+import sys
+import unicodedata
+import zlib
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+MAGIC = b"SKSYM\x00\x02\x00"
+FORMAT_VERSION = 2
+
+# число слов, групп, вариантов, слотов хеш-таблицы,
+# длина самого длинного слова, размер блоба слов
+HEADER = struct.Struct("<6Q")
+
+# array("Q") или memoryview формата "Q" над mmap
+U64Array = Union[array, memoryview]
+
+
+def default_index_dir() -> Path:
+    """Каталог сохраненных индексов: $SWISS_KNIFE_CACHE или ~/.cache/swiss_knife"""
+    path = os.environ.get("SWISS_KNIFE_CACHE")
+    return Path(path) if path else Path.home() / ".cache" / "swiss_knife"
+
+
+class SymSpellIndex:
+    """
+    Словарь одного языка с индексом вариантов удаления.
+
+    Пример:
+        index = SymSpellIndex.load_or_build("ru")
+        index.correction("превет")  # "привет"
+    """
+
+    PREFIX_LENGTH = 7
+    MAX_DISTANCE = 2
+    # Результаты поиска слов в хеш-таблице для частых токенов текста
+    # (очищается при заполнении, как кэш ScriptClassifier)
+    FIND_CACHE_SIZE = 50_000
+
+    def __init__(
+        self,
+        frequencies: U64Array,
+        offsets: U64Array,
+        table: U64Array,
+        groups: U64Array,
+        entries: U64Array,
+        blob: Union[bytes, memoryview],
+        longest: int,
+        mapped: Optional[mmap.mmap] = None,
+    ) -> None:
+        """
+        Массивы - поля формата файла (см. описание модуля).
+
+        Args:
+            longest: длина самого длинного слова словаря
+            mapped: mmap файла, если массивы - memoryview над ним
+        """
+        self._frequencies = frequencies
+        self._offsets = offsets
+        self._table = table
+        self._groups = groups
+        self._entries = entries
+        self._blob = blob
+        self._mmap = mapped
+        self._found: Dict[str, int] = {}
+        self.longest = longest
+
+    def __len__(self) -> int:
+        return len(self._frequencies)
+
+    def __contains__(self, word: str) -> bool:
+        return self._find(word.lower()) >= 0
+
+    def __getitem__(self, word: str) -> int:
+        """Частота слова (0 - нет в словаре)"""
+        word_id = self._find(word.lower())
+        return 0 if word_id < 0 else self._frequencies[word_id]
+
+    @property
+    def mapped(self) -> bool:
+        return self._mmap is not None
+
+    def close(self) -> None:
+        """Освобождает mmap (для индекса в памяти ничего не делает)"""
+        if self._mmap is None:
+            return
+        for view in (
+            self._frequencies,
+            self._offsets,
+            self._table,
+            self._groups,
+            self._entries,
+            self._blob,
+        ):
+            view.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def _word(self, word_id: int) -> str:
+        start = self._offsets[word_id]
+        return str(self._blob[start : self._offsets[word_id + 1]], "utf-8")
+
+    def _find(self, word: str) -> int:
+        """Номер слова, -1 - нет в словаре"""
+        word_id = self._found.get(word)
+        if word_id is None:
+            word_id = self._find_in_table(word)
+            if len(self._found) >= self.FIND_CACHE_SIZE:
+                self._found.clear()
+            self._found[word] = word_id
+        return word_id
+
+    def _find_in_table(self, word: str) -> int:
+        data = word.encode("utf-8")
+        table = self._table
+        mask = len(table) - 1
+        slot = zlib.crc32(data) & mask
+        while stored := table[slot]:
+            start = self._offsets[stored - 1]
+            if self._blob[start : self._offsets[stored]] == data:
+                return stored - 1
+            slot = (slot + 1) & mask
+        return -1
+
+    # ------------------------------------------------------------ построение
+
+    @classmethod
+    def _deletes(cls, word: str) -> Set[str]:
+        """Варианты префикса слова с удалением до MAX_DISTANCE символов"""
+        variants = {word[: cls.PREFIX_LENGTH]}
+        level = variants
+        for _ in range(cls.MAX_DISTANCE):
+            level = {v[:i] + v[i + 1 :] for v in level for i in range(len(v))}
+            variants |= level
+        return variants
+
+    @staticmethod
+    def _key(variant: str) -> int:
+        return zlib.crc32(variant.encode("utf-8"))
+
+    @classmethod
+    def build(cls, frequencies: Dict[str, int]) -> "SymSpellIndex":
+        """Индекс по словарю слово -> частота (слова в нижнем регистре)"""
+        words = sorted(frequencies)
+        encoded = [word.encode("utf-8") for word in words]
+
+        offsets = array("Q", [0])
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+
+        # Заполнение хеш-таблицы не больше половины: короткие цепочки проб
+        size = 1
+        while size < 2 * len(words):
+            size *= 2
+        table = array("Q", bytes(8 * size))
+        for word_id, data in enumerate(encoded):
+            slot = zlib.crc32(data) & (size - 1)
+            while table[slot]:
+                slot = (slot + 1) & (size - 1)
+            table[slot] = word_id + 1
+
+        # После сортировки слова с общим префиксом идут подряд: варианты
+        # строятся один раз на группу
+        groups = array("Q")
+        entries = []
+        previous = None
+        for word_id, word in enumerate(words):
+            prefix = word[: cls.PREFIX_LENGTH]
+            if prefix == previous:
+                continue
+            previous = prefix
+            group = len(groups)
+            groups.append(word_id)
+            entries.extend(
+                cls._key(variant) << 32 | group for variant in cls._deletes(prefix)
+            )
+        groups.append(len(words))
+        entries.sort()
+
+        return cls(
+            array("Q", (frequencies[word] for word in words)),
+            offsets,
+            table,
+            groups,
+            array("Q", entries),
+            b"".join(encoded),
+            max(map(len, words), default=0),
+        )
+
+    @classmethod
+    def from_checker(cls, checker) -> "SymSpellIndex":
+        """Индекс по словарю spellchecker.SpellChecker"""
+        return cls.build(dict(checker.word_frequency.dictionary))
+
+    # ------------------------------------------------------------ хранение
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Записывает индекс атомарно (через временный файл)"""
+        path = Path(path)
+        arrays = (
+            self._frequencies,
+            self._offsets,
+            self._table,
+            self._groups,
+            self._entries,
+        )
+        header = HEADER.pack(
+            len(self._frequencies),
+            len(self._groups),
+            len(self._entries),
+            len(self._table),
+            self.longest,
+            len(self._blob),
+        )
+        # свой временный файл у каждого процесса: индекс могут строить
+        # одновременно несколько воркеров
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.part")
+        with open(tmp, "wb") as target:
+            target.write(MAGIC)
+            target.write(header)
+            for values in arrays:
+                values = array("Q", values)
+                if sys.byteorder == "big":
+                    values.byteswap()
+                values.tofile(target)
+            target.write(self._blob)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], mapped: bool = True) -> "SymSpellIndex":
+        """
+        Args:
+            mapped: отобразить файл через mmap (общие страницы для всех
+                процессов); False - прочитать в память процесса
+        """
+        with open(path, "rb") as source:
+            if mapped and sys.byteorder == "little":
+                data = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = source.read()
+                mapped = False
+
+        view = memoryview(data)
+        try:
+            if view[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"Не индекс SymSpellIndex: {path}")
+            if len(view) < len(MAGIC) + HEADER.size:
+                raise ValueError(f"Поврежденный индекс: {path}")
+            words, groups, entries, slots, longest, blob_size = HEADER.unpack_from(
+                view, len(MAGIC)
+            )
+            position = len(MAGIC) + HEADER.size
+            size = position + 8 * (2 * words + 1 + slots + groups + entries) + blob_size
+            if len(view) != size:
+                raise ValueError(f"Поврежденный индекс: {path}")
+        except ValueError:
+            view.release()
+            if mapped:
+                data.close()
+            raise
+
+        def take(count: int) -> U64Array:
+            nonlocal position
+            part = view[position : position + 8 * count]
+            position += 8 * count
+            if mapped:
+                return part.cast("Q")
+            values = array("Q", part.tobytes())
+            if sys.byteorder == "big":
+                values.byteswap()
+            return values
+
+        arrays = [take(count) for count in (words, words + 1, slots, groups, entries)]
+        blob = view[position:] if mapped else bytes(view[position:])
+        if not mapped:
+            view.release()
+        return cls(*arrays, blob, longest, data if mapped else None)
+
+    @staticmethod
+    def index_path(language: str, directory: Union[str, Path, None] = None) -> Path:
+        """Файл индекса языка; версия pyspellchecker в имени - ее словари"""
+        from spellchecker import __version__
+
+        directory = default_index_dir() if directory is None else Path(directory)
+        return directory / f"symspell-{language}-{__version__}-v{FORMAT_VERSION}.bin"
+
+    @classmethod
+    def load_or_build(
+        cls, language: str, directory: Union[str, Path, None] = None
+    ) -> "SymSpellIndex":
+        """
+        Загружает (через mmap) сохраненный индекс языка или строит его
+        по словарю pyspellchecker и сохраняет (если каталог недоступен -
+        индекс остается только в памяти процесса). Поврежденный файл
+        (например, оборванная запись) строится и сохраняется заново.
+        """
+        path = cls.index_path(language, directory)
+        if path.exists():
+            try:
+                return cls.load(path)
+            except ValueError:
+                pass
+
+        from spellchecker import SpellChecker
+
+        index = cls.from_checker(SpellChecker(language=language))
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            index.save(path)
+        except OSError:
+            return index
+        # сохраненный файл - через mmap, как и в остальных процессах
+        return cls.load(path)
+
+    # ------------------------------------------------------------ поиск
+
+    @staticmethod
+    def _should_check(word: str, longest: int) -> bool:
+        """То же, что SpellChecker._check_if_should_check"""
+        if len(word) == 1 and word in string.punctuation:
+            return False
+        if len(word) > longest + 3:
+            return False
+        if word.lower() in ("nan", "inf", "infinity"):
+            return True
+        try:
+            float(word)
+            return False
+        except ValueError:
+            return True
+
+    @classmethod
+    def distance(cls, a: str, b: str, limit: int = MAX_DISTANCE) -> int:
+        """
+        Расстояние Дамерау-Левенштейна без ограничений на перестановки
+        (минимальное число вставок, удалений, замен и перестановок
+        соседних символов, как у последовательных правок pyspellchecker).
+        Больше limit - возвращается limit + 1.
+
+        Перебор правок с начала строк после общего префикса. При limit <= 2
+        перестановка с символом между переставленными ("ca" -> "abc")
+        стоит 2 и проверяется отдельно.
+        """
+        start = 0
+        common = min(len(a), len(b))
+        while start < common and a[start] == b[start]:
+            start += 1
+        a = a[start:]
+        b = b[start:]
+        if not a or not b:
+            return min(len(a) + len(b), limit + 1)
+        if limit == 0 or abs(len(a) - len(b)) > limit:
+            return limit + 1
+
+        rest = limit - 1
+        best = (
+            1
+            + min(
+                cls.distance(a[1:], b, rest),  # удаление
+                cls.distance(a, b[1:], rest),  # вставка
+                cls.distance(a[1:], b[1:], rest),  # замена
+            )
+        )
+        if len(a) > 1 and len(b) > 1 and a[0] == b[1] and a[1] == b[0]:
+            best = min(best, 1 + cls.distance(a[2:], b[2:], rest))
+        if limit >= 2:
+            if len(a) > 1 and len(b) > 2 and a[0] == b[2] and a[1] == b[0]:
+                best = min(best, 2 + cls.distance(a[2:], b[3:], limit - 2))
+            if len(a) > 2 and len(b) > 1 and a[0] == b[1] and a[2] == b[0]:
+                best = min(best, 2 + cls.distance(a[3:], b[2:], limit - 2))
+        return min(best, limit + 1)
+
+    def _lookup(self, word: str) -> Iterator[str]:
+        """Слова с общим с word вариантом удаления префикса"""
+        entries = self._entries
+        groups: Set[int] = set()
+        for variant in self._deletes(word):
+            key = self._key(variant)
+            position = bisect_left(entries, key << 32)
+            while position < len(entries) and entries[position] >> 32 == key:
+                groups.add(entries[position] & 0xFFFFFFFF)
+                position += 1
+        for group in groups:
+            for word_id in range(self._groups[group], self._groups[group + 1]):
+                yield self._word(word_id)
+
+    def candidates(self, word: str) -> Optional[Set[str]]:
+        """То же, что SpellChecker.candidates: ближайшие слова словаря"""
+        word = word.lower()
+        if self._find(word) >= 0 or not self._should_check(word, self.longest):
+            return {word}
+
+        by_distance: Tuple[List[str], List[str]] = ([], [])
+        for candidate in self._lookup(word):
+            if abs(len(candidate) - len(word)) > self.MAX_DISTANCE:
+                continue
+            distance = self.distance(word, candidate, self.MAX_DISTANCE)
+            if 0 < distance <= self.MAX_DISTANCE and self._should_check(
+                candidate, self.longest
+            ):
+                by_distance[distance - 1].append(candidate)
+        for found in by_distance:
+            if found:
+                return set(found)
+        return None
+
+    @staticmethod
+    def _remove_diacritics(word: str) -> str:
+        return "".join(
+            c
+            for c in unicodedata.normalize("NFKD", word)
+            if not unicodedata.combining(c)
+        )
+
+    def correction(self, word: str) -> Optional[str]:
+        """То же, что SpellChecker.correction: самое вероятное исправление"""
+        found = self.candidates(word)
+        if not found:
+            return None
+        # как в pyspellchecker: слово без диакритики сравнивается как есть
+        plain = self._remove_diacritics(word)
+        preferred = [c for c in found if self._remove_diacritics(c) == plain]
+        return min(preferred or found, key=lambda c: (-self[c], c))
@@ -0,0 +1,33 @@
+import re
+from typing import List
+
+from .fused import FusedNormalizer
+from .roman import RomanNumeralSeparator
+
+
+class Tokenizer:
+    """
+    Нормализованные токены для поиска.
+
+    Текст проходит те же правила, что и в нормализации (пробелы,
+    отделение цифр от букв, римские числа), затем делится на слова
+    в нижнем регистре; "ё" приравнивается к "е".
+    """
+
+    TOKEN_RE = re.compile(r"\w+")
+
+    @classmethod
+    def normalize(cls, text: str) -> str:
+        text = FusedNormalizer.spacing_and_numbers(text)
+        return RomanNumeralSeparator.separate(text)
+
+    @staticmethod
+    def normalize_token(token: str) -> str:
+        return token.lower().replace("ё", "е")
+
+    @classmethod
+    def tokens(cls, text: str) -> List[str]:
+        return [
+            cls.normalize_token(token)
+            for token in cls.TOKEN_RE.findall(cls.normalize(text))
+        ]